@@ -0,0 +1,61 @@
+"""Anchored-wall design of a retaining-wall alignment in geotech.anchors.
+
+Compares a loop over wall sections and anchor rows (the steps of
+tutw08_e1.py with the tributary areas of N rows) with
+design_anchored_walls, for an alignment with a section every metre and
+two to four anchor rows depending on the excavation depth.
+
+Usage: python3 bench/bench_anchors.py [length_m]
+"""
+
+import sys
+
+import numpy as np
+
+import common
+from geotech.anchors import design_anchored_walls
+
+length = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+station = np.arange(length + 1, dtype=float)
+H = 9.0 + 3.0 * np.sin(2.0 * np.pi * station / 1500.0)
+
+# rows at 3 m from the top, then every 3 m while at least 2 m above the bottom
+rows = 3.0 * np.arange(1, 5)
+depths = np.where(rows[None, :] <= H[:, None] - 2.0, rows[None, :], np.nan)
+Sh, gamma, phi, theta = 2.0, 18.0, np.radians(34.0), np.radians(15.0)
+tau_a, d_DH, smts, FS = 400.0, 0.064, 568.0, 2.0
+
+
+def loop():
+    Lb, Lub = [], []
+    psi = np.pi / 4.0 + phi / 2.0
+    for h, ds in zip(H, depths):
+        ds = ds[~np.isnan(ds)]
+        chi = max(1.5, h / 5.0)
+        Ka = (1.0 - np.sin(phi)) / (1.0 + np.sin(phi))
+        Pa = 0.65 * Ka * gamma * h ** 2
+        spans = np.diff(np.concatenate([[0.0], ds, [h]]))
+        p = Pa / (h - spans[0] / 3.0 - spans[-1] / 3.0)
+        for i, d in enumerate(ds):
+            above = 2.0 * spans[i] / 3.0 if i == 0 else spans[i] / 2.0
+            below = 23.0 * spans[i + 1] / 48.0 if i == len(ds) - 1 else spans[i + 1] / 2.0
+            U = (above + below) * p * Sh / np.cos(theta)
+            x_trial = (h - d + chi / np.cos(psi)) / (np.tan(theta) + np.tan(psi))
+            x_min = (4.5 - d) / np.tan(theta) if d < 4.5 else x_trial
+            Lub.append(max(max(x_trial, x_min) / np.cos(theta), 3.0))
+            Lb.append(FS * U / (np.pi * d_DH * tau_a))
+    return np.array(Lub), np.array(Lb)
+
+
+def vectorized():
+    return design_anchored_walls(H, depths, Sh, gamma, phi, theta, tau_a, d_DH, smts, FS)
+
+
+t_ref, (Lub_ref, Lb_ref) = common.best_time(loop, repeat=1)
+t_new, res = common.best_time(vectorized)
+common.report("design_anchored_walls", len(res), t_ref, t_new)
+print(f"  max relative difference (Lub) = {np.abs(res['Lub'] / Lub_ref - 1.0).max():.1e}")
+print(f"  max relative difference (Lb)  = {np.abs(res['Lb'] / Lb_ref - 1.0).max():.1e}")
+print(f"  sections = {len(H)}, anchors = {len(res)}, failing bar checks = {np.count_nonzero(~res['bar_ok'])}")
+# one section per metre and one anchor per row every Sh metres
+print(f"  total anchor length = {res['L'].sum() / Sh / 1000.0:.1f} km")
@@ -0,0 +1,63 @@
+"""Stone-column settlement versus time in geotech.columns.
+
+Compares a loop over chainages and sublayers (steps 2 to 10 of
+tutw07_e2.py for each sublayer, over all times) with
+simulate_column_settlement, and times a long embankment with its peak
+work-array size bounded by the time chunks.
+
+Usage: python3 bench/bench_column_settlement.py [nchainages] [nlayers] [ntimes]
+"""
+
+import sys
+
+import numpy as np
+
+import common
+from geotech.columns import simulate_column_settlement
+from geotech.consolidation import consolid_calc_Uv_given_Tv
+from geotech.radial import calc_Ur_given_Tr
+
+nc = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+nl = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+nt = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+rng = np.random.default_rng(7215)
+
+# a profile every 5 m of chainage: soft clay with variable modulus under a
+# variable embankment height
+h = np.full(nl, 0.5)
+Es = rng.uniform(800.0, 3000.0, (nc, nl))
+Dsigz = 18.0 * rng.uniform(1.0, 3.0, (nc, 1))
+t = np.linspace(0.0, 3.0 * 365.0 * 86400.0, nt)
+kv, kr, dc, s, Ec = 1.16e-9, 3.47e-9, 0.8, 2.4, 30000.0
+
+
+def loop(m):
+    St = np.zeros((m, nt))
+    hdr = h.sum()
+    for i in range(m):
+        for j in range(nl):
+            mvs = 1.3 * 0.4 / (Es[i, j] * 0.7)
+            a_s = np.pi / 4.0 * (dc / s) ** 2
+            n = min(1.0 + 0.217 * (min(Ec / Es[i, j], 20.0) - 1.0), 5.0)
+            mu = 1.0 / (1.0 + a_s * (n - 1.0))
+            de = 2.0 * s / np.sqrt(np.pi)
+            Nd = de / dc
+            multiplier = 1.0 + n / (Nd ** 2 - 1.0)
+            cvm = kv / (9.81 * mvs) * multiplier
+            crm = kr / (9.81 * mvs) * multiplier
+            Uv = consolid_calc_Uv_given_Tv(cvm * t / hdr ** 2)
+            Ur = calc_Ur_given_Tr(crm * t / de ** 2, Nd)
+            St[i] += (1.0 - (1.0 - Uv) * (1.0 - Ur)) * mu * mvs * Dsigz[i, 0] * h[j]
+    return St
+
+
+m = min(nc, 200)
+t_ref, St_ref = common.best_time(loop, m, repeat=1)
+t_new, res = common.best_time(lambda: simulate_column_settlement(t, h, Dsigz[:m], Es[:m], kv, kr, dc, s, Ec))
+common.report("simulate_column_settlement", m * nl * nt, t_ref, t_new)
+print(f"  max difference = {np.abs(res.St - St_ref).max() * 1000:.1e} mm")
+
+for max_points in (2 ** 20, 2 ** 24):
+    t_new, res = common.best_time(lambda: simulate_column_settlement(t, h, Dsigz, Es, kv, kr, dc, s, Ec, max_points=max_points), repeat=1)
+    print(f"{nc} chainages x {nl} sublayers x {nt} times (chunks of {max_points} points): {t_new:.2f} s")
+print(f"  final settlement: {res.St[:, -1].min() * 1000:.0f} to {res.St[:, -1].max() * 1000:.0f} mm")
@@ -0,0 +1,59 @@
+"""Array kernels in geotech.consolidation versus the np.vectorize path.
+
+Usage: python3 bench/bench_consolidation.py [npoints]
+"""
+
+import sys
+
+import numpy as np
+
+import common
+from geotech.consolidation import (
+    consolid_calc_Tv_given_Uv,
+    consolid_calc_Uv_given_Tv,
+    consolid_calc_Uv_given_Tv_series,
+)
+
+
+# scalar reference implementations (as originally written in tutw03_e2.py)
+def ref_Tv_given_Uv(Uv):
+    if Uv <= 0.526:
+        return (np.pi / 4.0) * Uv ** 2
+    else:
+        return -0.085 - 0.933 * np.log10(1.0 - Uv)
+
+
+def ref_Uv_given_Tv(Tv):
+    if Tv <= 0.217:
+        return 2.0 * np.sqrt(Tv / np.pi)
+    else:
+        a = (1.781 - Tv) / 0.933
+        return 1.0 - (10.0 ** a) / 100.0
+
+
+def ref_Uv_given_Tv_series(Tv, nseries=100):
+    sumx = 0.0
+    for m in range(nseries):
+        M = (2.0 * m + 1.0) * np.pi / 2.0
+        MM = M ** 2.0
+        sumx += 2.0 * np.exp(-MM * Tv) / MM
+    return 1.0 - sumx
+
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+rng = np.random.default_rng(7215)
+Uv = rng.uniform(0.0, 0.99, n)
+Tv = rng.uniform(0.0, 2.0, n)
+
+cases = [
+    ("Tv_given_Uv", ref_Tv_given_Uv, consolid_calc_Tv_given_Uv, Uv),
+    ("Uv_given_Tv", ref_Uv_given_Tv, consolid_calc_Uv_given_Tv, Tv),
+    ("Uv_given_Tv_series", ref_Uv_given_Tv_series, consolid_calc_Uv_given_Tv_series, Tv),
+]
+
+for name, ref, new, x in cases:
+    t_ref, y_ref = common.best_time(np.vectorize(ref), x, repeat=1)
+    t_new, y_new = common.best_time(new, x)
+    assert np.array_equal(y_ref, y_new), f"{name}: results differ"
+    common.report(name, n, t_ref, t_new)
+print("results are bit-identical")
@@ -0,0 +1,71 @@
+"""Dynamic compaction planning in geotech.dynamic.
+
+Compares a loop over the drop points (steps 2, 5, 6 and 7 of tutw04_e1.py
+repeated for each point) with plan_dynamic_compaction over an L-shaped
+landfill with a variable depth of improvement, and times the CSV export
+and the search of a catalog of tampers and cranes.
+
+Usage: python3 bench/bench_dynamic.py [site size factor]
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+import common
+from geotech.dynamic import plan_dynamic_compaction, search_rigs, write_schedule
+
+f = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+polygon = f * np.array([(0, 0), (1200, 0), (1200, 500), (600, 500), (600, 900), (0, 900)], dtype=float)
+W, dt, ht, nc, UAE, UAE_IP, d_ip, Np = 18.2, 1.5, 1.5, 0.35, 850.0, 300.0, 1.5, 2
+
+
+def Di(x, y):
+    return 6.0 + 3.0 * np.sin(x / 200.0) ** 2 + 0.002 * y
+
+
+def plan():
+    return plan_dynamic_compaction(polygon, Di, W, dt, ht, nc, UAE, UAE_IP, d_ip, Np)
+
+
+def loop(schedule):
+    crater = np.empty(len(schedule))
+    s = 2.0 * dt
+    for i, (x, y) in enumerate(zip(schedule["x"].tolist(), schedule["y"].tolist())):
+        d = Di(x, y)
+        Hd = np.ceil((d / nc) ** 2.0 / W)
+        AE_HEP = (UAE * d - UAE_IP * d_ip) / Np
+        Nd = int(np.ceil(AE_HEP * s ** 2 / (W * 9.81 * Hd)))
+        crater[i] = 0.028 * (Nd ** 0.55) * np.sqrt(W * Hd)
+    return crater
+
+
+t_new, res = common.best_time(plan)
+t_ref, crater = common.best_time(loop, res.schedule, repeat=1)
+n = len(res.schedule)
+common.report("plan_dynamic_compaction", n, t_ref, t_new)
+print(f"  max difference in crater depth = {np.abs(crater - res.schedule['crater_depth']).max():.1e} m")
+print(f"  area = {res.area:.0f} m², total energy = {res.total_energy / 1e6:.1f} GJ, crater volume = {res.crater_volume:.0f} m³")
+print(f"  points with crater deeper than allowed: {np.count_nonzero(~res.schedule['ok'])}")
+
+with tempfile.TemporaryDirectory() as tmp:
+    path = os.path.join(tmp, "schedule.csv")
+    t, _ = common.best_time(write_schedule, res.schedule, path, repeat=1)
+    print(f"CSV export of {n} points: {t:.2f} s ({os.path.getsize(path) / 2 ** 20:.1f} MB)")
+
+# catalog of tampers and cranes
+n_rigs = 5000
+rng = np.random.default_rng(7215)
+catalog = dict(
+    weight=rng.uniform(8.0, 40.0, n_rigs),
+    diameter=rng.uniform(1.0, 2.5, n_rigs),
+    height=rng.uniform(0.8, 2.0, n_rigs),
+    max_drop=rng.uniform(15.0, 40.0, n_rigs),
+)
+factors, passes = np.linspace(1.5, 2.5, 11), (1, 2, 3, 4)
+t, options = common.best_time(lambda: search_rigs(catalog, 9.0, res.area, nc, UAE, UAE_IP, d_ip, factors, passes))
+print(f"catalog of {n_rigs} rigs ({n_rigs * len(factors) * len(passes)} options): {t:.3f} s, {len(options)} feasible")
+best = options[0]
+print(f"  best: entry {best['entry']}, W = {best['weight']:.1f} tf, s = {best['s']:.2f} m, {best['npasses']} passes, {best['drops']} drops")
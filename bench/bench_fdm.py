@@ -0,0 +1,53 @@
+"""Finite-difference consolidation solver in geotech.fdm.
+
+Times one column with nnodes nodes over nsteps time steps (the target size
+is 10⁴ nodes × 10⁵ steps), compares solving ncolumns columns one by one
+against one batched system, and checks the solution against the Fourier
+series of Terzaghi's theory.
+
+Usage: python3 bench/bench_fdm.py [nnodes] [nsteps] [ncolumns]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import common
+from geotech.consolidation import consolid_calc_Uv_given_Tv_series
+from geotech.fdm import solve_consolidation
+
+nn = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+ns = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+nc = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+
+# single layer drained at the top, as in tutw03: H = 5 m, cv = 1e-7 m²/s
+H, cv = 5.0, 1e-7
+x = np.linspace(0.0, H, nn)
+t = np.linspace(0.0, 2.0 * H * H / cv, ns + 1)
+t0 = time.perf_counter()
+res = solve_consolidation(x, t, cv, theta=0.5)
+elapsed = time.perf_counter() - t0
+print(f"{nn} nodes × {ns} steps: {elapsed:.2f} s ({nn * ns / elapsed:.2e} node-steps/s)")
+Tv = cv * t / H ** 2
+late = Tv >= 0.05
+err = np.abs(res.U[late] - consolid_calc_Uv_given_Tv_series(Tv[late], 1000)).max()
+print(f"  max |U - U_series| for Tv ≥ 0.05 = {err:.1e}")
+
+# many columns: different cv and ramp loads
+rng = np.random.default_rng(7215)
+x = np.linspace(0.0, H, 201)
+t = np.linspace(0.0, 2.0 * H * H / cv, 2001)
+cvs = rng.uniform(0.5e-7, 2e-7, nc)
+ramps = rng.uniform(0.0, 0.2, nc) * t[-1]
+load = np.minimum(t[:, None] / np.maximum(ramps, t[1]), 1.0)
+
+
+def one_by_one():
+    return np.column_stack([solve_consolidation(x, t, c, load=load[:, j]).U for j, c in enumerate(cvs)])
+
+
+t_ref, U_ref = common.best_time(one_by_one, repeat=1)
+t_new, res = common.best_time(lambda: solve_consolidation(x, t, cvs[:, None], load=load), repeat=1)
+common.report("batched columns", nc * 201 * 2000, t_ref, t_new)
+print(f"  max difference = {np.abs(res.U - U_ref).max():.1e}")
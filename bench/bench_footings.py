@@ -0,0 +1,61 @@
+"""Granular column design of many footings in geotech.columns.
+
+Compares a loop over footings and diameters (steps 2 to 8 of
+tutw07_e1.py, trying the standard spacings from the largest down) with
+the vectorized iter_footing_designs, and times the streaming of the
+results to a CSV file.
+
+Usage: python3 bench/bench_footings.py [nfootings] [nfootings_loop]
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+import common
+from geotech.columns import STANDARD_SPACINGS, calc_area_repl_ratio, design_footings, iter_footing_designs
+from geotech.tables import write_table
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+n_loop = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+rng = np.random.default_rng(7215)
+width = rng.uniform(1.5, 4.0, n)
+depth = rng.uniform(0.8, 2.0, n)
+load = rng.uniform(100.0, 2000.0, n)
+dc = [0.6, 0.8, 1.0]
+soil = dict(cu=20.0, gamma_dry=18.0, gamma_wet=19.0, z_water=1.0)
+
+
+def loop(m):
+    s = np.full((m, len(dc)), np.nan)
+    for i in range(m):
+        B, Df = width[i], depth[i]
+        pressure = load[i] / B ** 2
+        sig = 18.0 * min(Df, 1.0) + (19.0 - 9.81) * max(Df - 1.0, 0.0)
+        qult_soil = 20.0 * 5.14 * 1.2 * (1.0 + 0.2 * Df / B) + sig
+        if qult_soil / pressure >= 2.5:
+            s[i] = np.inf
+            continue
+        for j, d in enumerate(dc):
+            for spacing in STANDARD_SPACINGS[::-1]:
+                if spacing < d:
+                    break
+                a_s = calc_area_repl_ratio(d, spacing, True)
+                if (400.0 * a_s + qult_soil * (1.0 - a_s)) / pressure >= 2.5:
+                    s[i, j] = spacing
+                    break
+    return s
+
+
+t_ref, s_ref = common.best_time(loop, n_loop, repeat=1)
+t_new, res = common.best_time(lambda: design_footings(width[:n_loop], depth[:n_loop], load[:n_loop], dc, **soil))
+common.report("design_footings", n_loop * len(dc), t_ref, t_new)
+same = np.array_equal(res["s"].reshape(n_loop, len(dc)), s_ref, equal_nan=True)
+print(f"  same spacings as the loop: {same}")
+
+with tempfile.TemporaryDirectory() as tmp:
+    path = os.path.join(tmp, "footings.csv")
+    t, rows = common.best_time(lambda: write_table(path, iter_footing_designs(width, depth, load, dc, **soil)), repeat=1)
+    print(f"{n} footings x {len(dc)} diameters streamed to CSV: {t:.2f} s ({rows} rows, {os.path.getsize(path) / 2 ** 20:.1f} MB)")
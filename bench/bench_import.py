@@ -0,0 +1,38 @@
+"""Import time of the geotech modules in a fresh interpreter.
+
+Each statement runs in a new process (best of repeat runs) so that the
+cost of starting a worker is measured; the package time is reported on
+top of numpy (which every module needs) and compared with the eager
+matplotlib/scipy imports of the tutorial scripts. Also checks that
+importing the package does not load matplotlib or scipy.
+
+Usage: python3 bench/bench_import.py [repeat]
+"""
+
+import os
+import subprocess
+import sys
+
+repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+modules = "geotech.columns, geotech.consolidation, geotech.radial, geotech.pvd, geotech.staged, geotech.fdm"
+
+
+def import_time(statement):
+    code = f"import time; t0 = time.perf_counter(); {statement}; print(time.perf_counter() - t0)"
+    runs = [subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True) for _ in range(repeat)]
+    return min(float(r.stdout) for r in runs)
+
+
+t_numpy = import_time("import numpy")
+t_package = import_time(f"import numpy; import {modules}")
+t_scripts = import_time("import numpy; import matplotlib.pyplot, scipy.optimize")
+print(f"numpy                          {t_numpy * 1000:7.1f} ms")
+print(f"numpy + geotech modules        {t_package * 1000:7.1f} ms  (package: {(t_package - t_numpy) * 1000:.1f} ms)")
+print(f"numpy + matplotlib + scipy     {t_scripts * 1000:7.1f} ms")
+
+code = f"import sys; import {modules}; print(sorted({{m.split('.')[0] for m in sys.modules}} & {{'matplotlib', 'scipy'}}))"
+loaded = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True).stdout.strip()
+print(f"heavy modules loaded by the package: {loaded}")
+assert loaded == "[]"
+assert t_package - t_numpy < 0.05
@@ -0,0 +1,62 @@
+"""Liquefaction screening of SPT tables in geotech.liquefaction.
+
+Compares a row-by-row loop (the calculation of tutw05_e2.py repeated for
+each reading, accumulating the stresses of each borehole) with the
+vectorized screen_spt_table, and times a full table.
+
+Usage: python3 bench/bench_liquefaction.py [nrows] [nrows_loop]
+"""
+
+import sys
+
+import numpy as np
+
+import common
+from geotech.liquefaction import calc_CRR_M75, calc_N1_60cs, calc_rd, screen_spt_table
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+n_loop = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+rng = np.random.default_rng(7215)
+
+
+def make_table(n):
+    # boreholes with one SPT reading every 1.5 m down to 30 m
+    return dict(
+        borehole=np.arange(n) // 20,
+        depth=1.5 * (np.arange(n) % 20 + 1),
+        N60=rng.uniform(2.0, 40.0, n),
+        fines=rng.uniform(0.0, 40.0, n),
+        gamma_dry=rng.uniform(17.0, 19.0, n),
+        gamma_sat=rng.uniform(19.0, 21.0, n),
+        z_water=np.repeat(rng.uniform(0.5, 3.0, n // 20 + 1), 20)[:n],
+    )
+
+
+def loop(table, Mw=7.0, amax_g=0.3, d50=1.2):
+    FS = np.empty(len(table["depth"]))
+    for i in range(len(FS)):
+        if i == 0 or table["borehole"][i] != table["borehole"][i - 1]:
+            top = sigma_z0 = 0.0
+        z, zw = table["depth"][i], table["z_water"][i]
+        h_dry = max(min(z, zw) - top, 0.0)
+        sigma_z0 += table["gamma_dry"][i] * h_dry + table["gamma_sat"][i] * (z - top - h_dry)
+        sigma_z0_eff = sigma_z0 - 9.81 * max(z - zw, 0.0)
+        top = z
+        N1_60 = table["N60"][i] * min(np.sqrt(100.0 / sigma_z0_eff), 1.7)
+        MSF = 1.82 if Mw < 5.2 else 6.9 * np.exp(-Mw / 4.0) - 0.06
+        CRR = MSF * calc_CRR_M75(calc_N1_60cs(N1_60, table["fines"][i]))
+        CSR = 0.65 * calc_rd(z) * (sigma_z0 / sigma_z0_eff) * amax_g
+        FS[i] = CRR / CSR if z > zw else np.inf
+    return FS
+
+
+small = make_table(n_loop)
+t_ref, FS_ref = common.best_time(loop, small, repeat=1)
+t_new, res = common.best_time(screen_spt_table, small, 7.0, 0.3, 1.2)
+common.report("screen_spt_table", n_loop, t_ref, t_new)
+finite = np.isfinite(FS_ref)
+print(f"  max relative difference = {np.abs(res['FS'][finite] / FS_ref[finite] - 1.0).max():.1e}")
+
+table = make_table(n)
+t_new, res = common.best_time(screen_spt_table, table, 7.0, 0.3, 1.2)
+print(f"{n} rows: {t_new:.3f} s ({n / t_new:.2e} rows/s); FS < 1 in {np.mean(res['FS'] < 1.0) * 100:.1f} % of the rows")
@@ -0,0 +1,36 @@
+"""Table lookups in geotech.lookup versus direct evaluation of the series.
+
+Usage: python3 bench/bench_lookup.py [npoints]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import common
+from geotech.consolidation import consolid_calc_Uv_given_Tv_adaptive
+from geotech.lookup import get_table
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+rng = np.random.default_rng(7215)
+Tv = rng.uniform(0.0, 3.0, n)
+
+# building (first run) or opening (cached) the tables
+t0 = time.perf_counter()
+table = get_table()
+print(f"tables ready in {time.perf_counter() - t0:.3f} s")
+
+# forward queries
+t_ref, Uv_ref = common.best_time(consolid_calc_Uv_given_Tv_adaptive, Tv, 1e-15, repeat=1)
+t_new, Uv_new = common.best_time(table.Uv_given_Tv, Tv)
+common.report("lookup Uv_given_Tv", n, t_ref, t_new)
+
+# inverse queries (the reference is the exact Tv used to compute Uv_ref)
+t_new, Tv_new = common.best_time(table.Tv_given_Uv, Uv_ref)
+print(f"{'lookup Tv_given_Uv':<28} n = {n:<9} new = {t_new:9.4f} s")
+
+# errors
+bound_Uv, bound_Tv = table.error_bounds()
+print(f"max |Uv error| = {np.abs(Uv_new - Uv_ref).max():.2e} (bound {bound_Uv:.2e})")
+print(f"max |Tv error| = {np.abs(Tv_new - Tv).max():.2e} (bound {bound_Tv:.2e})")
@@ -0,0 +1,58 @@
+"""Monte Carlo settlement analysis in geotech.montecarlo.
+
+Checks the streaming quantiles against np.quantile of the stored
+settlements, checks that the result does not depend on the number of
+processes and times 10⁶ (or n) realizations of the staged construction
+of tutw10_e1.py with uncertain cv, Cc, e0, Qc and cr/cv.
+
+Usage: python3 bench/bench_montecarlo.py [n] [processes]
+"""
+
+import os
+import sys
+
+import numpy as np
+
+import common
+from geotech.montecarlo import calc_staged_settlement, run_settlement_monte_carlo, sample
+from geotech.staged import Stage, calc_schedule
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+processes = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+
+# nominal data of tutw10_e1.py and a three-stage schedule
+cv, Cc, e0, Qc, hdr, z, de, dc = 1.8e-8, 0.8, 1.0, 0.000109, 6.0, 3.0, 1.06, 0.052
+mv = (Cc / (1.0 + e0)) * np.log10(2.0) / 100.0
+Fm = np.log(de / dc) - 0.75 + np.pi * z * (2.0 * hdr - z) * 2.5 * cv * mv * 9.8 / Qc
+stages = [Stage(2.5, 0.3 / 7.0, wait_days=60), Stage(2.0, 0.3 / 7.0, wait_days=90), Stage(1.5, 0.3 / 7.0, wait_days=120)]
+heights = [stage.height for stage in stages]
+schedule = calc_schedule(stages, cv / hdr ** 2, 2.5 * cv / de ** 2, Fm)
+milestones = list(schedule.t_fin) + [schedule.t_wait[-1]]
+soil = dict(H_soil=6.0, hdr=hdr, z=z, de=de, dc=dc, gamma_fill=19.7, esigz_ini=(18.1 - 9.8) * z)
+distributions = dict(
+    cv=("lognormal", cv, 0.5),
+    Cc=("normal", Cc, 0.08),
+    e0=("normal", e0, 0.05),
+    Qc=("lognormal", Qc, 0.3),
+    cr_ratio=("uniform", 1.5, 3.5),
+)
+
+# streaming quantiles versus the exact ones of the same realizations
+m = 200000
+res = run_settlement_monte_carlo(distributions, heights, schedule, milestones, **soil, n=m, chunk_size=m, seed=1)
+rng = np.random.default_rng(np.random.SeedSequence(1).spawn(1)[0])
+cv_, Cc_, e0_, Qc_, ratio = (sample(rng, distributions[key], m) for key in ("cv", "Cc", "e0", "Qc", "cr_ratio"))
+kr = ratio * cv_ * (Cc_ / (1.0 + e0_)) * np.log10(2.0) / 100.0 * 9.8
+Fm_ = np.log(de / dc) - 0.75 + np.pi * z * (2.0 * hdr - z) * kr / Qc_
+S = calc_staged_settlement(heights, schedule, milestones, cv_ / hdr ** 2, ratio * cv_ / de ** 2, Fm_, 19.7, 6.0, Cc_, e0_, soil["esigz_ini"])
+exact = np.quantile(S, res.q, axis=0)
+print(f"max relative error of the streaming quantiles = {np.abs(res.quantiles / exact - 1.0).max():.1e}")
+
+# serial and parallel runs
+t_serial, serial = common.best_time(lambda: run_settlement_monte_carlo(distributions, heights, schedule, milestones, **soil, n=n), repeat=1)
+t_par, par = common.best_time(lambda: run_settlement_monte_carlo(distributions, heights, schedule, milestones, **soil, n=n, processes=processes), repeat=1)
+print(f"{n} realizations: serial {t_serial:.2f} s ({n / t_serial:.2e} /s), {processes} processes {t_par:.2f} s")
+print(f"  same quantiles with {processes} processes: {np.array_equal(serial.quantiles, par.quantiles)}")
+print(f"{'day':>8} {'P10 [m]':>8} {'P50 [m]':>8} {'P90 [m]':>8}")
+for k, t in enumerate(serial.milestones):
+    print(f"{t:8.0f} {serial.quantiles[0, k]:8.3f} {serial.quantiles[1, k]:8.3f} {serial.quantiles[2, k]:8.3f}")
@@ -0,0 +1,42 @@
+"""Batched time-to-target solver in geotech.pvd versus brentq per design.
+
+Usage: python3 bench/bench_pvd_inverse.py [ndesigns]
+"""
+
+import sys
+
+import numpy as np
+import scipy.optimize as opt
+
+import common
+from geotech.pvd import calc_tau_given_Uvr
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+rng = np.random.default_rng(7215)
+
+# random designs around tutw10_e1.py: cv, drain spacing, Fm and target Uvr
+cv = rng.uniform(0.5e-8, 5e-8, n)
+de = 1.06 * rng.uniform(0.8, 2.5, n)
+bv = cv / 6.0 ** 2
+br = 2.5 * cv / de ** 2
+Fm = rng.uniform(2.5, 6.0, n)
+Uvr = rng.uniform(0.05, 0.995, n)
+
+
+# the residual as in tutw10_e1.py (np.vectorize wrapper around scalar code)
+def brentq_one(Uvr, bv, br, Fm):
+    def resid_one(tau):
+        Tv = bv * tau
+        Uv = 2.0 * np.sqrt(Tv / np.pi) if Tv <= 0.217 else 1.0 - 10.0 ** (-(Tv + 0.085) / 0.933)
+        Ur = 1.0 - np.exp(-8.0 * br * tau / Fm)
+        return Uvr - 1.0 + (1.0 - Uv) * (1.0 - Ur)
+
+    return opt.brentq(np.vectorize(resid_one), 0.0, 1e12, xtol=1e-12, rtol=4 * np.finfo(float).eps)
+
+
+t_ref, tau_ref = common.best_time(lambda: np.array([brentq_one(*p) for p in zip(Uvr, bv, br, Fm)]), repeat=1)
+t_new, tau_new = common.best_time(calc_tau_given_Uvr, Uvr, bv, br, Fm)
+common.report("calc_tau_given_Uvr", n, t_ref, t_new)
+rel = np.abs(tau_new - tau_ref) / tau_ref
+print(f"max relative difference to brentq = {rel.max():.2e}")
+assert rel.max() <= 1e-10
@@ -0,0 +1,39 @@
+"""PVD design sweep in geotech.pvd: throughput over a large parameter grid.
+
+Usage: python3 bench/bench_pvd_sweep.py [nspacings]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import common
+from geotech.pvd import iter_pvd_sweep
+
+ns = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+# soil data from tutw10_e1.py
+cv = 1.8e-8
+kr = 2.5 * cv * (0.8 / 2.0) * np.log10(2.0) / 100.0 * 9.8
+
+grid = dict(
+    spacing=np.linspace(0.8, 3.0, ns),
+    triangular=[True, False],
+    Qc=np.linspace(2e-5, 2e-4, 20),
+    b=[75.0, 100.0, 150.0],
+    smear_ratio=[1.0, 2.0, 3.0],
+    kr_ks=[1.0, 2.0, 5.0],
+)
+
+# stream the results, keeping the fastest design to reach 99 % within 1 year per cost
+t0 = time.perf_counter()
+count, best = 0, None
+for chunk in iter_pvd_sweep(cv, 2.5 * cv, kr, 6.0, 3.0, **grid):
+    count += len(chunk)
+    ok = chunk[chunk["t99"] <= 365.0]
+    if len(ok) and (best is None or ok["cost"].min() < best["cost"]):
+        best = ok[np.argmin(ok["cost"])]
+t = time.perf_counter() - t0
+print(f"{count} combinations in {t:.3f} s ({count / t:.0f} per second)")
+print(f"cheapest design with t99 ≤ 365 days: {best}")
@@ -0,0 +1,47 @@
+"""Radial consolidation kernels in geotech.radial on (designs × times) grids.
+
+Compares evaluating F (with its logs) at every point of the grid against
+computing F once per design (calc_Ur_grid).
+
+Usage: python3 bench/bench_radial.py [ndesigns] [ntimes]
+"""
+
+import sys
+
+import numpy as np
+
+import common
+from geotech.radial import calc_Fnd, calc_Fnd_smear, calc_Ur_given_Tr, calc_Ur_grid
+
+nd = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+nt = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+rng = np.random.default_rng(7215)
+
+# designs around tutw07_e2.py: stone columns with dc = 0.8 m
+dc = 0.8
+de = 2.0 * rng.uniform(1.6, 3.2, nd) / np.sqrt(np.pi)
+Nd = de / dc
+cr = rng.uniform(1e-7, 1e-6, nd)
+Ns, kr_ks, kr_kc, hdr_dc = 1.25, 6.0, 1e-4, 5.0 / dc
+t = np.linspace(0.0, 365.0 * 86400.0, nt)
+
+
+def per_point_barron():
+    Tr = cr[:, None] * t[None, :] / de[:, None] ** 2
+    return calc_Ur_given_Tr(Tr, Nd[:, None] * np.ones(nt))
+
+
+def per_point_smear():
+    Tr = cr[:, None] * t[None, :] / de[:, None] ** 2
+    F = calc_Fnd_smear(Nd[:, None] * np.ones(nt), Ns, kr_ks, kr_kc, hdr_dc)
+    return calc_Ur_given_Tr(Tr, F=F)
+
+
+for name, ref, F in [
+    ("Ur Barron", per_point_barron, lambda: calc_Fnd(Nd)),
+    ("Ur Han & Ye (smear)", per_point_smear, lambda: calc_Fnd_smear(Nd, Ns, kr_ks, kr_kc, hdr_dc)),
+]:
+    t_ref, U_ref = common.best_time(ref)
+    t_new, U_new = common.best_time(lambda: calc_Ur_grid(t, cr, de, F()))
+    common.report(name, nd * nt, t_ref, t_new)
+    print(f"  max difference = {np.abs(U_new - U_ref).max():.1e}")
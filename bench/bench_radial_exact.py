@@ -0,0 +1,41 @@
+"""Exact (Bessel series) versus closed-form radial consolidation in geotech.radial.
+
+Times the computation of the roots (first call versus cached call) and the
+evaluation of the series over a time grid (one sum per time versus the
+times × roots matrix product), and prints the difference between the
+exact and the closed-form solutions.
+
+Usage: python3 bench/bench_radial_exact.py [ntimes] [nroots]
+"""
+
+import sys
+
+import numpy as np
+
+import common
+from geotech.radial import calc_bessel_roots, calc_Ur_given_Tr
+
+nt = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+nroots = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+Tr = np.linspace(0.0, 1.0, nt)
+
+for Nd in (3.4, 20.0):
+    # roots: the first call computes them, the next ones hit the cache
+    calc_bessel_roots.cache_clear()
+    t_ref, _ = common.best_time(calc_bessel_roots, Nd, nroots, repeat=1)
+    t_new, (beta, A) = common.best_time(calc_bessel_roots, Nd, nroots)
+    common.report(f"roots Nd = {Nd}", nroots, t_ref, t_new)
+
+    # series: one reduction per time versus matrix product
+    rate = -4.0 * Nd * Nd * beta ** 2
+    t_ref, U_ref = common.best_time(lambda: np.array([1.0 - np.sum(A * np.exp(rate * T)) for T in Tr]), repeat=1)
+    t_new, U_new = common.best_time(lambda: calc_Ur_given_Tr(Tr, Nd, method="bessel", nroots=nroots))
+    common.report(f"series Nd = {Nd}", nt, t_ref, t_new)
+    print(f"  max difference = {np.abs(U_new - U_ref).max():.1e}")
+
+    # accuracy of the closed form and truncation of the series
+    t_apx, U_apx = common.best_time(calc_Ur_given_Tr, Tr, Nd)
+    print(f"  closed form: {t_apx:.4f} s; truncation bound 1 - sum(A) = {1.0 - A.sum():.1e}")
+    for lo, hi in [(0.0, 0.01), (0.01, 0.1), (0.1, 1.0)]:
+        sel = (Tr >= lo) & (Tr <= hi)
+        print(f"  Tr in [{lo}, {hi}]: max |Ur_exact - Ur_closed| = {np.abs(U_new[sel] - U_apx[sel]).max():.2e}")
@@ -0,0 +1,61 @@
+"""FORM/SORM reliability of the liquefaction factor of safety in geotech.reliability.
+
+Compares one constrained optimization per depth (scipy.optimize.minimize,
+SLSQP: min |u| subject to g(u) = 0) with the batched HL-RF iteration of
+form_liquefaction over a profile, and cross-checks the probabilities of
+liquefaction with Monte Carlo sampling.
+
+Usage: python3 bench/bench_reliability.py [ndepths] [nsamples]
+"""
+
+import sys
+
+import numpy as np
+
+import common
+from geotech.reliability import _distribution_params, _to_physical, calc_liquefaction_limit_state, form_liquefaction, monte_carlo_pf
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+nsamples = int(sys.argv[2]) if len(sys.argv) > 2 else 50000
+
+# profile of tutw05_e2.py (water table at 1.5 m) with N60 increasing with depth
+depth = np.linspace(2.0, 14.0, n)
+variables = dict(
+    N60=("lognormal", 12.0 + 0.8 * depth, 0.25),
+    gamma_dry=("normal", 19.0, 0.05),
+    gamma_sat=("normal", 20.0, 0.05),
+    amax_g=("lognormal", 0.2, 0.3),
+    Mw=("normal", 7.0, 0.05),
+    rd=("lognormal", 1.0, 0.1),
+)
+fines, z_water = 15.0, 1.5
+
+
+def loop():
+    import scipy.optimize as opt
+    from scipy.special import ndtr
+
+    a, b, lognormal, _ = _distribution_params(variables, n)
+    beta = np.empty(n)
+    for i in range(n):
+
+        def g(u):
+            return calc_liquefaction_limit_state(_to_physical(u, a[i], b[i], lognormal), depth[i], fines, z_water)
+
+        res = opt.minimize(lambda u: u @ u, np.zeros(6), method="SLSQP", constraints={"type": "eq", "fun": g})
+        beta[i] = np.sign(g(np.zeros(6))) * np.sqrt(res.fun)
+    return ndtr(-beta)
+
+
+t_ref, pf_ref = common.best_time(loop, repeat=1)
+t_new, res = common.best_time(lambda: form_liquefaction(depth, fines, z_water, variables, sorm=False))
+common.report("form_liquefaction", n, t_ref, t_new)
+print(f"  max difference in pf = {np.abs(res.pf - pf_ref).max():.1e}; all converged: {res.converged.all()}")
+
+t_sorm, res = common.best_time(lambda: form_liquefaction(depth, fines, z_water, variables))
+t_mc, (pf_mc, se) = common.best_time(lambda: monte_carlo_pf(depth, fines, z_water, variables, n=nsamples), repeat=1)
+print(f"FORM + SORM: {t_sorm:.3f} s; Monte Carlo ({nsamples} samples per depth): {t_mc:.2f} s")
+print(f"  max |pf - pf_MC| / se: FORM {np.max(np.abs(res.pf - pf_mc) / se):.1f}, SORM {np.max(np.abs(res.pf_sorm - pf_mc) / se):.1f}")
+print(f"{'depth':>6} {'FS':>6} {'beta':>6} {'pf FORM':>8} {'pf SORM':>8} {'pf MC':>8}")
+for k in np.linspace(0, n - 1, 7).astype(int):
+    print(f"{depth[k]:6.1f} {res.FS_mean[k]:6.2f} {res.beta[k]:6.2f} {res.pf[k]:8.4f} {res.pf_sorm[k]:8.4f} {pf_mc[k]:8.4f}")
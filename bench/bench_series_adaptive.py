@@ -0,0 +1,36 @@
+"""Adaptive-truncation Uv(Tv) versus the fixed 100-term Fourier series.
+
+Usage: python3 bench/bench_series_adaptive.py [npoints] [tol]
+"""
+
+import sys
+
+import numpy as np
+
+import common
+from geotech.consolidation import (
+    consolid_calc_Uv_given_Tv_adaptive,
+    consolid_calc_Uv_given_Tv_series,
+)
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+tol = float(sys.argv[2]) if len(sys.argv) > 2 else 1e-10
+rng = np.random.default_rng(7215)
+Tv = rng.uniform(0.0, 2.0, n)
+
+# throughput
+t_fixed, U_fixed = common.best_time(consolid_calc_Uv_given_Tv_series, Tv, repeat=1)
+t_adapt, (U_adapt, nterms) = common.best_time(
+    lambda x: consolid_calc_Uv_given_Tv_adaptive(x, tol, return_nterms=True), Tv
+)
+common.report("Uv_given_Tv_adaptive", n, t_fixed, t_adapt)
+print(f"exp/erfc evaluations: fixed = {100 * n}, adaptive = {nterms.sum()} (max {nterms.max()} per point)")
+
+# accuracy where 100 terms are converged (Tv ≥ 0.01) and near Tv = 0
+far = Tv >= 0.01
+print(f"max |adaptive - fixed| for Tv ≥ 0.01 = {np.abs(U_adapt[far] - U_fixed[far]).max():.2e} (tol = {tol:.0e})")
+Tv_small = np.array([0.0, 1e-8, 1e-6, 1e-4])
+U_exact = 2.0 * np.sqrt(Tv_small / np.pi)  # exact to machine precision for Tv ≤ 1e-4
+err_fixed = np.abs(consolid_calc_Uv_given_Tv_series(Tv_small) - U_exact).max()
+err_adapt = np.abs(consolid_calc_Uv_given_Tv_adaptive(Tv_small, tol) - U_exact).max()
+print(f"max error for Tv ≤ 1e-4: fixed = {err_fixed:.2e}, adaptive = {err_adapt:.2e}")
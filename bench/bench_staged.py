@@ -0,0 +1,37 @@
+"""Staged construction engine in geotech.staged: tutw10 check and 50-stage timing.
+
+Usage: python3 bench/bench_staged.py [nstages] [ntimes]
+"""
+
+import sys
+
+import numpy as np
+
+import common
+from geotech.staged import Stage, calc_schedule, simulate_staged_construction
+
+nstages = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+ntimes = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+
+# soil and drain data from tutw10_e1.py
+cv, de, dc = 1.8e-8, 1.06, 0.052
+kr = 2.5 * cv * (0.8 / 2.0) * np.log10(2.0) / 100.0 * 9.8
+Fm = np.log(de / dc) - 0.75 + np.pi * 3.0 * (2 * 6.0 - 3.0) * kr / 0.000109
+bv, br = cv / 6.0 ** 2, 2.5 * cv / de ** 2
+soil = dict(gamma_fill=19.7, H_soil=6.0, Cc=0.8, e0=1.0, esigz_ini=(18.1 - 9.8) * 3.0)
+rate = 0.3 / 7.0
+
+# the two stages of tutw10_e1.py at the five instants of the plots
+stages = [Stage(4.5, rate, wait_Uvr=0.8), Stage(3.5, rate, until_day=365)]
+sc = calc_schedule(stages, bv, br, Fm)
+T = [0.0, sc.t_fin[0], sc.t_wait[0], sc.t_fin[1], sc.t_wait[1]]
+res = simulate_staged_construction(stages, bv, br, Fm, t_days=T, **soil)
+print("tutw10 settlements [m]:", np.round(res.settlement, 2))
+assert np.allclose(np.round(res.settlement, 2), [0.0, 0.79, 1.27, 1.47, 1.92])
+
+# many thin stages
+stages = [Stage(0.2, rate, wait_days=10) for _ in range(nstages)]
+t, res = common.best_time(
+    lambda: simulate_staged_construction(stages, bv, br, Fm, nt=ntimes, **soil)
+)
+print(f"{nstages} stages × {ntimes} times: {t:.3f} s (final settlement = {res.settlement[-1]:.2f} m)")
@@ -0,0 +1,36 @@
+"""Staged construction optimizer in geotech.staged_design: screening throughput.
+
+Usage: python3 bench/bench_staged_design.py [max_stages] [processes]
+"""
+
+import sys
+
+import numpy as np
+
+import common
+from geotech.staged import calc_S_total
+from geotech.staged_design import optimize_staged_construction
+
+max_stages = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+processes = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+# soil and drain data from tutw10_e1.py
+cv, de, dc = 1.8e-8, 1.06, 0.052
+kr = 2.5 * cv * (0.8 / 2.0) * np.log10(2.0) / 100.0 * 9.8
+Fm = np.log(de / dc) - 0.75 + np.pi * 3.0 * (2 * 6.0 - 3.0) * kr / 0.000109
+bv, br = cv / 6.0 ** 2, 2.5 * cv / de ** 2
+S_total = calc_S_total(8.0, 19.7, 6.0, 0.8, 1.0, (18.1 - 9.8) * 3.0)
+
+# 8 m embankment, at most 0.3 m of remaining primary settlement, within 500 days
+t, design = common.best_time(
+    lambda: optimize_staged_construction(
+        8.0, 0.3 / 7.0, bv, br, Fm, 19.7, 24.0, 1.3, S_total, 0.3, 500,
+        max_stages=max_stages, processes=processes,
+    ),
+    repeat=1,
+)
+print(f"screened {design.nscreened} schedules in {t:.2f} s ({design.nscreened / t:.0f} per second)")
+print(f"feasible = {design.nfeasible}, earliest opening = day {design.t_open:.0f}")
+for k, stage in enumerate(design.stages):
+    wait = f"wait {stage.wait_days:.0f} days" if stage.until_day is None else f"open on day {stage.until_day:.0f}"
+    print(f"  stage {k + 1}: H = {stage.height} m, {wait}")
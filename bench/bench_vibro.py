@@ -0,0 +1,84 @@
+"""Inverse design of vibro-compaction spacing in geotech.vibro.
+
+Compares a loop over column diameters and sublayers (steps 6 and 7 of
+tutw05_e2.py repeated for each pair, with the N1_60 read solved by
+brentq) with evaluate_vibro_layers and design_vibro_spacing, and prints
+the designs of a layered profile sorted by the number of columns.
+
+Usage: python3 bench/bench_vibro.py [nlayers] [ndiameters]
+"""
+
+import sys
+
+import numpy as np
+
+import common
+from geotech.liquefaction import Dr_from_SPT, calc_CRR_M75, calc_N1_60cs, calc_rd
+from geotech.vibro import design_vibro_spacing, evaluate_vibro_layers
+
+nlayers = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+ndiam = int(sys.argv[2]) if len(sys.argv) > 2 else 61
+rng = np.random.default_rng(7215)
+
+# sublayers of 0.2 m with N60 increasing with depth
+depth = 0.2 * np.arange(1, nlayers + 1)
+profile = dict(
+    depth=depth,
+    N60=rng.uniform(4.0, 8.0, nlayers) + 0.3 * depth,
+    fines=rng.uniform(0.0, 20.0, nlayers),
+    gamma_dry=19.0,
+    gamma_sat=20.0,
+    z_water=1.5,
+    e_min=0.45,
+    e_max=0.98,
+    d50=1.2,
+)
+dc = np.linspace(0.6, 1.2, ndiam)
+Mw, amax_g, FS_new, S, area = 7.0, 0.3, 1.2, 0.05, 2500.0
+
+
+def loop():
+    import scipy.optimize as opt
+
+    h = depth[-1]
+    MSF = 6.9 * np.exp(-Mw / 4.0) - 0.06
+    s = np.full(len(dc), np.inf)
+    for i, d in enumerate(dc):
+        top = 0.0
+        for k in range(nlayers):
+            z, N60, FC = 0.5 * (top + depth[k]), profile["N60"][k], profile["fines"][k]
+            top = depth[k]
+            sigma_z0 = 19.0 * min(z, 1.5) + 20.0 * max(z - 1.5, 0.0)
+            sigma_z0_eff = sigma_z0 - 9.81 * max(z - 1.5, 0.0)
+            CN = min(np.sqrt(100.0 / sigma_z0_eff), 1.7)
+            CSR = 0.65 * calc_rd(z) * sigma_z0 / sigma_z0_eff * amax_g
+            target = FS_new * CSR / MSF
+            if z <= 1.5 or target > calc_CRR_M75(29.0):
+                continue
+            N1_60 = opt.brentq(lambda N: calc_CRR_M75(calc_N1_60cs(N, FC)) - target, 0.0, 29.0)
+            N60_new = max(N1_60 / CN, N60)
+            e0 = 0.98 - Dr_from_SPT(1.2, N60, sigma_z0_eff) / 100.0 * 0.53
+            e1 = 0.98 - Dr_from_SPT(1.2, N60_new, sigma_z0_eff) / 100.0 * 0.53
+            aux = (1.0 + e0) * h / ((e0 - e1) * h - (1.0 + e0) * S)
+            if aux > 0.0:
+                s[i] = min(s[i], 0.89 * d * np.sqrt(aux))
+    return s
+
+
+def vectorized():
+    layers = evaluate_vibro_layers(profile, Mw, amax_g, FS_new)
+    res = design_vibro_spacing(layers, dc, area, S, ds=None)
+    return res[np.argsort(res["dc"])]
+
+
+t_ref, s_ref = common.best_time(loop, repeat=1)
+t_new, res = common.best_time(vectorized)
+common.report("design_vibro_spacing", nlayers * ndiam, t_ref, t_new)
+print(f"  max relative difference = {np.abs(res['s'] / s_ref - 1.0).max():.1e}")
+
+layers = evaluate_vibro_layers(profile, Mw, amax_g, FS_new)
+res = design_vibro_spacing(layers, dc, area, S)
+print("\nSmallest diameter for each number of columns (spacing rounded down to 0.1 m)")
+print(f"{'dc [m]':>8} {'s [m]':>8} {'columns':>8} {'volume [m³]':>12}")
+for row in res[np.unique(res["n_columns"], return_index=True)[1]]:
+    print(f"{row['dc']:8.2f} {row['s']:8.1f} {row['n_columns']:8d} {row['volume']:12.0f}")
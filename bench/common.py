@@ -0,0 +1,23 @@
+"""Helpers shared by the benchmark scripts."""
+
+import os
+import sys
+import time
+
+# make the geotech package importable when running the scripts directly
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+
+def best_time(func, *args, repeat=3):
+    """Returns the best wall time (seconds) of repeat calls and the last result."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        res = func(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best, res
+
+
+def report(name, n, t_ref, t_new):
+    """Prints one line comparing a reference and a new implementation."""
+    print(f"{name:<28} n = {n:<9} ref = {t_ref:9.4f} s  new = {t_new:9.4f} s  speedup = {t_ref / t_new:8.1f}x")
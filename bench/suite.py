@@ -0,0 +1,278 @@
+"""Benchmark suite for the hot computations of the tutorials.
+
+Each case is timed at the sizes scalar, 10³, 10⁶ and 10⁷ (number of input
+points). As in pytest-benchmark, the number of calls per round is
+calibrated so that each round takes at least --min-time, and the best
+and mean time per call over --rounds rounds are reported, together with
+the throughput (points per second) and the peak memory allocated during
+one call (tracemalloc). Sizes whose estimated time (from the previous
+size) exceeds --budget seconds are skipped.
+
+The results can be saved as JSON (--json) and compared with a previous
+run (--compare); cases that became slower (or use more memory) by more
+than --threshold are flagged, and --strict turns them into a failure.
+
+Usage: python3 bench/suite.py [-k PATTERN] [--sizes scalar,1e3,...] [--json FILE] [--compare FILE]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import common  # noqa: F401 (makes the geotech package importable)
+from geotech.anchors import anchor_unbonded_length
+from geotech.charts import get_chart
+from geotech.consolidation import consolid_calc_Uv_given_Tv, consolid_calc_Uv_given_Tv_series
+from geotech.liquefaction import Dr_from_SPT, screen_spt_table
+from geotech.pvd import calc_tau_given_Uvr
+from geotech.radial import calc_Fnd_smear, calc_Ur_given_Tr
+
+SIZES = {"scalar": 1, "1e3": 10 ** 3, "1e6": 10 ** 6, "1e7": 10 ** 7}
+CASES = {}
+
+
+def case(name):
+    """Registers a case: setup(n, scalar) returns the function to time (without arguments)."""
+
+    def register(setup):
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+def uniform(lo, hi, n, scalar, seed=7215):
+    """Returns n random values in [lo, hi] (one float if scalar)."""
+    values = np.random.default_rng(seed).uniform(lo, hi, n)
+    return float(values[0]) if scalar else values
+
+
+# cases ########################################################################
+
+
+@case("tutw03_e2: Uv series (100 terms)")
+def setup_series(n, scalar):
+    Tv = uniform(0.0, 1.1, n, scalar)
+    return lambda: consolid_calc_Uv_given_Tv_series(Tv)
+
+
+@case("tutw03_e2: Uv approximation")
+def setup_approx(n, scalar):
+    Tv = uniform(0.0, 1.1, n, scalar)
+    return lambda: consolid_calc_Uv_given_Tv(Tv)
+
+
+@case("tutw10_e1: time to Uvr (batched Newton)")
+def setup_tau(n, scalar):
+    Uvr = uniform(0.05, 0.995, n, scalar)
+    return lambda: calc_tau_given_Uvr(Uvr, 5e-10, 4e-8, 2.27)
+
+
+@case("tutw10_e1: time to Uvr (brentq per point)")
+def setup_tau_brentq(n, scalar):
+    import scipy.optimize as opt
+
+    bv, br, Fm = 5e-10, 4e-8, 2.27
+    Uvr = np.atleast_1d(uniform(0.05, 0.995, n, scalar))
+
+    def resid(tau, target):
+        Tv = bv * tau
+        Uv = 2.0 * np.sqrt(Tv / np.pi) if Tv <= 0.217 else 1.0 - 10.0 ** (-(Tv + 0.085) / 0.933)
+        Ur = 1.0 - np.exp(-8.0 * br * tau / Fm)
+        return target - 1.0 + (1.0 - Uv) * (1.0 - Ur)
+
+    return lambda: [opt.brentq(resid, 0.0, 1e12, args=(target,)) for target in Uvr]
+
+
+@case("tutw07_e2: Han & Ye smear")
+def setup_smear(n, scalar):
+    Nd = uniform(2.0, 4.0, n, scalar)
+    Tr = uniform(0.0, 1.0, n, scalar, seed=1)
+    return lambda: calc_Ur_given_Tr(Tr, F=calc_Fnd_smear(Nd, 1.25, 6.0, 1e-4, 6.25))
+
+
+@case("tutw05_e2: Dr_from_SPT")
+def setup_Dr(n, scalar):
+    d50 = uniform(0.1, 2.0, n, scalar)
+    n60 = uniform(2.0, 40.0, n, scalar, seed=1)
+    s0eff = uniform(20.0, 200.0, n, scalar, seed=2)
+    return lambda: Dr_from_SPT(d50, n60, s0eff)
+
+
+@case("tutw05_e2: liquefaction screening (rows)")
+def setup_screening(n, scalar):
+    # boreholes with one SPT reading every 1.5 m down to 30 m
+    depth = 1.5 * (np.arange(n) % 20 + 1)
+    table = dict(
+        borehole=np.arange(n) // 20,
+        depth=depth,
+        N60=np.atleast_1d(uniform(2.0, 40.0, n, scalar)),
+        fines=np.atleast_1d(uniform(0.0, 40.0, n, scalar, seed=1)),
+        gamma_dry=np.full(n, 19.0),
+        gamma_sat=np.full(n, 20.0),
+        z_water=np.full(n, 1.5),
+    )
+    return lambda: screen_spt_table(table, 7.0, 0.3, d50=1.2)
+
+
+@case("tutw05_e2: Figure 2.83 inverse read")
+def setup_chart(n, scalar):
+    chart = get_chart("nceer_crr_m75_fig2_83")
+    CRR = uniform(0.06, 0.4, n, scalar)
+    fines = uniform(5.0, 35.0, n, scalar, seed=1)
+    return lambda: chart.read_inverse(CRR, fines)
+
+
+@case("tutw08_e1: anchor_unbonded_length")
+def setup_anchor(n, scalar):
+    d = uniform(1.0, 8.0, n, scalar)
+    theta, psi = np.radians(15.0), np.radians(62.0)
+    return lambda: anchor_unbonded_length(d, 9.0, 1.8, theta, psi)
+
+
+@case("tutw02_e1: Fibonacci (Python ints)")
+def setup_fib_int(n, scalar):
+    def run():
+        a, b = 0, 1
+        for _ in range(2, n):
+            a, b = b, a + b
+        return b
+
+    return run
+
+
+@case("tutw03_e1: Fibonacci (NumPy array)")
+def setup_fib_array(n, scalar):
+    def run():
+        fb = np.zeros(max(n, 2))
+        fb[1] = 1.0
+        # the numbers overflow to inf after 1476 terms
+        with np.errstate(over="ignore"):
+            for i in range(2, n):
+                fb[i] = fb[i - 1] + fb[i - 2]
+        return fb
+
+    return run
+
+
+# runner #######################################################################
+
+
+def measure(func, rounds, min_time):
+    """Returns the best and mean time per call [s] and the peak memory of one call [bytes]."""
+    # calibration: calls per round such that a round takes at least min_time
+    t0 = time.perf_counter()
+    func()
+    first = time.perf_counter() - t0
+    loops = max(1, int(min_time / max(first, 1e-9)))
+    rounds = max(1, rounds if first < 1.0 else 1)
+    per_call = []
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            func()
+        per_call.append((time.perf_counter() - t0) / loops)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(per_call), float(np.mean(per_call)), peak
+
+
+def run_suite(names, sizes, rounds, min_time, budget):
+    """Runs the cases; returns a list of result records."""
+    results = []
+    for name in names:
+        per_point = None
+        for label in sizes:
+            n = SIZES[label]
+            record = {"case": name, "size": label, "n": n}
+            if per_point is not None and per_point * n > budget:
+                record["skipped"] = f"estimated {per_point * n:.0f} s > budget"
+            else:
+                func = CASES[name](n, label == "scalar")
+                best, mean, peak = measure(func, rounds, min_time)
+                per_point = best / n
+                record.update(best=best, mean=mean, throughput=n / best, peak_memory=peak)
+            results.append(record)
+            print(format_record(record, None), flush=True)
+    return results
+
+
+def format_record(record, previous):
+    """Formats one line of the report (with the change relative to a previous record)."""
+    line = f"{record['case']:<44} {record['size']:>6}"
+    if "skipped" in record:
+        return line + f"  skipped ({record['skipped']})"
+    line += f"  {record['best']:10.3e} s  {record['throughput']:10.3e} /s  {record['peak_memory'] / 2 ** 20:9.2f} MB"
+    if previous is not None and "best" in previous:
+        line += f"  time x{record['best'] / previous['best']:.2f}"
+        if previous["peak_memory"] > 0:
+            line += f"  mem x{record['peak_memory'] / previous['peak_memory']:.2f}"
+    return line
+
+
+def compare_runs(results, previous, threshold):
+    """Prints the results next to a previous run; returns the regressions."""
+    old = {(r["case"], r["size"]): r for r in previous["results"]}
+    regressions = []
+    print(f"\ncomparison with the run of {previous['meta']['date']}")
+    for record in results:
+        prev = old.get((record["case"], record["size"]))
+        print(format_record(record, prev))
+        if prev is None or "best" not in prev or "best" not in record:
+            continue
+        if record["best"] > threshold * prev["best"]:
+            regressions.append(f"{record['case']} ({record['size']}): time x{record['best'] / prev['best']:.2f}")
+        if record["peak_memory"] > threshold * max(prev["peak_memory"], 1024):
+            regressions.append(f"{record['case']} ({record['size']}): memory x{record['peak_memory'] / max(prev['peak_memory'], 1):.2f}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark suite for the tutorial computations.")
+    parser.add_argument("-k", dest="pattern", default="", help="only run the cases whose name contains PATTERN")
+    parser.add_argument("--sizes", default=",".join(SIZES), help="comma-separated sizes (scalar,1e3,1e6,1e7)")
+    parser.add_argument("--rounds", type=int, default=5, help="rounds per measurement")
+    parser.add_argument("--min-time", type=float, default=0.05, help="minimum time of a round [s]")
+    parser.add_argument("--budget", type=float, default=30.0, help="maximum estimated time of a measurement [s]")
+    parser.add_argument("--json", help="save the results to this file")
+    parser.add_argument("--compare", help="compare with the results in this file")
+    parser.add_argument("--threshold", type=float, default=1.2, help="slowdown (or memory growth) flagged as a regression")
+    parser.add_argument("--strict", action="store_true", help="exit with 1 if there are regressions")
+    args = parser.parse_args()
+
+    names = [name for name in CASES if args.pattern.lower() in name.lower()]
+    sizes = args.sizes.split(",")
+    results = run_suite(names, sizes, args.rounds, args.min_time, args.budget)
+
+    meta = {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2)
+            f.write("\n")
+    regressions = []
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare_runs(results, json.load(f), args.threshold)
+        print(f"\n{len(regressions)} regressions")
+        for line in regressions:
+            print(f"  {line}")
+    return 1 if regressions and args.strict else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
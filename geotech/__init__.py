@@ -0,0 +1 @@
+"""Geotechnical helpers shared by the CIVL7215 tutorial scripts."""
@@ -0,0 +1,186 @@
+"""Ground anchors of anchored walls with any number of anchor rows.
+
+Generalises tutw08/tutw08_e1.py (two rows, one section) to N rows and
+many wall sections at once. With the apparent earth pressure envelope
+Pa = 0.65 Ka gamma H² distributed as a trapezoid, the maximum pressure is
+
+    p = Pa / (H - H_1/3 - H_{n+1}/3)
+
+where H_1 is the depth of the first row and H_{n+1} the distance from the
+lowest row to the bottom of the excavation. The horizontal load of each
+row follows the tributary area method: the part above the row is
+2 H_1/3 for the first row and H_i/2 otherwise, and the part below is
+23 H_{n+1}/48 for the lowest row and H_{i+1}/2 otherwise (for two rows,
+the expressions of Th1 and Th2 in the tutorial). With one row, the first
+row is also the lowest one and gets (2 H_1/3 + 23 H_2/48) p.
+"""
+
+import numpy as np
+
+# fields of the results of anchor_unbonded_length (m): horizontal distance
+# of the tip of the unbonded length (trial, minimum and final) and the
+# unbonded length (trial, minimum and final)
+UNBONDED_LENGTH_DTYPE = np.dtype(
+    [
+        ("x_trial", float),
+        ("x_min", float),
+        ("x", float),
+        ("Lub_trial", float),
+        ("Lub_min", float),
+        ("Lub", float),
+    ]
+)
+
+# fields of the results of design_anchored_walls, one record per anchor
+# (section and row indices; depth, lengths in m, p in kPa, Th in kN/m,
+# U in kN); bar_ok is the check U ≤ 0.6 SMTS
+ANCHOR_DTYPE = np.dtype(
+    [
+        ("section", int),
+        ("row", int),
+        ("depth", float),
+        ("p", float),
+        ("Th", float),
+        ("U", float),
+        ("Lub", float),
+        ("Lb", float),
+        ("L", float),
+        ("bar_ok", bool),
+    ]
+)
+
+
+def anchor_unbonded_length(d, H, chi, theta, psi, strand=False, z_min=4.5):
+    """Calculates the unbonded length of anchors with heads at depth d (angles in radians).
+
+    All arguments are values or arrays (broadcast together); strand flags
+    tendons made of strands (minimum unbonded length of 4.5 m instead of
+    3 m). The overburden above the bonded length must be at least z_min.
+    Nothing is printed (see print_unbonded_length).
+
+    Returns a structured array (UNBONDED_LENGTH_DTYPE) with the shape of
+    the broadcast arguments (a record for values)."""
+    d, H, chi, theta, psi, strand = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (d, H, chi, theta, psi)), np.asarray(strand, dtype=bool)
+    )
+    res = np.empty(d.shape, dtype=UNBONDED_LENGTH_DTYPE)
+    res["x_trial"] = (H - d + chi / np.cos(psi)) / (np.tan(theta) + np.tan(psi))
+    res["x_min"] = np.where(d < z_min, (z_min - d) / np.tan(theta), res["x_trial"])
+    res["x"] = np.maximum(res["x_trial"], res["x_min"])
+    res["Lub_trial"] = res["x"] / np.cos(theta)
+    res["Lub_min"] = np.where(strand, 4.5, 3.0)
+    res["Lub"] = np.maximum(res["Lub_trial"], res["Lub_min"])
+    return res[()]
+
+
+def print_unbonded_length(records, file=None):
+    """Prints the results of anchor_unbonded_length as in tutw08_e1.py, six lines per anchor."""
+    for rec in np.atleast_1d(records).ravel():
+        print(f"x (trial)   = {rec['x_trial']:.1f} m", file=file)
+        print(f"x (min)     = {rec['x_min']:.1f} m", file=file)
+        print(f"x (final)   = {rec['x']:.1f} m", file=file)
+        print(f"Lub (trial) = {rec['Lub_trial']:.1f} m", file=file)
+        print(f"Lub (min)   = {rec['Lub_min']:.1f} m", file=file)
+        print(f"Lub (final) = {rec['Lub']:.1f} m", file=file)
+
+
+def calc_apparent_pressure(H, gamma, phi, H_first, H_last):
+    """Calculates Ka, Pa = 0.65 Ka gamma H² and the maximum pressure p of the trapezoidal envelope."""
+    Ka = (1.0 - np.sin(phi)) / (1.0 + np.sin(phi))
+    Pa = 0.65 * Ka * gamma * np.asarray(H, dtype=float) ** 2.0
+    return Ka, Pa, Pa / (H - H_first / 3.0 - H_last / 3.0)
+
+
+def calc_horizontal_loads(depths, H, p):
+    """Calculates the horizontal load [kN/m] of each anchor row (tributary area method).
+
+    depths has one row per section and one column per anchor row (sorted;
+    nan pads sections with fewer rows); H and p have one value per
+    section."""
+    depths = np.atleast_2d(np.asarray(depths, dtype=float))
+    H = np.asarray(H, dtype=float).reshape(-1, 1)
+    valid = ~np.isnan(depths)
+    nrows = valid.sum(axis=1, keepdims=True)
+    col = np.arange(depths.shape[1])
+    first, last = col == 0, col == nrows - 1
+
+    # spacing to the row above (or the surface) and to the row below (or the bottom)
+    above = np.diff(depths, axis=1, prepend=0.0)
+    below = np.concatenate([depths[:, 1:], np.full((len(depths), 1), np.nan)], axis=1) - depths
+    bottom = H - np.take_along_axis(depths, np.maximum(nrows - 1, 0), axis=1)
+    below = np.where(last, bottom, below)
+    tributary = np.where(first, 2.0 * above / 3.0, above / 2.0) + np.where(last, 23.0 * below / 48.0, below / 2.0)
+    return np.where(valid, tributary * np.asarray(p, dtype=float).reshape(-1, 1), np.nan)
+
+
+def design_anchored_walls(
+    H,
+    depths,
+    Sh,
+    gamma,
+    phi,
+    theta,
+    tau_a,
+    d_DH,
+    smts,
+    FS=2.0,
+    strand=False,
+):
+    """Designs the anchors of every row of every wall section.
+
+    H [m] has one value per section; depths [m] are the depths of the
+    anchor heads, one row per section (or one row for all sections) and
+    one column per anchor row, padded with nan for sections with fewer
+    rows; every anchor head must lie between the top and the bottom of the
+    excavation (0 < depth < H). The other data (horizontal spacing Sh [m], unit weight [kN/m³],
+    friction angle phi and tendon inclination theta [rad], bond stress
+    tau_a [kPa], drill-hole diameter d_DH [m], SMTS of the bar [kN]) is a
+    value or one value per section.
+
+    Returns a structured array (ANCHOR_DTYPE) with the records of all
+    anchors, by section and row."""
+    H = np.atleast_1d(np.asarray(H, dtype=float))
+    ns = len(H)
+    depths = np.atleast_2d(np.asarray(depths, dtype=float))
+    depths = np.broadcast_to(depths, (ns, depths.shape[1]))
+
+    def per_section(value):
+        return np.broadcast_to(np.asarray(value, dtype=float), (ns,))[:, None]
+
+    Sh, gamma, phi, theta, tau_a, d_DH, smts = (per_section(v) for v in (Sh, gamma, phi, theta, tau_a, d_DH, smts))
+    H2 = H[:, None]
+    valid = ~np.isnan(depths)
+    if (
+        np.any(np.diff(depths, axis=1) <= 0.0)
+        or np.any(valid[:, 1:] & ~valid[:, :-1])
+        or np.any(depths <= 0.0)
+        or np.any(depths >= H[:, None])
+    ):
+        raise ValueError(
+            "the anchor depths of each section must be increasing, between 0 and H and padded with nan at the end"
+        )
+
+    # slip line and minimum distance of the bonded length from it
+    psi = np.pi / 4.0 + phi / 2.0
+    chi = np.maximum(1.5, H2 / 5.0)
+
+    # loads
+    nrows = valid.sum(axis=1)
+    H_last = H - depths[np.arange(ns), np.maximum(nrows - 1, 0)]
+    _, _, p = calc_apparent_pressure(H, gamma[:, 0], phi[:, 0], depths[:, 0], H_last)
+    Th = calc_horizontal_loads(depths, H, p)
+    U = Th * Sh / np.cos(theta)
+
+    # lengths
+    Lub = anchor_unbonded_length(depths, H2, chi, theta, psi, strand)["Lub"]
+    Lb = FS * U / (np.pi * d_DH * tau_a)
+
+    section, row = np.nonzero(valid)
+    res = np.empty(len(section), dtype=ANCHOR_DTYPE)
+    res["section"], res["row"], res["depth"] = section, row, depths[valid]
+    res["p"] = p[section]
+    res["Th"], res["U"] = Th[valid], U[valid]
+    res["Lub"], res["Lb"] = Lub[valid], Lb[valid]
+    res["L"] = res["Lub"] + res["Lb"]
+    res["bar_ok"] = res["U"] <= 0.6 * np.broadcast_to(smts, depths.shape)[valid]
+    return res
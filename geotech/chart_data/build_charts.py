@@ -0,0 +1,80 @@
+"""Builds the chart files of this directory (see geotech.charts).
+
+Each chart records where its points come from:
+
+* terzaghi_uv_fig7_8: the points digitized from Figure 7.8 in
+  tutw03/tutw03_e2.py (Tv versus Uv [%]);
+* nceer_rd_fig2_82: rd versus depth [m] (Figure 2.82); the curve is
+  piecewise linear, thus its breakpoints are exact;
+* nceer_crr_m75_fig2_83: CRR for M = 7.5 versus N1_60 (Figure 2.83), for
+  fines contents of 5, 15 and 35 %, sampled from the expressions in
+  geotech.liquefaction (from the minimum of CRR, near N1_60 = 0.5).
+
+Usage: python3 geotech/chart_data/build_charts.py
+"""
+
+import ast
+import os
+import sys
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", ".."))
+from geotech.charts import save_chart
+from geotech.liquefaction import calc_CRR_M75, calc_N1_60cs, calc_rd
+
+
+def read_digitized_data(script):
+    """Returns the digitized_data array of a tutorial script (without running it)."""
+    with open(script, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and node.targets[0].id == "digitized_data":
+            return np.array(ast.literal_eval(node.value.args[0]))
+    raise ValueError(f"no digitized_data in {script}")
+
+
+# Figure 7.8
+data = read_digitized_data(os.path.join(HERE, "..", "..", "tutw03", "tutw03_e2.py"))
+save_chart(
+    os.path.join(HERE, "terzaghi_uv_fig7_8.npz"),
+    [(data[:, 0], data[:, 1])],
+    title="Degree of vertical consolidation (uniform initial excess pore pressure)",
+    source="Figure 7.8, digitized in tutw03/tutw03_e2.py",
+    x_label="Tv",
+    y_label="Uv [%]",
+)
+
+# Figure 2.82
+z = np.array([0.0, 9.15, 23.0, 30.0])
+save_chart(
+    os.path.join(HERE, "nceer_rd_fig2_82.npz"),
+    [(z, calc_rd(z))],
+    title="Stress reduction coefficient",
+    source="Figure 2.82; Liao and Whitman (1986)",
+    x_label="depth [m]",
+    y_label="rd",
+)
+
+# Figure 2.83
+fines = [5.0, 15.0, 35.0]
+curves = []
+for FC in fines:
+    N1_60 = np.linspace(0.0, 40.0, 1601)
+    N1_60 = N1_60[calc_N1_60cs(N1_60, FC) <= 29.0]
+    CRR = calc_CRR_M75(calc_N1_60cs(N1_60, FC))
+    # the expression has a shallow minimum near N1_60cs = 0.5; the curve
+    # starts there so that it can be read both ways
+    start = np.argmin(CRR)
+    curves.append((N1_60[start:], CRR[start:]))
+save_chart(
+    os.path.join(HERE, "nceer_crr_m75_fig2_83.npz"),
+    curves,
+    fines,
+    title="Cyclic resistance ratio for M = 7.5",
+    source="Figure 2.83; Youd et al. (2001)",
+    x_label="N1_60",
+    y_label="CRR_M75",
+    param_label="fines [%]",
+)
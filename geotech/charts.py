@@ -0,0 +1,145 @@
+"""Digitized charts: curves read from textbook figures.
+
+A chart is a family of curves y(x; p), one curve per value of a parameter
+p (a chart with a single curve has p = 0), e.g. CRR versus N1_60 for
+several fines contents. Charts are stored in compact .npz files (see
+save_chart): the points of all curves are concatenated in two float
+arrays, with the offsets of each curve, the parameter values and the
+metadata (labels, source, axis scales) as JSON. The files in CHART_DIR are
+listed by list_charts and loaded on first use by get_chart.
+
+Queries accept arrays (x and p broadcast together). They interpolate
+linearly along each curve (in log10 for log axes) and linearly in p
+between the two curves that bracket p. Inverse queries (x given y) need
+monotonic curves. Points outside the digitized ranges yield nan.
+"""
+
+import functools
+import json
+import os
+
+import numpy as np
+
+CHART_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "chart_data")
+
+
+def save_chart(path, curves, params=None, **meta):
+    """Saves a chart: curves is a list of (x, y) arrays, params the value of p of each curve.
+
+    meta holds title, source, x_label, y_label, param_label and x_scale and
+    y_scale ("linear" or "log")."""
+    params = np.zeros(1) if params is None else np.asarray(params, dtype=float)
+    if len(params) != len(curves) or np.any(np.diff(params) <= 0.0):
+        raise ValueError("params must be increasing and have one value per curve")
+    x = [np.asarray(c[0], dtype=float) for c in curves]
+    y = [np.asarray(c[1], dtype=float) for c in curves]
+    offsets = np.cumsum([0] + [len(c) for c in x])
+    np.savez_compressed(
+        path,
+        x=np.concatenate(x),
+        y=np.concatenate(y),
+        offsets=offsets,
+        params=params,
+        meta=np.array(json.dumps(meta)),
+    )
+
+
+def _transform(values, scale):
+    return np.log10(values) if scale == "log" else values
+
+
+def _untransform(values, scale):
+    return 10.0 ** values if scale == "log" else values
+
+
+def _interp_curve(u, v, q):
+    """Interpolates v(u) at q (nan outside the range of u); u must be monotonic."""
+    if u[-1] < u[0]:
+        u, v = u[::-1], v[::-1]
+    if np.any(np.diff(u) <= 0.0):
+        raise ValueError("the curve is not monotonic in the input variable")
+    return np.interp(q, u, v, left=np.nan, right=np.nan)
+
+
+class Chart:
+    """A family of digitized curves, loaded from a .npz file on first use."""
+
+    def __init__(self, path):
+        self.path = path
+        self.name = os.path.splitext(os.path.basename(path))[0]
+        self._data = None
+
+    def _load(self):
+        if self._data is None:
+            with np.load(self.path, allow_pickle=False) as f:
+                data = {key: f[key] for key in ("x", "y", "offsets", "params")}
+                data["meta"] = json.loads(str(f["meta"]))
+            self._data = data
+        return self._data
+
+    @property
+    def meta(self):
+        """Metadata of the chart (labels, source and axis scales)."""
+        return self._load()["meta"]
+
+    @property
+    def params(self):
+        """Values of the parameter p of each curve."""
+        return self._load()["params"]
+
+    @property
+    def curves(self):
+        """List of (x, y) arrays, one per curve."""
+        d = self._load()
+        o = d["offsets"]
+        return [(d["x"][o[k] : o[k + 1]], d["y"][o[k] : o[k + 1]]) for k in range(len(o) - 1)]
+
+    def _query(self, values, p, inverse):
+        xs, ys = self.meta.get("x_scale", "linear"), self.meta.get("y_scale", "linear")
+        s_in, s_out = (ys, xs) if inverse else (xs, ys)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            q = _transform(np.asarray(values, dtype=float), s_in)
+        curves = [(_transform(y, ys), _transform(x, xs)) if inverse else (_transform(x, xs), _transform(y, ys)) for x, y in self.curves]
+        params = self.params
+        if len(curves) == 1:
+            return _untransform(_interp_curve(*curves[0], q), s_out)[()]
+
+        # the two curves that bracket p and the weight of the upper one
+        q, p = np.broadcast_arrays(q, np.asarray(0.0 if p is None else p, dtype=float))
+        j = np.clip(np.searchsorted(params, p, side="right") - 1, 0, len(params) - 2)
+        w = (p - params[j]) / (params[j + 1] - params[j])
+        w = np.where((p < params[0]) | (p > params[-1]), np.nan, w)
+        lower = np.full(q.shape, np.nan)
+        upper = np.full(q.shape, np.nan)
+        for k, (u, v) in enumerate(curves):
+            sel = j == k
+            lower[sel] = _interp_curve(u, v, q[sel])
+            sel = j + 1 == k
+            upper[sel] = _interp_curve(u, v, q[sel])
+        # at the curves (w = 0 or 1) the other curve may be out of range
+        out = np.where(w == 0.0, lower, np.where(w == 1.0, upper, (1.0 - w) * lower + w * upper))
+        return _untransform(out, s_out)[()]
+
+    def read(self, x, p=None):
+        """Reads y at x (on the curve p)."""
+        return self._query(x, p, inverse=False)
+
+    def read_inverse(self, y, p=None):
+        """Reads x at y (on the curve p)."""
+        return self._query(y, p, inverse=True)
+
+
+def list_charts(chart_dir=None):
+    """Returns the names of the charts available in chart_dir (default CHART_DIR)."""
+    chart_dir = CHART_DIR if chart_dir is None else chart_dir
+    return sorted(os.path.splitext(f)[0] for f in os.listdir(chart_dir) if f.endswith(".npz"))
+
+
+@functools.lru_cache(maxsize=None)
+def get_chart(name, chart_dir=None):
+    """Returns the chart name (a Chart; its data is loaded on first use)."""
+    chart_dir = CHART_DIR if chart_dir is None else chart_dir
+    path = os.path.join(chart_dir, name + ".npz")
+    if not os.path.exists(path):
+        raise KeyError(f"unknown chart {name!r}; available: {', '.join(list_charts(chart_dir))}")
+    return Chart(path)
@@ -0,0 +1,236 @@
+"""Granular (stone) columns: unit cell, stress concentration and consolidation.
+
+The functions follow tutw07/tutw07_e1.py and tutw07/tutw07_e2.py and
+accept scalars or arrays (broadcast together).
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .radial import calc_Fnd
+
+# Results of simulate_column_settlement: arrays over chainage × sublayer
+# (mu, S without and S_composite with columns [m]) and the settlement
+# St [m] over chainage × time t [s]
+ColumnSettlement = namedtuple("ColumnSettlement", "t mu S S_composite St")
+
+
+def calc_area_repl_ratio(dc, s, triangular_pattern=False):
+    """Calculates the area replacement ratio of columns of diameter dc and spacing s."""
+    C = np.where(triangular_pattern, np.pi / (2.0 * np.sqrt(3.0)), np.pi / 4.0)
+    return C * (np.asarray(dc, dtype=float) / s) ** 2.0
+
+
+def calc_spacing_given_area_repl_ratio(dc, a_s, triangular_pattern=False):
+    """Calculates the spacing of columns of diameter dc giving the area replacement ratio a_s."""
+    C = np.where(triangular_pattern, np.pi / (2.0 * np.sqrt(3.0)), np.pi / 4.0)
+    return dc / np.sqrt(np.asarray(a_s, dtype=float) / C)
+
+
+def calc_de_column(s, triangular_pattern=False):
+    """Calculates the diameter of the unit cell (1.05 s triangular, 1.13 s square)."""
+    C = np.where(triangular_pattern, np.sqrt(2.0 * np.sqrt(3.0) / np.pi), 2.0 / np.sqrt(np.pi))
+    return C * s
+
+
+def calc_composite_qult(qult_col, qult_soil, a_s):
+    """Calculates the bearing capacity of the composite foundation."""
+    return qult_col * a_s + qult_soil * (1.0 - a_s)
+
+
+def calc_stress_concentration_ratio(Ec, Es):
+    """Calculates the stress concentration ratio n = 1 + 0.217 (Ec/Es - 1).
+
+    The modulus ratio is limited to 20 and n to 5."""
+    modulus_ratio = np.minimum(np.asarray(Ec, dtype=float) / Es, 20.0)
+    return np.minimum(1.0 + 0.217 * (modulus_ratio - 1.0), 5.0)
+
+
+def calc_stress_reduction_factor(a_s, n):
+    """Calculates the stress reduction factor mu = 1 / (1 + a_s (n - 1))."""
+    return 1.0 / (1.0 + a_s * (n - 1.0))
+
+
+def calc_mv_given_E(E, nu):
+    """Calculates the coefficient of volume compressibility mv = (1 + ν)(1 - 2ν) / (E (1 - ν))."""
+    return (1.0 + nu) * (1.0 - 2.0 * nu) / (np.asarray(E, dtype=float) * (1.0 - nu))
+
+
+def calc_column_permeability(D10, por, P200):
+    """Calculates the permeability [m/s] of the column given D10 [mm], porosity and fines [%]."""
+    return 2.19 * (D10 ** 1.478) * (por ** 6.654) / (P200 ** 0.597)
+
+
+def calc_consolidation_multiplier(n, Nd):
+    """Calculates the factor 1 + n / (Nd² - 1) of the modified coefficients of consolidation."""
+    return 1.0 + n / (np.asarray(Nd, dtype=float) ** 2.0 - 1.0)
+
+
+# standard column spacings [m]
+STANDARD_SPACINGS = np.round(np.arange(0.8, 3.0 + 1e-9, 0.1), 2)
+
+# fields of the results of iter_footing_designs (lengths in m, load in kN,
+# pressures in kPa); s is nan if no standard spacing meets FS_required and
+# inf if the natural ground meets it (no columns: a_s = 0, qult = qult_soil)
+FOOTING_DESIGN_DTYPE = np.dtype(
+    [
+        ("footing", int),
+        ("width", float),
+        ("depth", float),
+        ("load", float),
+        ("dc", float),
+        ("pressure", float),
+        ("qult_soil", float),
+        ("s", float),
+        ("a_s", float),
+        ("qult", float),
+        ("FS", float),
+    ]
+)
+
+
+def calc_qult_soil(cu, B, L, Df, sig_overb_eff, Nc=5.14, Nq=1.0):
+    """Calculates the undrained bearing capacity of the natural ground with shape and depth factors."""
+    sc = 1.0 + 0.2 * np.asarray(B, dtype=float) / L
+    dc = 1.0 + 0.2 * np.asarray(Df, dtype=float) / B
+    return cu * Nc * sc * dc + sig_overb_eff * Nq
+
+
+def calc_spacing_given_qult_required(dc, qult_req, qult_col, qult_soil, triangular_pattern=False):
+    """Calculates the largest spacing giving the composite bearing capacity qult_req.
+
+    inf if the natural ground is enough and nan if even touching columns
+    (a_s = 1) are not enough."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a_s = (qult_req - qult_soil) / (qult_col - qult_soil)
+        s = calc_spacing_given_area_repl_ratio(dc, a_s, triangular_pattern)
+    return np.where(a_s <= 0.0, np.inf, np.where(a_s <= 1.0, s, np.nan))
+
+
+def iter_footing_designs(
+    width,
+    depth,
+    load,
+    dc,
+    cu,
+    gamma_dry,
+    gamma_wet,
+    z_water,
+    FS_required=2.5,
+    length=None,
+    triangular_pattern=True,
+    spacings=STANDARD_SPACINGS,
+    qult_col=None,
+    chunk_size=65536,
+):
+    """Yields the largest standard spacing of granular columns for each footing and column diameter.
+
+    width, depth and load (applied load plus footing weight [kN]) have one
+    value per footing (length defaults to width, i.e. square footings); dc
+    is a sequence of column diameters. The soil data (cu [kPa], unit
+    weights [kN/m³], depth of the water table [m]) is as in tutw07_e1.py,
+    with qult_col = 20 cu by default. The spacing is the largest value of
+    spacings that meets FS_required (step 8 of tutw07_e1.py, without the
+    manual selection); spacings smaller than the column diameter are not
+    allowed. Where the natural ground already meets FS_required, no
+    columns are needed: s = inf, a_s = 0 and qult = qult_soil.
+
+    The results of all footings × diameters are yielded as structured
+    arrays (FOOTING_DESIGN_DTYPE) of at most chunk_size rows."""
+    width, depth, load = np.broadcast_arrays(*(np.asarray(v, dtype=float).ravel() for v in (width, depth, load)))
+    length = width if length is None else np.broadcast_to(np.asarray(length, dtype=float).ravel(), width.shape)
+    dc = np.asarray(dc, dtype=float).ravel()
+    spacings = np.sort(np.asarray(spacings, dtype=float))
+    qult_col = 20.0 * cu if qult_col is None else qult_col
+    total = len(width) * len(dc)
+    for start in range(0, total, chunk_size):
+        i, j = np.divmod(np.arange(start, min(start + chunk_size, total)), len(dc))
+        B, L, Df, Q, d = width[i], length[i], depth[i], load[i], dc[j]
+
+        # pressure and bearing capacity of the natural ground
+        pressure = Q / (B * L)
+        sig_overb_eff = gamma_dry * np.minimum(Df, z_water) + (gamma_wet - 9.81) * np.maximum(Df - z_water, 0.0)
+        qult_soil = calc_qult_soil(cu, B, L, Df, sig_overb_eff)
+
+        # largest standard spacing not greater than the required one
+        s_max = calc_spacing_given_qult_required(d, FS_required * pressure, qult_col, qult_soil, triangular_pattern)
+        k = np.searchsorted(spacings, np.nan_to_num(s_max, nan=-1.0, posinf=np.inf) * (1.0 + 1e-12), side="right") - 1
+        s = np.where(k >= 0, spacings[np.maximum(k, 0)], np.nan)
+        s = np.where(s >= d, s, np.nan)
+        s = np.where(np.isposinf(s_max), np.inf, s)
+
+        res = np.empty(len(i), dtype=FOOTING_DESIGN_DTYPE)
+        res["footing"], res["width"], res["depth"], res["load"], res["dc"] = i, B, Df, Q, d
+        res["pressure"], res["qult_soil"], res["s"] = pressure, qult_soil, s
+        res["a_s"] = np.where(np.isposinf(s), 0.0, calc_area_repl_ratio(d, s, triangular_pattern))
+        res["qult"] = calc_composite_qult(qult_col, qult_soil, res["a_s"])
+        res["FS"] = res["qult"] / pressure
+        yield res
+
+
+def design_footings(*args, **kwargs):
+    """Returns all the results of iter_footing_designs in a single structured array."""
+    return np.concatenate(list(iter_footing_designs(*args, **kwargs)))
+
+
+def simulate_column_settlement(t, h, Dsigz, Es, kv, kr, dc, s, Ec, nus=0.3, hdr=None, triangular_pattern=False, F=None, max_points=2 ** 20):
+    """Calculates the settlement versus time of stone-column improved ground at many chainages.
+
+    The soil data h (thickness of each sublayer [m]), Es [kPa], kv and kr
+    [m/s] and the stress increase Dsigz [kPa] are arrays over chainage ×
+    sublayer (broadcast together, e.g. h with shape (nlayers,) and Dsigz
+    with shape (nchainages, 1)); the column data dc, s [m] and Ec [kPa]
+    may also vary per chainage or sublayer. As in tutw07_e2.py, each
+    sublayer gets mu (with the caps of calc_stress_concentration_ratio),
+    S_composite = mu mv Dsigz h and the modified coefficients cvm and crm,
+    and settles as Uvr(t) S_composite with Uv from the Terzaghi
+    approximation (drainage length hdr: a value or one value per chainage,
+    broadcast against the sublayer axis; by default the thickness of the
+    profile, i.e. one-way drainage) and Ur from Barron's solution (or the
+    factors F, e.g. from calc_Fnd_smear). The settlement of each chainage
+    is the sum over its sublayers.
+
+    The times t [s] are processed in chunks such that the work array
+    (chainages × sublayers × times) has at most max_points entries."""
+    arrays = np.broadcast_arrays(*(np.atleast_2d(np.asarray(v, dtype=float)) for v in (h, Dsigz, Es, kv, kr, dc, s, Ec)))
+    h, Dsigz, Es, kv, kr, dc, s, Ec = arrays
+    t = np.asarray(t, dtype=float).ravel()
+    if hdr is None:
+        hdr = h.sum(axis=1, keepdims=True)
+    else:
+        hdr = np.asarray(hdr, dtype=float)
+        hdr = hdr[:, None] if hdr.ndim == 1 else hdr
+
+    # settlement of each sublayer
+    mvs = calc_mv_given_E(Es, nus)
+    a_s = calc_area_repl_ratio(dc, s, triangular_pattern)
+    n = calc_stress_concentration_ratio(Ec, Es)
+    mu = calc_stress_reduction_factor(a_s, n)
+    S = mvs * Dsigz * h
+    S_composite = mu * S
+
+    # rates: Tv = bv t and ln(1 - Ur) = rate t
+    de = calc_de_column(s, triangular_pattern)
+    Nd = de / dc
+    multiplier = calc_consolidation_multiplier(n, Nd)
+    cvm = kv / (9.81 * mvs) * multiplier
+    crm = kr / (9.81 * mvs) * multiplier
+    F = calc_Fnd(Nd) if F is None else F
+    bv = (cvm / hdr ** 2.0)[..., None]
+    rate = (-8.0 * crm / (de ** 2.0 * F))[..., None]
+
+    # settlement versus time, chunk by chunk: St = sum(S_composite (1 - (1 - Uv)(1 - Ur)))
+    # where, for Tv > 0.217, ln(1 - Uv) = ln(10) (1.781 - Tv) / 0.933 - ln(100)
+    # (consolid_calc_Uv_given_Tv) is merged into the exponent of 1 - Ur
+    slope, c0 = np.log(10.0) / 0.933, np.log(10.0) * 1.781 / 0.933 - np.log(100.0)
+    St = np.empty((h.shape[0], len(t)))
+    chunk = max(1, max_points // h.size)
+    for start in range(0, len(t), chunk):
+        tc = t[start : start + chunk]
+        Tv = bv * tc
+        high = Tv > 0.217
+        remaining = np.exp(rate * tc + np.where(high, c0 - slope * Tv, 0.0))
+        remaining *= np.where(high, 1.0, 1.0 - 2.0 * np.sqrt(Tv / np.pi))
+        St[:, start : start + chunk] = S_composite.sum(axis=1)[:, None] - np.einsum("cl,clt->ct", S_composite, remaining)
+    return ColumnSettlement(t, mu, S, S_composite, St)
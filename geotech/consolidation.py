@@ -0,0 +1,135 @@
+"""Terzaghi one-dimensional consolidation: Uv(Tv) and Tv(Uv).
+
+All functions accept scalars or NumPy arrays (any shape) and return
+results with the same shape as the input. Powers are computed with
+np.float_power (libm pow), thus the results are bit-identical to the
+scalar formulas applied element by element.
+"""
+
+import numpy as np
+
+# number of points evaluated at once by the Fourier series
+# (bounds the size of the terms × points work array)
+SERIES_CHUNK = 8192
+
+
+# 1
+def consolid_calc_Tv_given_Uv(Uv):
+    """Calculates Tv, given Uv, using the approximation formula."""
+    Uv = np.asarray(Uv, dtype=float)
+    Tv = np.empty_like(Uv)
+    low = Uv <= 0.526
+    high = ~low
+    Tv[low] = (np.pi / 4.0) * np.float_power(Uv[low], 2.0)
+    Tv[high] = -0.085 - 0.933 * np.log10(1.0 - Uv[high])
+    return Tv[()]
+
+
+# 2
+def consolid_calc_Uv_given_Tv(Tv):
+    """Calculate Uv, given Tv, using the approximation formula."""
+    Tv = np.asarray(Tv, dtype=float)
+    Uv = np.empty_like(Tv)
+    low = Tv <= 0.217
+    high = ~low
+    Uv[low] = 2.0 * np.sqrt(Tv[low] / np.pi)
+    a = (1.781 - Tv[high]) / 0.933
+    Uv[high] = 1.0 - np.float_power(10.0, a) / 100.0
+    return Uv[()]
+
+
+# 3
+def consolid_calc_Uv_given_Tv_series(Tv, nseries=100):
+    """Calculate Uv @ time Tv, using the (truncated) Fourier series.
+    nseries is the number of terms in the series [optional]"""
+    Tv = np.asarray(Tv, dtype=float)
+    M = (2.0 * np.arange(nseries) + 1.0) * np.pi / 2.0
+    MM = (M * M)[:, None]
+
+    # the terms are summed along the first axis, one row after another,
+    # thus the result is identical to the scalar loop over m
+    flat = Tv.ravel()
+    Uv = np.empty_like(flat)
+    for i in range(0, flat.size, SERIES_CHUNK):
+        terms = 2.0 * np.exp(-MM * flat[i : i + SERIES_CHUNK]) / MM
+        Uv[i : i + SERIES_CHUNK] = 1.0 - np.add.reduce(terms, axis=0)
+    return Uv.reshape(Tv.shape)[()]
+
+
+# 4
+def consolid_calc_nterms_fourier(Tv, tol):
+    """Number of Fourier terms such that the tail of the series is below tol.
+
+    The tail after K terms satisfies
+        sum_{m>=K} 2 exp(-M²Tv) / M²  <=  2 exp(-M_K² Tv) / (π² K)
+    thus K is the smallest integer (≥ 1) with M_K² Tv >= ln(2 / (π² tol))."""
+    Tv = np.asarray(Tv, dtype=float)
+    L = np.log(2.0 / (np.pi ** 2 * tol))
+    with np.errstate(divide="ignore"):
+        MK = np.sqrt(np.maximum(L, 0.0) / Tv)
+    K = np.ceil((2.0 * MK / np.pi - 1.0) / 2.0)
+    return np.maximum(K, 1.0).astype(np.int64)[()]
+
+
+# 5
+def consolid_calc_nterms_short_time(Tv, tol):
+    """Number of terms of the short-time (ierfc) series such that the
+    first omitted term, 4 √(Tv/π) exp(-(N+1)²/Tv), is below tol."""
+    Tv = np.asarray(Tv, dtype=float)
+    with np.errstate(divide="ignore"):
+        L = np.log(4.0 * np.sqrt(Tv / np.pi) / tol)
+    N = np.ceil(np.sqrt(Tv * np.maximum(L, 0.0)) - 1.0)
+    return np.maximum(N, 0.0).astype(np.int64)[()]
+
+
+# 6
+def consolid_calc_Uv_given_Tv_adaptive(Tv, tol=1e-10, Tv_switch=0.1, return_nterms=False):
+    """Calculate Uv @ time Tv with an error below tol (absolute).
+
+    For Tv > Tv_switch, the Fourier series is truncated individually for
+    each point using the tail bound (see consolid_calc_nterms_fourier).
+    For Tv <= Tv_switch, the short-time solution (Crank, Eq. 4.18)
+        Uv = 2 √Tv [1/√π + 2 sum_{n>=1} (-1)^n ierfc(n/√Tv)]
+    is used instead; it is an alternating series, thus the error is
+    bounded by the first omitted term.
+
+    If return_nterms is True, also returns the number of terms used at
+    each point (i.e., the number of exp or erfc evaluations)."""
+    from scipy.special import erfc
+
+    Tv = np.asarray(Tv, dtype=float)
+    flat = Tv.ravel()
+    Uv = np.empty_like(flat)
+    nterms = np.zeros(flat.shape, dtype=np.int64)
+
+    # Fourier series (long-time) with per-point truncation
+    long = flat > Tv_switch
+    T = flat[long]
+    K = consolid_calc_nterms_fourier(T, tol).reshape(T.shape)
+    sumx = np.zeros_like(T)
+    for m in range(K.max(initial=0)):
+        active = K > m
+        M = (2.0 * m + 1.0) * np.pi / 2.0
+        MM = M * M
+        sumx[active] += 2.0 * np.exp(-MM * T[active]) / MM
+    Uv[long] = 1.0 - sumx
+    nterms[long] = K
+
+    # short-time series
+    short = ~long
+    T = flat[short]
+    N = consolid_calc_nterms_short_time(T, tol).reshape(T.shape)
+    sqT = np.sqrt(T)
+    sumx = np.zeros_like(T)
+    for n in range(1, N.max(initial=0) + 1):
+        active = N >= n
+        x = n / sqT[active]
+        ierfc = np.exp(-x * x) / np.sqrt(np.pi) - x * erfc(x)
+        sumx[active] += (-1.0) ** n * ierfc
+    Uv[short] = 2.0 * sqT * (1.0 / np.sqrt(np.pi) + 2.0 * sumx)
+    nterms[short] = N
+
+    Uv = Uv.reshape(Tv.shape)[()]
+    if return_nterms:
+        return Uv, nterms.reshape(Tv.shape)[()]
+    return Uv
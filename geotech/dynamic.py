@@ -0,0 +1,262 @@
+"""Dynamic compaction: drop-point layout over a site.
+
+Generalises tutw04/tutw04_e1.py from one drop point to the whole site.
+The drop points of each high-energy pass lie on a square grid of spacing
+s = spacing_factor × tamper diameter inside a polygonal boundary, the
+points of the odd passes at the centres of the squares of the even ones.
+The depth of improvement Di may vary over the site, thus the energy per
+blow, drop height, number of drops and crater depth are evaluated at each
+point (all points at once):
+
+    Ed = (Di / nc)²  [tf-m],  Hd = ⌈Ed / W⌉
+    AE_HEP = (UAE Di - UAE_IP d_IP) / Np   (Equation 3.21)
+    Nd = ⌈AE_HEP s² / (W g Hd)⌉
+    d_cd = 0.028 Nd^0.55 √(W Hd)
+
+with the tamper weight W in tf. The ironing pass covers the whole area
+with the energy AE_IP = UAE_IP d_IP per unit area.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .tables import write_table
+
+GRAVITY = 9.81  # m/s², kN per tf
+
+# fields of the drop schedule (coordinates and depths in m, energy in kJ,
+# crater volume in m³); ok is False where the crater is deeper than allowed
+DROP_SCHEDULE_DTYPE = np.dtype(
+    [
+        ("pass", int),
+        ("x", float),
+        ("y", float),
+        ("Di", float),
+        ("Ed", float),
+        ("Hd", float),
+        ("Nd", int),
+        ("crater_depth", float),
+        ("ok", bool),
+        ("energy", float),
+        ("crater_volume", float),
+    ]
+)
+
+# fields of the totals of each pass (energy in kJ, volume in m³)
+DROP_PASS_DTYPE = np.dtype(
+    [
+        ("pass", int),
+        ("points", int),
+        ("drops", int),
+        ("energy", float),
+        ("crater_volume", float),
+        ("max_crater_depth", float),
+        ("not_ok", int),
+    ]
+)
+
+# fields of the results of search_rigs (index of the catalog entry, tamper
+# weight in tf, lengths in m, drops summed over the site and all passes)
+RIG_OPTION_DTYPE = np.dtype(
+    [
+        ("entry", int),
+        ("weight", float),
+        ("diameter", float),
+        ("spacing_factor", float),
+        ("npasses", int),
+        ("s", float),
+        ("Hd", float),
+        ("Nd", int),
+        ("crater_depth", float),
+        ("points", int),
+        ("drops", int),
+    ]
+)
+
+# Results of plan_dynamic_compaction: the drop schedule, the totals of each
+# pass, the site area [m²], the energy of the ironing pass [kJ] and the
+# total energy [kJ] and crater volume [m³] of all passes
+DCPlan = namedtuple("DCPlan", "schedule passes area ironing_energy total_energy crater_volume")
+
+
+def calc_energy_per_blow(Di, nc):
+    """Calculates the energy per blow [tf-m] needed for a depth of improvement Di."""
+    return (np.asarray(Di, dtype=float) / nc) ** 2.0
+
+
+def calc_drop_height(Ed_tfm, tamper_weight_tf):
+    """Calculates the drop height [m] (rounded up to whole metres)."""
+    return np.ceil(Ed_tfm / tamper_weight_tf)
+
+
+def calc_number_of_drops(AE_HEP, Ae, tamper_weight_tf, Hd):
+    """Calculates the number of drops at each point giving the energy AE_HEP [kJ/m²] over Ae [m²]."""
+    return np.ceil(AE_HEP * Ae / (tamper_weight_tf * GRAVITY * Hd)).astype(int)
+
+
+def calc_crater_depth(Nd, tamper_weight_tf, Hd):
+    """Estimates the crater depth [m] after Nd drops."""
+    return 0.028 * (Nd ** 0.55) * np.sqrt(tamper_weight_tf * Hd)
+
+
+def calc_polygon_area(polygon):
+    """Calculates the area of a polygon given by its vertices (shoelace formula)."""
+    x, y = np.asarray(polygon, dtype=float).T
+    return 0.5 * abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+
+def points_in_polygon(x, y, polygon):
+    """Returns a mask of the points (x, y) inside a polygon (even-odd rule).
+
+    The loop runs over the edges; each edge is tested against all points."""
+    vertices = np.asarray(polygon, dtype=float)
+    inside = np.zeros(np.shape(x), dtype=bool)
+    for (xa, ya), (xb, yb) in zip(vertices, np.roll(vertices, -1, axis=0)):
+        crosses = (ya > y) != (yb > y)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_cross = xa + (y - ya) * (xb - xa) / (yb - ya)
+        inside ^= crosses & (x < x_cross)
+    return inside
+
+
+def make_drop_grid(polygon, s, npasses=2, origin=None):
+    """Returns the pass number and coordinates of the drop points inside a polygon.
+
+    The points of pass 0 lie on a square grid of spacing s starting at
+    origin (default: half a spacing from the lower-left corner of the
+    bounding box); odd passes are shifted by (s/2, s/2)."""
+    vertices = np.asarray(polygon, dtype=float)
+    lo, hi = vertices.min(axis=0), vertices.max(axis=0)
+    x0, y0 = lo + s / 2.0 if origin is None else np.asarray(origin, dtype=float)
+    passes, xs, ys = [], [], []
+    for k in range(npasses):
+        shift = s / 2.0 if k % 2 else 0.0
+        # grid lines covering the bounding box
+        i = np.arange(np.ceil((lo[0] - x0 - shift) / s), np.floor((hi[0] - x0 - shift) / s) + 1)
+        j = np.arange(np.ceil((lo[1] - y0 - shift) / s), np.floor((hi[1] - y0 - shift) / s) + 1)
+        x, y = np.meshgrid(x0 + shift + i * s, y0 + shift + j * s)
+        x, y = x.ravel(), y.ravel()
+        inside = points_in_polygon(x, y, vertices)
+        passes.append(np.full(np.count_nonzero(inside), k))
+        xs.append(x[inside])
+        ys.append(y[inside])
+    return np.concatenate(passes), np.concatenate(xs), np.concatenate(ys)
+
+
+def plan_dynamic_compaction(
+    polygon,
+    Di,
+    tamper_weight_tf,
+    tamper_diameter,
+    tamper_height,
+    nc,
+    UAE,
+    UAE_IP,
+    d_cd_ip,
+    npasses=2,
+    spacing_factor=2.0,
+    origin=None,
+):
+    """Plans the drop points of all high-energy passes over a site.
+
+    polygon is a sequence of (x, y) vertices [m] and Di the depth of
+    improvement [m], either a value or a function Di(x, y) of arrays. The
+    tamper data, nc, UAE and UAE_IP [kJ/m³] and the crater depth of the
+    ironing pass d_cd_ip [m] are as in tutw04_e1.py; npasses is the number
+    of high-energy passes. The crater area is that of the tamper and the
+    allowed crater depth the tamper height plus 0.3 m.
+
+    Returns a DCPlan."""
+    s = spacing_factor * tamper_diameter
+    passes, x, y = make_drop_grid(polygon, s, npasses, origin)
+    Di = np.broadcast_to(np.asarray(Di(x, y) if callable(Di) else Di, dtype=float), x.shape)
+
+    Ed_tfm = calc_energy_per_blow(Di, nc)
+    Hd = calc_drop_height(Ed_tfm, tamper_weight_tf)
+    AE_HEP = (UAE * Di - UAE_IP * d_cd_ip) / npasses
+    Nd = calc_number_of_drops(AE_HEP, s ** 2, tamper_weight_tf, Hd)
+    d_cd = calc_crater_depth(Nd, tamper_weight_tf, Hd)
+    A_crater = np.pi * (tamper_diameter / 2.0) ** 2
+
+    res = np.empty(len(x), dtype=DROP_SCHEDULE_DTYPE)
+    res["pass"], res["x"], res["y"], res["Di"] = passes, x, y, Di
+    res["Ed"] = Ed_tfm * GRAVITY
+    res["Hd"], res["Nd"], res["crater_depth"] = Hd, Nd, d_cd
+    res["ok"] = d_cd <= tamper_height + 0.3
+    res["energy"] = Nd * tamper_weight_tf * GRAVITY * Hd
+    res["crater_volume"] = A_crater * d_cd
+
+    # totals of each pass
+    summary = np.zeros(npasses, dtype=DROP_PASS_DTYPE)
+    summary["pass"] = np.arange(npasses)
+    summary["points"] = np.bincount(passes, minlength=npasses)
+    summary["drops"] = np.bincount(passes, Nd, minlength=npasses)
+    summary["energy"] = np.bincount(passes, res["energy"], minlength=npasses)
+    summary["crater_volume"] = np.bincount(passes, res["crater_volume"], minlength=npasses)
+    np.maximum.at(summary["max_crater_depth"], passes, d_cd)
+    summary["not_ok"] = np.bincount(passes, ~res["ok"], minlength=npasses)
+
+    area = calc_polygon_area(polygon)
+    ironing = UAE_IP * d_cd_ip * area
+    return DCPlan(res, summary, area, ironing, summary["energy"].sum() + ironing, summary["crater_volume"].sum())
+
+
+def search_rigs(
+    catalog,
+    Di,
+    area,
+    nc,
+    UAE,
+    UAE_IP,
+    d_cd_ip,
+    spacing_factors=(1.5, 1.75, 2.0, 2.25, 2.5),
+    npasses=(1, 2, 3),
+):
+    """Finds the feasible combinations of tamper, spacing factor and number of passes.
+
+    catalog maps the column names to arrays (e.g. a dict, a structured
+    array or a DataFrame) with one row per tamper and crane: weight [tf],
+    diameter and height of the tamper [m] and max_drop, the maximum drop
+    height of the crane [m]. Di is the target depth of improvement (the
+    largest one of the site) and area the site area [m²]; the other data
+    is as in plan_dynamic_compaction. All combinations are evaluated at
+    once; options with Hd > max_drop or a crater deeper than the tamper
+    height plus 0.3 m are rejected.
+
+    Returns a structured array (RIG_OPTION_DTYPE) of the feasible options,
+    sorted by the total number of drops (site time), then by the number of
+    passes and drop points."""
+    W = np.asarray(catalog["weight"], dtype=float)[:, None, None]
+    D = np.asarray(catalog["diameter"], dtype=float)[:, None, None]
+    height = np.asarray(catalog["height"], dtype=float)[:, None, None]
+    max_drop = np.asarray(catalog["max_drop"], dtype=float)[:, None, None]
+    factor = np.asarray(spacing_factors, dtype=float)[None, :, None]
+    Np = np.asarray(npasses, dtype=int)[None, None, :]
+
+    # all combinations (entries × spacing factors × passes)
+    Hd = calc_drop_height(calc_energy_per_blow(Di, nc), W)
+    s = factor * D
+    AE_HEP = (UAE * Di - UAE_IP * d_cd_ip) / Np
+    Nd = calc_number_of_drops(AE_HEP, s ** 2, W, Hd)
+    d_cd = calc_crater_depth(Nd, W, Hd)
+    points = np.ceil(area / s ** 2).astype(int)
+    shape = np.broadcast_shapes(W.shape, factor.shape, Np.shape)
+    ok = np.broadcast_to((Hd <= max_drop) & (d_cd <= height + 0.3), shape)
+
+    def pick(values):
+        return np.broadcast_to(values, shape)[ok]
+
+    res = np.empty(np.count_nonzero(ok), dtype=RIG_OPTION_DTYPE)
+    res["entry"] = pick(np.arange(shape[0])[:, None, None])
+    res["weight"], res["diameter"] = pick(W), pick(D)
+    res["spacing_factor"], res["npasses"], res["s"] = pick(factor), pick(Np), pick(s)
+    res["Hd"], res["Nd"], res["crater_depth"] = pick(Hd), pick(Nd), pick(d_cd)
+    res["points"] = pick(points)
+    res["drops"] = res["npasses"] * res["points"] * res["Nd"]
+    return res[np.lexsort((res["points"], res["npasses"], res["drops"]))]
+
+
+def write_schedule(schedule, path):
+    """Writes a drop schedule to a CSV or Parquet file (see geotech.tables.write_table)."""
+    return write_table(path, schedule)
@@ -0,0 +1,196 @@
+"""Numerical solution of 1D (vertical) and axisymmetric (unit cell) consolidation.
+
+The equation
+    mv ∂u/∂t = (1/w) ∂/∂x (w mv cv ∂u/∂x) + mv ∂σ/∂t
+with w = 1 (vertical flow, x = z) or w = r (radial flow in a unit cell,
+x = r) is discretised with finite volumes on the nodes x_0 < ... < x_{n-1}.
+The soil properties cv and mv are given per element (between two nodes),
+thus layer interfaces placed at nodes are represented exactly; see
+make_layered_mesh. Each time step solves the tridiagonal system of the
+θ-scheme (θ = 1: implicit Euler, θ = 0.5: Crank-Nicolson) with
+scipy.linalg.solve_banded, reusing preallocated buffers.
+
+Several soil columns with the same nodes can be solved at once: the
+properties, load histories and initial pressures may have a leading
+dimension (columns); the columns are stacked into one block-tridiagonal
+system per time step.
+
+The load history σ(t) = load_profile q(t) is applied as increments at the
+beginning of each step (the response to a load increment is undrained).
+The degree of consolidation (by settlement) is
+    U = 1 - ∫ mv u w dx / ∫ mv σ w dx.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+# Results of solve_consolidation: times, degree of consolidation at each time
+# (times × columns), output times and pore-water pressures (outputs × columns × nodes);
+# the columns axis is removed when a single column is solved
+FDMResult = namedtuple("FDMResult", "t U t_out u_out")
+
+
+def make_layered_mesh(thickness, cv, mv=1.0, nel=20):
+    """Generates the nodes of a layered profile with nel elements per layer.
+
+    thickness, cv and mv hold one value per layer (from the top); returns
+    the nodes x (depths, from zero) and cv and mv per element."""
+    thickness = np.atleast_1d(np.asarray(thickness, dtype=float))
+    nel = np.broadcast_to(np.asarray(nel, dtype=int), thickness.shape)
+    layer = np.repeat(np.arange(len(thickness)), nel)
+    h = np.repeat(thickness / nel, nel)
+    x = np.concatenate([[0.0], np.cumsum(h)])
+    cv_el = np.broadcast_to(np.asarray(cv, dtype=float), thickness.shape)[layer]
+    mv_el = np.broadcast_to(np.asarray(mv, dtype=float), thickness.shape)[layer]
+    return x, cv_el, mv_el
+
+
+def make_unit_cell_mesh(rw, re, n=101):
+    """Generates n nodes from the drain (rw) to the boundary of the unit cell (re).
+
+    The nodes are geometrically spaced, i.e., refined near the drain where
+    the gradients are large."""
+    return rw * (re / rw) ** np.linspace(0.0, 1.0, n)
+
+
+def _assemble(x, cv, mv, axisymmetric):
+    """Returns the conductances of the elements and the capacities of the nodes (columns × ...)."""
+    xa, xb = x[:-1], x[1:]
+    xm = (xa + xb) / 2.0
+    if axisymmetric:
+        # exact for the steady radial flow within each element
+        D = cv * mv / np.log(xb / xa)
+        Va, Vb = mv * (xm ** 2 - xa ** 2) / 2.0, mv * (xb ** 2 - xm ** 2) / 2.0
+    else:
+        D = cv * mv / (xb - xa)
+        Va, Vb = mv * (xm - xa), mv * (xb - xm)
+    V = np.zeros(D.shape[:-1] + x.shape)
+    V[..., :-1] += Va
+    V[..., 1:] += Vb
+    return D, V
+
+
+def solve_consolidation(
+    x,
+    t,
+    cv,
+    mv=1.0,
+    load=1.0,
+    load_profile=1.0,
+    u0=None,
+    drained=(True, False),
+    axisymmetric=False,
+    theta=1.0,
+    t_out=None,
+):
+    """Solves the consolidation equation with finite differences (volumes).
+
+    x are the nodes [m] (depth z or radius r), t the times [s] (starting at
+    the initial time; the steps may vary) and cv [m²/s] and mv the soil
+    properties per element (scalars, (nel,) or (ncolumns, nel)). The total
+    stress is σ(t) = load_profile q(t), where load holds q at each time
+    ((ntimes,) or (ntimes, ncolumns)) and load_profile the distribution over
+    the nodes. u0 defaults to the undrained response to the load at t[0].
+    drained tells whether the first and the last node are drained (u = 0);
+    otherwise the boundary is impermeable. The pore-water pressures are
+    stored at the times t_out (default: the last time).
+
+    Returns a FDMResult."""
+    from scipy.linalg import solve_banded
+
+    x = np.asarray(x, dtype=float)
+    t = np.asarray(t, dtype=float)
+    n, nt = len(x), len(t)
+    load = np.asarray(load, dtype=float)
+    args = [np.asarray(a, dtype=float) for a in (cv, mv, load_profile)]
+    lead = [a.shape[0] for a in args if a.ndim > 1]
+    if load.ndim > 1:
+        lead.append(load.shape[1])
+    if u0 is not None and np.ndim(u0) > 1:
+        lead.append(np.shape(u0)[0])
+    batched = len(lead) > 0
+    ncols = max(lead, default=1)
+    cv, mv = (np.broadcast_to(a, (ncols, n - 1)) for a in args[:2])
+    profile = np.broadcast_to(args[2], (ncols, n))
+    q = np.broadcast_to(load.reshape((-1, ncols) if load.ndim > 1 else (-1, 1)), (nt, ncols))
+    N = ncols * n
+
+    # conductances (flattened; zero between columns) and capacities
+    D, V = _assemble(x, cv, mv, axisymmetric)
+    Dflat = np.zeros((ncols, n))
+    Dflat[:, :-1] = D
+    Dflat = Dflat.ravel()[:-1]
+    V = V.ravel()
+    diagK = np.zeros(N)
+    diagK[:-1] += Dflat
+    diagK[1:] += Dflat
+    fixed = np.zeros((ncols, n), dtype=bool)
+    fixed[:, 0], fixed[:, -1] = drained
+    fixed = fixed.ravel()
+
+    # initial condition and denominators of U (∫ mv σ w dx per unit q)
+    u = np.array(np.broadcast_to(profile * q[0][:, None] if u0 is None else u0, (ncols, n)), dtype=float).ravel()
+    u[fixed] = 0.0
+    Vsig = (V.reshape(ncols, n) * profile).sum(axis=1)
+    dq = np.diff(q, axis=0)
+    loaded = np.any(dq != 0.0, axis=1)
+
+    # outputs
+    k_out = [nt - 1] if t_out is None else list(np.clip(np.searchsorted(t, t_out), 0, nt - 1))
+    out_index = {}
+    for i, k in enumerate(k_out):
+        out_index.setdefault(k, []).append(i)
+    u_out = np.empty((len(k_out), ncols, n))
+    U = np.empty((nt, ncols))
+
+    def store(k):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            den = Vsig * q[k]
+            U[k] = np.where(den != 0.0, 1.0 - (V * u).reshape(ncols, n).sum(axis=1) / den, 0.0)
+        for i in out_index.get(k, ()):
+            u_out[i] = u.reshape(ncols, n)
+
+    # preallocated buffers: system matrix (reference and work copy), rhs and fluxes
+    ab = np.zeros((3, N))
+    ab_work = np.empty((3, N))
+    rhs = np.empty(N)
+    flux = np.empty(N - 1)
+    Dexp = (1.0 - theta) * Dflat
+    profile = profile.ravel()
+    dt_prev = None
+    store(0)
+    for k in range(1, nt):
+        dt = t[k] - t[k - 1]
+        if dt != dt_prev:
+            # A = V/dt + θ K; rows of drained nodes are replaced by u = 0
+            ab[0, 1:] = -theta * Dflat
+            ab[2, :-1] = -theta * Dflat
+            np.add(V / dt, theta * diagK, out=ab[1])
+            ab[1, fixed] = 1.0
+            ab[0, 1:][fixed[:-1]] = 0.0
+            ab[2, :-1][fixed[1:]] = 0.0
+            Vdt = V / dt
+            dt_prev = dt
+        if loaded[k - 1]:
+            u += profile * np.repeat(dq[k - 1], n)
+            u[fixed] = 0.0
+
+        # rhs = V/dt u - (1 - θ) K u
+        np.multiply(Vdt, u, out=rhs)
+        if theta != 1.0:
+            np.subtract(u[1:], u[:-1], out=flux)
+            flux *= Dexp
+            rhs[:-1] += flux
+            rhs[1:] -= flux
+        rhs[fixed] = 0.0
+
+        np.copyto(ab_work, ab)
+        # the solution may overwrite rhs, thus the buffers are swapped
+        u, rhs = solve_banded((1, 1), ab_work, rhs, overwrite_ab=True, overwrite_b=True, check_finite=False), u
+        store(k)
+
+    t_out = t[k_out]
+    if not batched:
+        return FDMResult(t, U[:, 0], t_out, u_out[:, 0])
+    return FDMResult(t, U, t_out, u_out)
@@ -0,0 +1,190 @@
+"""Liquefaction screening with SPT data (simplified procedure).
+
+Generalises tutw05/tutw05_e2.py from one depth to whole borehole logs.
+The chart readings of the tutorial are replaced by the expressions of the
+NCEER workshop (Youd et al., 2001), which the charts plot:
+
+* rd(z), Figure 2.82 (Liao and Whitman, 1986):
+      rd = 1 - 0.00765 z           for z ≤ 9.15 m
+      rd = 1.174 - 0.0267 z        for 9.15 < z ≤ 23 m
+      rd = 0.744 - 0.008 z         for 23 < z ≤ 30 m
+      rd = 0.5                     below 30 m
+* CRR for M = 7.5, Figure 2.83 (clean-sand base curve):
+      CRR_M75 = 1/(34 - N) + N/135 + 50/(10 N + 45)² - 1/200,  N = (N1)60cs < 30
+  with (N1)60cs = α + β (N1)60 (fines correction) and no liquefaction
+  (CRR = inf) for (N1)60cs ≥ 30.
+
+All functions accept scalars or arrays (broadcast together).
+"""
+
+import numpy as np
+
+GAMMA_WATER = 9.81  # kN/m³
+
+# fields of the results of screen_spt_table, after the borehole (stresses
+# in kPa, depth in m, Dr in %)
+LIQUEFACTION_FIELDS = [
+    ("depth", float),
+    ("sigma_z0", float),
+    ("sigma_z0_eff", float),
+    ("N1_60", float),
+    ("N1_60cs", float),
+    ("Dr", float),
+    ("MSF", float),
+    ("rd", float),
+    ("CRR", float),
+    ("CSR", float),
+    ("FS", float),
+]
+
+
+def Dr_from_SPT(d50, n60, s0eff):
+    """Calculates the relative density [%] using Equation 2.33 (d50 in mm, s0eff in kPa)."""
+    aux1 = (0.23 + 0.06 / d50) ** 1.7
+    aux2 = (100.0 / s0eff) ** 0.5
+    dr = ((n60 * aux1 / 9.0) * aux2) ** 0.5
+    return dr * 100.0  # %
+
+
+def calc_N1_60(N60, sigma_z0_eff, CN_max=1.7):
+    """Calculates the overburden-corrected SPT value N1_60 = CN N60, CN = √(100/σ'v0) ≤ CN_max."""
+    CN = np.minimum(np.sqrt(100.0 / np.asarray(sigma_z0_eff, dtype=float)), CN_max)
+    return CN * N60
+
+
+def calc_N1_60cs(N1_60, fines):
+    """Calculates the clean-sand equivalent N1_60cs = α + β N1_60 (fines content in %)."""
+    FC = np.asarray(fines, dtype=float)
+    with np.errstate(divide="ignore"):
+        alpha = np.where(FC <= 5.0, 0.0, np.where(FC >= 35.0, 5.0, np.exp(1.76 - 190.0 / FC ** 2)))
+        beta = np.where(FC <= 5.0, 1.0, np.where(FC >= 35.0, 1.2, 0.99 + FC ** 1.5 / 1000.0))
+    return alpha + beta * N1_60
+
+
+def calc_MSF(Mw):
+    """Calculates the magnitude scaling factor (as in tutw05_e2.py)."""
+    Mw = np.asarray(Mw, dtype=float)
+    return np.where(Mw < 5.2, 1.82, 6.9 * np.exp(-Mw / 4.0) - 0.06)[()]
+
+
+def calc_rd(z):
+    """Calculates the stress reduction coefficient rd at depth z [m]."""
+    z = np.asarray(z, dtype=float)
+    return np.select(
+        [z <= 9.15, z <= 23.0, z <= 30.0],
+        [1.0 - 0.00765 * z, 1.174 - 0.0267 * z, 0.744 - 0.008 * z],
+        0.5,
+    )[()]
+
+
+def calc_CRR_M75(N1_60cs):
+    """Calculates the cyclic resistance ratio for M = 7.5 (inf if N1_60cs ≥ 30)."""
+    N = np.asarray(N1_60cs, dtype=float)
+    Nc = np.minimum(N, 29.0)
+    CRR = 1.0 / (34.0 - Nc) + Nc / 135.0 + 50.0 / (10.0 * Nc + 45.0) ** 2 - 1.0 / 200.0
+    return np.where(N < 30.0, CRR, np.inf)[()]
+
+
+def calc_N1_60cs_given_CRR_M75(CRR_M75, niter=60):
+    """Calculates the N1_60cs needed to reach CRR_M75 (the inverse read of Figure 2.83).
+
+    The curve is increasing from its minimum near N1_60cs = 0.45 up to 29,
+    thus the equation is solved by bisection on [0.45, 29]; smaller values
+    of CRR_M75 give 0 and values above the curve give 30 (not liquefiable)."""
+    target = np.asarray(CRR_M75, dtype=float)
+    lo = np.full(target.shape, 0.45)
+    hi = np.full(target.shape, 29.0)
+    for _ in range(niter):
+        mid = 0.5 * (lo + hi)
+        below = calc_CRR_M75(mid) < target
+        lo = np.where(below, mid, lo)
+        hi = np.where(below, hi, mid)
+    N = 0.5 * (lo + hi)
+    N = np.where(target <= calc_CRR_M75(0.45), 0.0, N)
+    return np.where(target > calc_CRR_M75(29.0), 30.0, N)[()]
+
+
+def calc_N1_60_given_N1_60cs(N1_60cs, fines):
+    """Calculates N1_60 given the clean-sand equivalent (inverse of calc_N1_60cs)."""
+    alpha = calc_N1_60cs(0.0, fines)
+    beta = calc_N1_60cs(1.0, fines) - alpha
+    return np.maximum((N1_60cs - alpha) / beta, 0.0)
+
+
+def calc_CSR(sigma_z0, sigma_z0_eff, amax_g, rd):
+    """Calculates the cyclic stress ratio CSR = 0.65 rd (σv0/σ'v0) amax/g."""
+    return 0.65 * rd * (sigma_z0 / sigma_z0_eff) * amax_g
+
+
+def calc_overburden(borehole, depth, gamma_dry, gamma_sat, z_water):
+    """Calculates the total and effective vertical stresses of all rows of a set of boreholes.
+
+    The rows must be sorted by borehole and depth. Each row represents the
+    soil from the depth of the previous row of the same borehole (or the
+    surface) down to its depth, with unit weights gamma_dry above and
+    gamma_sat below the water table z_water."""
+    depth = np.asarray(depth, dtype=float)
+    n = len(depth)
+    first = np.ones(n, dtype=bool)
+    first[1:] = borehole[1:] != borehole[:-1]
+    top = np.where(first, 0.0, np.concatenate([[0.0], depth[:-1]]))
+
+    # weight of each interval split at the water table
+    zw = np.broadcast_to(np.asarray(z_water, dtype=float), (n,))
+    dry = np.clip(np.minimum(depth, zw) - top, 0.0, None)
+    increment = gamma_dry * dry + gamma_sat * (depth - top - dry)
+
+    # cumulative sum restarted at each borehole
+    total = np.cumsum(increment)
+    start = np.flatnonzero(first)
+    offset = total[start] - increment[start]
+    sigma_z0 = total - np.repeat(offset, np.diff(np.append(start, n)))
+    u = GAMMA_WATER * np.maximum(depth - zw, 0.0)
+    return sigma_z0, sigma_z0 - u
+
+
+def screen_spt_table(table, Mw, amax_g, d50=None, CN_max=1.7):
+    """Evaluates the liquefaction factor of safety of all rows of an SPT table.
+
+    table maps the column names to arrays (e.g. a dict, a structured array
+    or a DataFrame) with one row per SPT reading: borehole, depth [m], N60,
+    fines [%], gamma_dry and gamma_sat [kN/m³] and z_water (depth of the
+    water table [m]). d50 [mm] (a column "d50" or a value) is only needed
+    for the relative density (Dr = nan otherwise). Mw and amax_g (peak
+    ground acceleration / g) are scalars or one value per row.
+
+    Returns a structured array (borehole and LIQUEFACTION_FIELDS), sorted
+    by borehole and depth. Rows above the water table and rows with
+    N1_60cs ≥ 30 have FS = inf."""
+    borehole = np.asarray(table["borehole"])
+    depth = np.asarray(table["depth"], dtype=float)
+    order = np.lexsort((depth, borehole))
+    borehole, depth = borehole[order], depth[order]
+
+    def column(name):
+        return np.asarray(table[name], dtype=float)[order]
+
+    N60, fines = column("N60"), column("fines")
+    sigma_z0, sigma_z0_eff = calc_overburden(borehole, depth, column("gamma_dry"), column("gamma_sat"), column("z_water"))
+
+    res = np.empty(len(depth), dtype=[("borehole", borehole.dtype)] + LIQUEFACTION_FIELDS)
+    res["borehole"], res["depth"] = borehole, depth
+    res["sigma_z0"], res["sigma_z0_eff"] = sigma_z0, sigma_z0_eff
+    res["N1_60"] = calc_N1_60(N60, sigma_z0_eff, CN_max)
+    res["N1_60cs"] = calc_N1_60cs(res["N1_60"], fines)
+    if d50 is None:
+        try:
+            d50 = column("d50")
+        except (KeyError, ValueError):
+            d50 = np.nan
+    elif np.ndim(d50) > 0:
+        d50 = np.asarray(d50, dtype=float)[order]
+    res["Dr"] = Dr_from_SPT(d50, N60, sigma_z0_eff)
+    res["MSF"] = calc_MSF(Mw if np.ndim(Mw) == 0 else np.asarray(Mw)[order])
+    res["rd"] = calc_rd(depth)
+    res["CRR"] = res["MSF"] * calc_CRR_M75(res["N1_60cs"])
+    amax_g = amax_g if np.ndim(amax_g) == 0 else np.asarray(amax_g, dtype=float)[order]
+    res["CSR"] = calc_CSR(sigma_z0, sigma_z0_eff, amax_g, res["rd"])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        res["FS"] = np.where(depth > column("z_water"), res["CRR"] / res["CSR"], np.inf)
+    return res
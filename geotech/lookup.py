@@ -0,0 +1,228 @@
+"""Precomputed tables for Terzaghi's Uv(Tv) and Tv(Uv).
+
+The tables hold the exact (Fourier/short-time series) solution and are
+built once, saved as .npy files in the cache directory and then opened as
+memory maps. Queries use linear interpolation on uniform grids, thus
+the hot path has no transcendental function calls:
+
+* forward (Tv → Uv): the grid is uniform in s = √Tv, for 0 ≤ Tv ≤ Tv_max;
+  the solution is smooth in s (near zero, Uv ≈ 2 s / √π). For Tv > Tv_max,
+  1 - Uv is below the machine epsilon and Uv = 1 is returned.
+
+* inverse (Uv → Tv): with v = 1 - Uv = m 2^e (m in [0.5, 1), from frexp),
+  each row of the table holds a uniform grid in m for one exponent e.
+  This follows the logarithmic singularity of Tv at Uv → 1 without
+  calling log. All Uv < 1 are covered; Uv ≥ 1 yields inf.
+
+Error bound: linear interpolation of f on a grid with spacing h has an
+error below h² max|f''| / 8; the bound is estimated from the second
+differences of each table by TerzaghiTable.error_bounds().
+"""
+
+import functools
+import os
+
+import numpy as np
+
+from .consolidation import consolid_calc_Tv_given_Uv, consolid_calc_Uv_given_Tv_adaptive
+
+# s = √Tv at the end of the forward table; 1 - Uv(16) ≈ 8e-18
+S_MAX = 4.0
+
+# number of rows of the inverse table (exponents of v = 1 - Uv ≥ 2⁻⁵³)
+N_ROWS = 53
+
+# number of points per chunk in the queries (keeps the work arrays in cache)
+CHUNK = 16384
+
+
+def default_cache_dir():
+    """Returns the directory with the cached tables ($GEOTECH_CACHE or ~/.cache/geotech)."""
+    return os.environ.get("GEOTECH_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "geotech"))
+
+
+def _calc_Uv_and_dUv(Tv):
+    """Calculates Uv and dUv/dTv (exact) for Tv > 0; also returns v = 1 - Uv."""
+    from scipy.special import erfc
+
+    Uv = np.empty_like(Tv)
+    v = np.empty_like(Tv)
+    dUv = np.empty_like(Tv)
+
+    # short-time series (two terms are exact to machine precision for Tv ≤ 0.1)
+    short = Tv <= 0.1
+    T = Tv[short]
+    sqT = np.sqrt(T)
+    U = 1.0 / np.sqrt(np.pi)
+    dU = 1.0
+    for n in (1, 2):
+        x = n / sqT
+        ierfc = np.exp(-x * x) / np.sqrt(np.pi) - x * erfc(x)
+        U = U + 2.0 * (-1.0) ** n * ierfc
+        dU = dU + 2.0 * (-1.0) ** n * np.exp(-x * x)
+    Uv[short] = 2.0 * sqT * U
+    v[short] = 1.0 - Uv[short]
+    dUv[short] = dU / np.sqrt(np.pi * T)
+
+    # Fourier series (twelve terms are exact to machine precision for Tv > 0.1)
+    long = ~short
+    T = Tv[long]
+    M = (2.0 * np.arange(12) + 1.0) * np.pi / 2.0
+    MM = (M * M)[:, None]
+    terms = 2.0 * np.exp(-MM * T)
+    v[long] = np.add.reduce(terms / MM, axis=0)
+    Uv[long] = 1.0 - v[long]
+    dUv[long] = np.add.reduce(terms, axis=0)
+    return Uv, v, dUv
+
+
+def _invert_exact(v_target, niter=30):
+    """Solves 1 - Uv(Tv) = v_target for Tv using Newton's method on ln(v)."""
+    Tv = consolid_calc_Tv_given_Uv(1.0 - v_target)
+    Tv = np.maximum(Tv, 1e-300)
+    ln_target = np.log(v_target)
+    for _ in range(niter):
+        _, v, dUv = _calc_Uv_and_dUv(Tv)
+        # g(Tv) = ln(v) - ln(v_target) and dg/dTv = -dUv/v
+        step = (np.log(v) - ln_target) * v / dUv
+        Tv_new = np.maximum(Tv + step, Tv / 4.0)
+        done = np.all(np.abs(Tv_new - Tv) <= 4.0 * np.finfo(float).eps * Tv)
+        Tv = Tv_new
+        if done:
+            break
+    return Tv
+
+
+def build_forward_table(n):
+    """Computes Uv at the n + 1 points s_i = i S_MAX / n, with Tv = s²."""
+    s = np.linspace(0.0, S_MAX, n + 1)
+    return consolid_calc_Uv_given_Tv_adaptive(s * s, tol=1e-16)
+
+
+def build_inverse_table(nm):
+    """Computes Tv at v = (0.5 + j / (2 nm)) 2⁻ᵇ with b = 0..N_ROWS-1 and j = 0..nm."""
+    m = 0.5 + np.arange(nm + 1) / (2.0 * nm)
+    v = np.ldexp(m[None, :], -np.arange(N_ROWS)[:, None])
+    Tv = np.zeros_like(v)
+    inner = v < 1.0
+    Tv[inner] = _invert_exact(v[inner])
+    return Tv
+
+
+def _load_or_build(path, builder, *args):
+    """Opens the table in path as a memory map, building and saving it if needed."""
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp.npy"
+        np.save(tmp, builder(*args))
+        os.replace(tmp, path)
+    return np.load(path, mmap_mode="r")
+
+
+def _buffers(n):
+    """Allocates the work arrays used by the queries."""
+    return np.empty(n), np.empty(n, dtype=np.intp), np.empty(n), np.empty(n)
+
+
+def _lerp(table, kmax, x, k, a, b, out, offset=None):
+    """Linear interpolation: out = table[k] + (x - k) (table[k+1] - table[k]),
+    with k = min(floor(x), kmax) (+ offset). x, k, a and b are overwritten."""
+    k[...] = x
+    np.minimum(k, kmax, out=k)
+    x -= k
+    if offset is not None:
+        k += offset
+    np.take(table, k, out=a)
+    k += 1
+    np.take(table, k, out=b)
+    b -= a
+    b *= x
+    np.add(a, b, out=out)
+
+
+class TerzaghiTable:
+    """Lookup table for Uv(Tv) and Tv(Uv) (uniform initial excess pore pressure).
+
+    nf is the number of intervals of the forward table and nm is the number
+    of intervals per row of the inverse table. With the defaults, the tables
+    take 8 MB and 14 MB and the interpolation errors are about 1e-12 (Uv)
+    and 5e-11 (Tv); see error_bounds()."""
+
+    def __init__(self, nf=2 ** 20, nm=2 ** 15, cache_dir=None):
+        cache_dir = default_cache_dir() if cache_dir is None else cache_dir
+        self.nf = nf
+        self.nm = nm
+        self.Tv_max = S_MAX ** 2
+        self.Uv_table = _load_or_build(os.path.join(cache_dir, f"terzaghi_Uv_{nf}.npy"), build_forward_table, nf)
+        self.Tv_table = _load_or_build(os.path.join(cache_dir, f"terzaghi_Tv_{N_ROWS}x{nm}.npy"), build_inverse_table, nm)
+        self._Uv_flat = np.asarray(self.Uv_table)
+        self._Tv_flat = np.asarray(self.Tv_table).reshape(-1)
+
+    def Uv_given_Tv(self, Tv):
+        """Calculates Uv, given Tv, by interpolation in the forward table."""
+        Tv = np.asarray(Tv, dtype=float)
+        flat = Tv.ravel()
+        Uv = np.empty_like(flat)
+        x, k, a, b = _buffers(min(flat.size, CHUNK))
+        scale = self.nf / S_MAX
+        for i in range(0, flat.size, CHUNK):
+            T = flat[i : i + CHUNK]
+            n = T.size
+            # x = √Tv scaled to the table index
+            np.fmax(T, 0.0, out=x[:n])
+            np.fmin(x[:n], self.Tv_max, out=x[:n])
+            np.sqrt(x[:n], out=x[:n])
+            x[:n] *= scale
+            _lerp(self._Uv_flat, self.nf - 1, x[:n], k[:n], a[:n], b[:n], Uv[i : i + CHUNK])
+        Uv[np.isnan(flat)] = np.nan
+        return Uv.reshape(Tv.shape)[()]
+
+    def Tv_given_Uv(self, Uv):
+        """Calculates Tv, given Uv, by interpolation in the inverse table."""
+        Uv = np.asarray(Uv, dtype=float)
+        flat = Uv.ravel()
+        Tv = np.empty_like(flat)
+        x, k, a, b = _buffers(min(flat.size, CHUNK))
+        nm = self.nm
+        for i in range(0, flat.size, CHUNK):
+            U = flat[i : i + CHUNK]
+            n = U.size
+            # v = 1 - Uv in [2⁻⁵³, 1 - 2⁻⁵³] split into mantissa and exponent
+            np.fmax(U, 0.0, out=x[:n])
+            np.subtract(1.0, x[:n], out=x[:n])
+            np.clip(x[:n], 2.0 ** -53, 1.0 - 2.0 ** -53, out=x[:n])
+            m, e = np.frexp(x[:n])
+            # x = position in the flattened table: row -e, column (m - 0.5) 2 nm
+            np.subtract(m, 0.5, out=x[:n])
+            x[:n] *= 2 * nm
+            _lerp(self._Tv_flat, nm - 1, x[:n], k[:n], a[:n], b[:n], Tv[i : i + CHUNK], -e * (nm + 1))
+        Tv[flat >= 1.0] = np.inf
+        Tv[np.isnan(flat)] = np.nan
+        return Tv.reshape(Uv.shape)[()]
+
+    def error_bounds(self):
+        """Returns estimates of the maximum interpolation errors of Uv and Tv.
+
+        The bounds are max|Δ²f| / 8, where Δ² is the second difference of the
+        tabulated values (i.e., h² f'' / 8 on each grid), plus the accuracy
+        of the tabulated values themselves (1e-16 for Uv and 4 ε Tv for Tv)."""
+        eps = np.finfo(float).eps
+        d2U = np.abs(np.diff(self.Uv_table, 2)).max()
+        d2T = np.abs(np.diff(self.Tv_table, 2, axis=1)).max()
+        return d2U / 8.0 + 1e-16, d2T / 8.0 + 4.0 * eps * self.Tv_table.max()
+
+
+@functools.lru_cache(maxsize=None)
+def get_table(nf=2 ** 20, nm=2 ** 15):
+    """Returns a TerzaghiTable built (or loaded) once per process."""
+    return TerzaghiTable(nf, nm)
+
+
+def lookup_Uv_given_Tv(Tv):
+    """Calculates Uv, given Tv, using the default table."""
+    return get_table().Uv_given_Tv(Tv)
+
+
+def lookup_Tv_given_Uv(Uv):
+    """Calculates Tv, given Uv, using the default table."""
+    return get_table().Tv_given_Uv(Uv)
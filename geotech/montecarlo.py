@@ -0,0 +1,217 @@
+"""Monte Carlo analysis of the settlement of staged embankments with PVDs.
+
+The uncertain inputs of tutw10/tutw10_e1.py (cv, Cc, e0, Qc and the ratio
+cr/cv, which is also kr/kv) are sampled from user-defined distributions
+and every realization is pushed through S_total, Uv, Ur and the staged
+superposition of geotech.staged, for a fixed construction schedule, at a
+few milestones (e.g. the end of each stage and the opening day).
+
+Realizations are generated in chunks of fixed size, each with its own
+numpy.random.Generator stream spawned from one SeedSequence, thus the
+results depend on the seed and chunk size only (not on the number of
+processes). The settlements of each chunk are added to fixed log-spaced
+histograms (StreamingQuantiles), which are merged across chunks and
+processes; the memory use is constant and the quantiles (e.g. P10, P50
+and P90) are accurate to the bin width (0.046 % with the defaults).
+"""
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .pvd import calc_Ur, calc_Uv, calc_Uvr
+from .staged import SECS_PER_DAY, calc_S_total
+
+# Results of run_settlement_monte_carlo: milestones [day], probabilities q,
+# quantiles (len(q) × milestones) [m], mean and standard deviation [m] and
+# number of realizations
+MonteCarloResult = namedtuple("MonteCarloResult", "milestones q quantiles mean std n")
+
+
+class StreamingQuantiles:
+    """Histograms of several variables (columns) with fixed log-spaced bins.
+
+    Values outside [lo, hi] are counted in the first or last bin. The
+    histograms of different runs are merged with merge (the bins must be
+    equal)."""
+
+    def __init__(self, nvars, lo=1e-4, hi=1e2, nbins=30000):
+        self.edges = np.geomspace(lo, hi, nbins + 1)
+        self.counts = np.zeros((nvars, nbins), dtype=np.int64)
+        self.total = np.zeros(nvars)
+        self.total_sq = np.zeros(nvars)
+        self.n = 0
+
+    def update(self, values):
+        """Adds the rows of values (realizations × variables)."""
+        values = np.asarray(values, dtype=float)
+        nbins = self.counts.shape[1]
+        k = np.clip(np.searchsorted(self.edges, values, side="right") - 1, 0, nbins - 1)
+        # one bincount for all variables (offset by variable)
+        offsets = np.arange(values.shape[1]) * nbins
+        self.counts += np.bincount((k + offsets).ravel(), minlength=self.counts.size).reshape(self.counts.shape)
+        self.total += values.sum(axis=0)
+        self.total_sq += (values ** 2).sum(axis=0)
+        self.n += len(values)
+
+    def merge(self, other):
+        """Adds the histograms of another StreamingQuantiles."""
+        self.counts += other.counts
+        self.total += other.total
+        self.total_sq += other.total_sq
+        self.n += other.n
+
+    def quantile(self, q):
+        """Returns the quantiles q of each variable (len(q) × variables), interpolated in the bins."""
+        q = np.atleast_1d(np.asarray(q, dtype=float))
+        cumulative = np.cumsum(self.counts, axis=1)
+        res = np.empty((len(q), self.counts.shape[0]))
+        for j, c in enumerate(cumulative):
+            target = q * self.n
+            k = np.minimum(np.searchsorted(c, target, side="left"), len(c) - 1)
+            before = np.where(k > 0, c[k - 1], 0)
+            frac = (target - before) / np.maximum(self.counts[j, k], 1)
+            # geometric interpolation within the (log-spaced) bin
+            res[:, j] = self.edges[k] * (self.edges[k + 1] / self.edges[k]) ** np.clip(frac, 0.0, 1.0)
+        return res
+
+    @property
+    def mean(self):
+        return self.total / self.n
+
+    @property
+    def std(self):
+        return np.sqrt(np.maximum(self.total_sq / self.n - self.mean ** 2, 0.0))
+
+
+def sample(rng, spec, n):
+    """Draws n values from a distribution specification.
+
+    spec is a number (fixed value), a function f(rng, n) or a tuple:
+    ("normal", mean, sd), ("lognormal", mean, cov) (mean and coefficient of
+    variation of the variable itself) or ("uniform", lo, hi)."""
+    if callable(spec):
+        return np.asarray(spec(rng, n), dtype=float)
+    if np.isscalar(spec):
+        return np.full(n, float(spec))
+    kind, a, b = spec
+    if kind == "normal":
+        return rng.normal(a, b, n)
+    if kind == "lognormal":
+        sigma2 = np.log1p(b ** 2)
+        return rng.lognormal(np.log(a) - sigma2 / 2.0, np.sqrt(sigma2), n)
+    if kind == "uniform":
+        return rng.uniform(a, b, n)
+    raise ValueError(f"unknown distribution {kind!r}")
+
+
+def calc_staged_settlement(heights, schedule, milestones, bv, br, Fm, gamma_fill, H_soil, Cc, e0, esigz_ini):
+    """Calculates the settlement at the milestones [day] for many realizations at once.
+
+    bv, br, Fm, Cc and e0 have one value per realization; the
+    superposition is the one of simulate_staged_construction. Returns an
+    array (realizations × milestones)."""
+    heights = np.asarray(heights, dtype=float)
+    t = np.asarray(milestones, dtype=float) * SECS_PER_DAY
+    dt = (np.asarray(schedule.t_ini) + np.asarray(schedule.t_fin)) / 2.0 * SECS_PER_DAY
+    applied = t[None, :] >= dt[:, None]  # stages × milestones
+    tau = np.maximum(t[None, :] - dt[:, None], 0.0)
+    bv, br, Fm = (np.asarray(v, dtype=float)[:, None, None] for v in (bv, br, Fm))
+
+    # realizations × stages × milestones; loads not yet applied do not count
+    Uvr_stage = calc_Uvr(calc_Uv(tau, bv), calc_Ur(tau, br, Fm))
+    load = heights[:, None] * applied
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Uvr = np.einsum("rkm,km->rm", Uvr_stage, load) / load.sum(axis=0)
+    Uvr = np.nan_to_num(Uvr)
+    S_total = calc_S_total(heights @ applied, gamma_fill, H_soil, np.asarray(Cc)[:, None], np.asarray(e0)[:, None], esigz_ini)
+    return Uvr * S_total
+
+
+def _run_chunk(args):
+    """Runs one chunk of realizations; returns its StreamingQuantiles."""
+    seed, n, distributions, params = args
+    rng = np.random.default_rng(seed)
+    cv, Cc, e0, Qc, ratio = (sample(rng, distributions[key], n) for key in ("cv", "Cc", "e0", "Qc", "cr_ratio"))
+
+    # as in steps 1, 3 and 4 of tutw10_e1.py
+    hdr, z, de, dc, gamma_water = (params[key] for key in ("hdr", "z", "de", "dc", "gamma_water"))
+    mv = (Cc / (1.0 + e0)) * np.log10(2.0) / 100.0
+    kr = ratio * cv * mv * gamma_water
+    Fm = np.log(de / dc) - 0.75 + np.pi * z * (2.0 * hdr - z) * kr / Qc
+    S = calc_staged_settlement(
+        params["heights"],
+        params["schedule"],
+        params["milestones"],
+        cv / hdr ** 2,
+        ratio * cv / de ** 2,
+        Fm,
+        params["gamma_fill"],
+        params["H_soil"],
+        Cc,
+        e0,
+        params["esigz_ini"],
+    )
+    stats = StreamingQuantiles(S.shape[1], *params["bins"])
+    stats.update(S)
+    return stats
+
+
+def run_settlement_monte_carlo(
+    distributions,
+    heights,
+    schedule,
+    milestones,
+    H_soil,
+    hdr,
+    z,
+    de,
+    dc,
+    gamma_fill,
+    esigz_ini,
+    gamma_water=9.8,
+    n=10 ** 6,
+    q=(0.1, 0.5, 0.9),
+    seed=0,
+    chunk_size=2 ** 16,
+    processes=None,
+    bins=(1e-4, 1e2, 30000),
+):
+    """Estimates the quantiles of the settlement at each milestone.
+
+    distributions maps cv [m²/s], Cc, e0, Qc [m³/s] and cr_ratio (cr/cv)
+    to specifications accepted by sample. heights [m] and schedule (a
+    geotech.staged.Schedule, e.g. from calc_schedule with the nominal
+    values) describe the construction; milestones are times [day]. The
+    other data is as in tutw10_e1.py (de and dc are the diameters of the
+    unit cell and of the drain). With processes > 1, the chunks are run by
+    a process pool.
+
+    Returns a MonteCarloResult."""
+    params = dict(
+        heights=np.asarray(heights, dtype=float),
+        schedule=schedule,
+        milestones=np.asarray(milestones, dtype=float),
+        H_soil=H_soil,
+        hdr=hdr,
+        z=z,
+        de=de,
+        dc=dc,
+        gamma_fill=gamma_fill,
+        esigz_ini=esigz_ini,
+        gamma_water=gamma_water,
+        bins=bins,
+    )
+    sizes = [min(chunk_size, n - start) for start in range(0, n, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = ((s, size, distributions, params) for s, size in zip(seeds, sizes))
+    stats = StreamingQuantiles(len(params["milestones"]), *bins)
+    if processes is not None and processes > 1:
+        with ProcessPoolExecutor(processes) as pool:
+            for res in pool.map(_run_chunk, tasks):
+                stats.merge(res)
+    else:
+        for task in tasks:
+            stats.merge(_run_chunk(task))
+    return MonteCarloResult(params["milestones"], np.asarray(q), stats.quantile(q), stats.mean, stats.std, stats.n)
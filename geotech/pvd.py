@@ -0,0 +1,168 @@
+"""Combined vertical and radial consolidation with prefabricated vertical drains (PVD).
+
+The functions follow tutw10/tutw10_e1.py, with bv = cv / hdr² and
+br = cr / de² as arguments instead of global variables. Here, tau is the
+time (in seconds) measured from the middle of the construction period.
+All arguments may be scalars or arrays (broadcast together).
+"""
+
+import numpy as np
+
+
+def calc_Uv(tau, bv):
+    """Calculates the degree of vertical consolidation Uv (Terzaghi)."""
+    Tv = np.asarray(bv * np.asarray(tau, dtype=float))
+    Uv = np.empty_like(Tv)
+    low = Tv <= 0.217
+    high = ~low
+    Uv[low] = 2.0 * np.sqrt(Tv[low] / np.pi)
+    Uv[high] = 1.0 - 10.0 ** (-(Tv[high] + 0.085) / 0.933)
+    return Uv[()]
+
+
+def calc_Ur(tau, br, Fm):
+    """Calculates the degree of radial consolidation Ur (Hansbo)."""
+    Tr = br * np.asarray(tau, dtype=float)
+    return 1.0 - np.exp(-8.0 * Tr / Fm)
+
+
+def calc_Uvr(Uv, Ur):
+    """Calculates the overall degree of consolidation Uvr."""
+    return 1.0 - (1.0 - Uv) * (1.0 - Ur)
+
+
+def calc_tau_given_Uvr(Uvr, bv, br, Fm, rtol=1e-15, niter=50):
+    """Calculates the time tau at which the degree of consolidation reaches Uvr.
+
+    The equation (1 - Uv)(1 - Ur) = 1 - Uvr is solved in logarithmic form:
+        ln(1 - Uv(tau)) - 8 br tau / Fm = ln(1 - Uvr)
+    For Tv > 0.217, ln(1 - Uv) is linear in tau, thus tau is computed
+    exactly. Otherwise, with x = √tau and a = 2 √(bv/π), the equation
+        f(x) = ln(1 - a x) - c x² - ln(1 - Uvr) = 0,   c = 8 br / Fm
+    is solved with Newton's method starting from the branch boundary
+    x_b = √(0.217/bv). Because f is concave and decreasing, the iterations
+    converge monotonically from the right and never leave [0, x_b].
+
+    Uvr ≤ 0 gives tau = 0 and Uvr ≥ 1 gives tau = inf."""
+    Uvr, bv, br, Fm = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (Uvr, bv, br, Fm)))
+    c = 8.0 * br / Fm
+    with np.errstate(divide="ignore"):
+        L = np.log1p(-np.clip(Uvr, 0.0, 1.0))
+
+    # logarithmic (linear) branch: ln(1 - Uv) = -ln(10) (bv tau + 0.085) / 0.933
+    kv = np.log(10.0) / 0.933
+    tau_b = 0.217 / bv
+    tau = np.asarray(np.maximum((-L - kv * 0.085) / (kv * bv + c), tau_b))
+
+    # square-root branch: the target is reached at or before tau_b
+    a = 2.0 * np.sqrt(bv / np.pi)
+    x_b = np.sqrt(tau_b)
+    low = np.log1p(-a * x_b) - c * tau_b - L <= 0.0
+    a, c, L, x = a[low], c[low], L[low], x_b[low]
+    for _ in range(niter):
+        f = np.log1p(-a * x) - c * x * x - L
+        df = -a / (1.0 - a * x) - 2.0 * c * x
+        dx = f / df
+        x = x - dx
+        if np.all(np.abs(dx) <= rtol * x):
+            break
+    tau[low] = x * x
+    return tau[()]
+
+
+def calc_dc_drain(b, tg):
+    """Calculates the equivalent diameter [m] of a band drain of width b and thickness tg [mm]."""
+    return (np.asarray(b, dtype=float) / 1000.0 + np.asarray(tg, dtype=float) / 1000.0) / 2.0
+
+
+def calc_de_drain(spacing, triangular_pattern=True):
+    """Calculates the equivalent influence diameter [m] (1.06 s triangular, 1.128 s square)."""
+    C = np.where(triangular_pattern, 1.06, 2.0 / np.sqrt(np.pi))
+    return C * spacing
+
+
+def calc_Fm(Nd, z, hdr, kr, Qc, smear_ratio=1.0, kr_ks=1.0):
+    """Calculates Fm (Hansbo) with smear and well resistance.
+
+    Fm = ln(Nd / s) + (kr/ks) ln(s) - 0.75 + π z (2 hdr - z) kr / Qc
+    where s = ds/dc is the smear ratio; s = 1 gives the expression of tutw10."""
+    s = np.asarray(smear_ratio, dtype=float)
+    return np.log(Nd / s) + kr_ks * np.log(s) - 0.75 + np.pi * z * (2.0 * hdr - z) * kr / Qc
+
+
+# fields of the results of iter_pvd_sweep (times in days; cost in drain
+# metres per m² of treated area, times cost_per_m)
+PVD_SWEEP_DTYPE = np.dtype(
+    [
+        ("spacing", float),
+        ("triangular", bool),
+        ("Qc", float),
+        ("b", float),
+        ("smear_ratio", float),
+        ("kr_ks", float),
+        ("Fm", float),
+        ("t80", float),
+        ("t99", float),
+        ("cost", float),
+    ]
+)
+
+
+def iter_pvd_sweep(
+    cv,
+    cr,
+    kr,
+    hdr,
+    z,
+    spacing,
+    triangular=(True,),
+    Qc=(1e-4,),
+    b=(100.0,),
+    smear_ratio=(1.0,),
+    kr_ks=(1.0,),
+    tg=4.0,
+    drain_length=None,
+    cost_per_m=1.0,
+    chunk_size=65536,
+):
+    """Yields the results of all combinations of the PVD design parameters.
+
+    spacing [m], triangular (pattern), Qc [m³/s], b [mm], smear_ratio (ds/dc)
+    and kr_ks (kr/ks) are sequences of values; the results of their Cartesian product are
+    yielded as structured arrays (PVD_SWEEP_DTYPE) of at most chunk_size
+    entries, thus the memory use does not depend on the number of
+    combinations. The soil data (cv, cr [m²/s], kr [m/s], hdr, z [m]) is
+    as in tutw10_e1.py; drain_length defaults to hdr."""
+    from .staged import SECS_PER_DAY  # not at the top: geotech.staged imports this module
+
+    grids = [np.asarray(g, dtype=float).ravel() for g in (spacing, triangular, Qc, b, smear_ratio, kr_ks)]
+    shape = tuple(len(g) for g in grids)
+    length = hdr if drain_length is None else drain_length
+    bv = cv / hdr ** 2
+    total = int(np.prod(shape))
+    for start in range(0, total, chunk_size):
+        idx = np.unravel_index(np.arange(start, min(start + chunk_size, total)), shape)
+        s, tri, q, w, sm, kk = (g[i] for g, i in zip(grids, idx))
+        tri = tri.astype(bool)
+
+        # drain geometry and coefficients
+        de = calc_de_drain(s, tri)
+        Nd = de / calc_dc_drain(w, tg)
+        Fm = calc_Fm(Nd, z, hdr, kr, q, sm, kk)
+        br = cr / de ** 2
+
+        # results
+        res = np.empty(len(s), dtype=PVD_SWEEP_DTYPE)
+        res["spacing"], res["triangular"], res["Qc"], res["b"] = s, tri, q, w
+        res["smear_ratio"], res["kr_ks"] = sm, kk
+        res["Fm"] = Fm
+        res["t80"] = calc_tau_given_Uvr(0.8, bv, br, Fm) / SECS_PER_DAY
+        res["t99"] = calc_tau_given_Uvr(0.99, bv, br, Fm) / SECS_PER_DAY
+        area = np.where(tri, np.sqrt(3.0) / 2.0, 1.0) * s ** 2
+        res["cost"] = cost_per_m * length / area
+        yield res
+
+
+def sweep_pvd_design(*args, **kwargs):
+    """Returns all the results of iter_pvd_sweep in a single structured array."""
+    return np.concatenate(list(iter_pvd_sweep(*args, **kwargs)))
@@ -0,0 +1,131 @@
+"""Consolidation due to radial flow towards drains or stone columns.
+
+The functions follow tutw07/tutw07_e2.py and accept scalars or arrays
+(broadcast together). The factors F(Nd, ...) depend on the unit cell only;
+compute them once per design and reuse them for all times, e.g. with
+calc_Ur_grid, which evaluates (designs × times) grids with one log per
+design and one exp per point.
+
+Besides the closed-form (equal strain) expression Ur = 1 - exp(-8 Tr / F),
+calc_Ur_given_Tr(..., method="bessel") evaluates the exact series solution
+of the radial consolidation equation for an ideal drain (Barron, 1948):
+    Ur = 1 - sum_k A_k exp(-4 Nd² β_k² Tr)
+    A_k = 16 / (π² β_k⁴ (Nd² - 1) (Nd² U0(β_k Nd)² - 4 / (π² β_k²)))
+where U0(x) = J0(x) Y0(β) - Y0(x) J0(β) and the eigenvalues β_k are the
+roots of J1(β Nd) Y0(β) - Y1(β Nd) J0(β) = 0. Both solutions agree except
+at early times, where the closed form is less accurate.
+"""
+
+import functools
+
+import numpy as np
+
+# number of times evaluated at once by the Bessel series
+# (bounds the size of the times × roots work array)
+SERIES_CHUNK = 8192
+
+
+def calc_Fnd(Nd):
+    """Calculates the factor F(Nd) of Barron's solution (no smear)."""
+    Nd = np.asarray(Nd, dtype=float)
+    aux = Nd ** 2.0
+    return np.log(Nd) * aux / (aux - 1.0) - (3.0 * aux - 1.0) / (4.0 * aux)
+
+
+def calc_Fnd_smear(Nd, Ns, kr_ks, kr_kc, hdr_dc):
+    """Calculates the factor F of Han and Ye's solution with smear and well resistance.
+
+    Ns = ds/dc is the smear ratio, kr_ks = kr/ks, kr_kc = kr/kc and
+    hdr_dc = hdr/dc (drainage length over column diameter)."""
+    Nd, Ns = np.asarray(Nd, dtype=float), np.asarray(Ns, dtype=float)
+    NN = Nd ** 2.0
+    m = NN - 1.0
+    a, b = kr_ks, kr_kc
+    c1, d1 = NN / m, np.log(Nd / Ns) + a * np.log(Ns) - 0.75
+    c2, d2 = (Ns ** 2.0) / m, 1.0 - (Ns ** 2.0) / (4.0 * NN)
+    c3, d3 = 1.0 / m, 1.0 - 1.0 / (4.0 * NN)
+    c4, d4 = 32.0 / (np.pi ** 2.0), np.asarray(hdr_dc, dtype=float) ** 2.0
+    return c1 * d1 + c2 * d2 * (1.0 - a) + c3 * d3 * a + c4 * d4 * b
+
+
+@functools.lru_cache(maxsize=256)
+def calc_bessel_roots(Nd, nroots=200):
+    """Returns the first nroots eigenvalues β_k and coefficients A_k of the
+    Bessel series for a given Nd > 1 (cached; the arrays are read-only)."""
+    if not Nd > 1.0:
+        raise ValueError(f"Nd must be greater than 1 (got {Nd})")
+    from scipy.special import j0, j1, y0, y1
+
+    def f(beta):
+        return j1(beta * Nd) * y0(beta) - y1(beta * Nd) * j0(beta)
+
+    # bracket the roots (spaced by about π / (Nd - 1)) by sampling f
+    step = np.pi / (Nd - 1.0) / 32.0
+    beta = step / 4.0 + step * np.arange(32 * (nroots + 2))
+    fb = f(beta)
+    k = np.nonzero(np.sign(fb[:-1]) != np.sign(fb[1:]))[0][:nroots]
+    lo, hi, flo = beta[k], beta[k + 1], fb[k]
+
+    # refine all roots at once by bisection
+    for _ in range(60):
+        mid = (lo + hi) / 2.0
+        fm = f(mid)
+        left = np.sign(fm) == np.sign(flo)
+        lo, flo = np.where(left, mid, lo), np.where(left, fm, flo)
+        hi = np.where(left, hi, mid)
+    beta = (lo + hi) / 2.0
+
+    U0 = j0(beta * Nd) * y0(beta) - y0(beta * Nd) * j0(beta)
+    NN = Nd * Nd
+    A = 16.0 / (np.pi ** 2 * beta ** 4 * (NN - 1.0) * (NN * U0 ** 2 - 4.0 / (np.pi ** 2 * beta ** 2)))
+    beta.setflags(write=False)
+    A.setflags(write=False)
+    return beta, A
+
+
+def _calc_Ur_bessel(Tr, Nd, nroots):
+    """Evaluates the Bessel series for one Nd; times × roots matrix product."""
+    beta, A = calc_bessel_roots(float(Nd), nroots)
+    rate = -4.0 * Nd * Nd * beta ** 2
+    flat = Tr.ravel()
+    Ur = np.empty_like(flat)
+    for i in range(0, flat.size, SERIES_CHUNK):
+        T = flat[i : i + SERIES_CHUNK]
+        # terms with exp(rate T) < exp(-40) at the smallest time are negligible
+        k = max(1, int(np.count_nonzero(rate * T.min() > -40.0)))
+        Ur[i : i + SERIES_CHUNK] = 1.0 - np.exp(np.multiply.outer(T, rate[:k])) @ A[:k]
+    return Ur.reshape(Tr.shape)
+
+
+def calc_Ur_given_Tr(Tr, Nd=None, F=None, method="approx", nroots=200):
+    """Calculates the degree of consolidation due to radial flow.
+
+    method="approx": Ur = 1 - exp(-8 Tr / F). Either Nd (then
+    F = calc_Fnd(Nd), i.e. Barron's solution) or a precomputed F (e.g.
+    from calc_Fnd_smear) must be given.
+
+    method="bessel": exact series solution with nroots terms (Nd must be
+    given; no smear). The truncation error is below sum_{k>nroots} A_k,
+    which is only significant for very small Tr."""
+    if method == "approx":
+        if F is None:
+            F = calc_Fnd(Nd)
+        return 1.0 - np.exp(-8.0 * np.asarray(Tr, dtype=float) / F)
+    if method != "bessel":
+        raise ValueError(f"unknown method {method!r}")
+    Tr, Nd = np.broadcast_arrays(np.asarray(Tr, dtype=float), np.asarray(Nd, dtype=float))
+    Ur = np.empty(Tr.shape)
+    for value in np.unique(Nd):
+        same = Nd == value
+        Ur[same] = _calc_Ur_bessel(Tr[same], value, nroots)
+    return Ur[()]
+
+
+def calc_Ur_grid(t, cr, de, F):
+    """Calculates Ur for each design (rows) and time (columns).
+
+    cr, de and F are arrays with one value per design and t holds the
+    times, thus Tr = cr t / de². The per-design rate -8 cr / (de² F) is
+    computed once and each point costs one multiplication and one exp."""
+    rate = -8.0 * np.asarray(cr, dtype=float) / (np.asarray(de, dtype=float) ** 2.0 * F)
+    return 1.0 - np.exp(np.multiply.outer(rate, np.asarray(t, dtype=float)))
@@ -0,0 +1,190 @@
+"""Reliability of the liquefaction factor of safety (FORM and SORM).
+
+The limit state of tutw05/tutw05_e2.py at each depth of a profile is
+
+    g = FS - 1,   FS = MSF(Mw) CRR_M75(N1_60cs) / (0.65 rd ε_rd (σv0/σ'v0) amax/g)
+
+with the random variables of RELIABILITY_VARIABLES: N60, the unit
+weights, amax_g, Mw and a model factor ε_rd (mean 1) on rd(z). Each
+variable is independent, normal or lognormal, and its mean may vary with
+depth. Above (N1_60)cs = 29 the CRR curve is held constant instead of
+jumping to infinity, which keeps g smooth (and errs on the safe side).
+
+FORM uses the HL-RF iteration in standard normal space; all depths are
+iterated together and the gradients are central finite differences
+evaluated for all depths and variables in one call of the limit state.
+SORM corrects the FORM probability with the main curvatures of the limit
+state at the design point (Breitung, 1984):
+
+    pf = Φ(-β) Π (1 + β κ_i)^(-1/2)
+
+and monte_carlo_pf gives a sampling cross-check.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .liquefaction import GAMMA_WATER, calc_CRR_M75, calc_MSF, calc_N1_60, calc_N1_60cs, calc_rd
+
+RELIABILITY_VARIABLES = ("N60", "gamma_dry", "gamma_sat", "amax_g", "Mw", "rd")
+
+# Results of form_liquefaction, one entry per depth: reliability index,
+# probability of liquefaction (FORM and SORM), design point in standard
+# normal (u) and physical (x) space (depths × variables, in the order of
+# RELIABILITY_VARIABLES), FS at the means, iterations and convergence flag
+FORMResult = namedtuple("FORMResult", "beta pf pf_sorm u x FS_mean niter converged")
+
+
+def _distribution_params(variables, n):
+    """Returns a, b (depths × variables), the lognormal mask of x = a + b u or exp(a + b u) and the means.
+
+    variables maps each name of RELIABILITY_VARIABLES to a tuple (kind,
+    mean, cov) with kind "normal" or "lognormal"; mean and cov may be
+    arrays over depth."""
+    a, b, lognormal, means = np.empty((n, 6)), np.empty((n, 6)), np.zeros(6, dtype=bool), np.empty((n, 6))
+    for j, name in enumerate(RELIABILITY_VARIABLES):
+        kind, mean, cov = variables[name]
+        mean = np.broadcast_to(np.asarray(mean, dtype=float), (n,))
+        cov = np.broadcast_to(np.asarray(cov, dtype=float), (n,))
+        means[:, j] = mean
+        if kind == "normal":
+            a[:, j], b[:, j] = mean, cov * np.abs(mean)
+        elif kind == "lognormal":
+            zeta2 = np.log1p(cov ** 2)
+            a[:, j], b[:, j], lognormal[j] = np.log(mean) - zeta2 / 2.0, np.sqrt(zeta2), True
+        else:
+            raise ValueError(f"unknown distribution {kind!r} of {name}")
+    return a, b, lognormal, means
+
+
+def _to_physical(u, a, b, lognormal):
+    x = a + b * u
+    return np.where(lognormal, np.exp(x), x)
+
+
+def calc_liquefaction_limit_state(x, depth, fines, z_water, CN_max=1.7):
+    """Calculates g = FS - 1 for the variables x (..., 6) at the given depths (broadcast)."""
+    N60, gamma_dry, gamma_sat, amax_g, Mw, eps_rd = np.moveaxis(x, -1, 0)
+    h_dry = np.minimum(depth, z_water)
+    h_wet = np.maximum(depth - z_water, 0.0)
+    sigma_z0 = gamma_dry * h_dry + gamma_sat * h_wet
+    sigma_z0_eff = sigma_z0 - GAMMA_WATER * h_wet
+    N1_60cs = calc_N1_60cs(calc_N1_60(N60, sigma_z0_eff, CN_max), fines)
+    CRR = calc_MSF(Mw) * calc_CRR_M75(np.minimum(N1_60cs, 29.0))
+    CSR = 0.65 * calc_rd(depth) * eps_rd * (sigma_z0 / sigma_z0_eff) * amax_g
+    return CRR / CSR - 1.0
+
+
+def _limit_state_u(a, b, lognormal, depth, fines, z_water, CN_max):
+    """Returns g as a function of u (depths × ... × 6), the data of each depth broadcast over the extra axes."""
+
+    def func(u):
+        extra = (slice(None),) + (None,) * (u.ndim - 2)
+        x = _to_physical(u, a[extra], b[extra], lognormal)
+        return calc_liquefaction_limit_state(x, depth[extra], fines[extra], z_water[extra], CN_max)
+
+    return func
+
+
+def _gradient(func, u, h):
+    """Central differences of func at the rows of u (n × k), all evaluated in one call."""
+    k = u.shape[1]
+    steps = h * np.eye(k)
+    g = func(np.concatenate([u[:, None, :] + steps, u[:, None, :] - steps], axis=1))
+    return (g[:, :k] - g[:, k:]) / (2.0 * h)
+
+
+def _hessian(func, u, h):
+    """Central second differences of func at the rows of u (n × k), all evaluated in one call."""
+    n, k = u.shape
+    e = h * np.eye(k)
+    signs = np.array([(1, 1), (1, -1), (-1, 1), (-1, -1)], dtype=float)
+    # offsets (k × k × 4 × k): ±h e_i ± h e_j
+    offsets = signs[None, None, :, 0, None] * e[:, None, None, :] + signs[None, None, :, 1, None] * e[None, :, None, :]
+    g = func(u[:, None, :] + offsets.reshape(1, -1, k)).reshape(n, k, k, 4)
+    return (g[..., 0] - g[..., 1] - g[..., 2] + g[..., 3]) / (4.0 * h * h)
+
+
+def form_liquefaction(depth, fines, z_water, variables, CN_max=1.7, tol=1e-6, niter=100, h=1e-4, sorm=True):
+    """Calculates the reliability index and the probability of liquefaction at each depth.
+
+    depth [m], fines [%] and z_water [m] are arrays over the profile (or
+    values); variables maps each name of RELIABILITY_VARIABLES to a tuple
+    (kind, mean, cov) with kind "normal" or "lognormal" (mean and cov may
+    be arrays over depth). Depths above the water table get beta = inf
+    and pf = 0; depths not converged after niter iterations are flagged.
+
+    Returns a FORMResult."""
+    from scipy.special import ndtr
+
+    depth, fines, z_water = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float)) for v in (depth, fines, z_water)))
+    n = len(depth)
+    a, b, lognormal, means = _distribution_params(variables, n)
+    data = (depth, fines, z_water)
+
+    def limit_state(i):
+        return _limit_state_u(a[i], b[i], lognormal, *(v[i] for v in data), CN_max)
+
+    # HL-RF iterations, updating only the depths not converged yet
+    u = np.zeros((n, 6))
+    active = depth > z_water
+    converged = ~active
+    count = np.zeros(n, dtype=int)
+    for _ in range(niter):
+        i = np.flatnonzero(~converged)
+        if len(i) == 0:
+            break
+        func, ui = limit_state(i), u[i]
+        g = func(ui[:, None, :])[:, 0]
+        grad = _gradient(func, ui, h)
+        u_new = ((np.einsum("ij,ij->i", grad, ui) - g) / np.einsum("ij,ij->i", grad, grad))[:, None] * grad
+        u[i] = u_new
+        count[i] += 1
+        converged[i] = np.linalg.norm(u_new - ui, axis=1) < tol * np.maximum(1.0, np.linalg.norm(u_new, axis=1))
+
+    # reliability index: negative if the means are already in the failure domain
+    func = limit_state(slice(None))
+    g0 = func(np.zeros((n, 1, 6)))[:, 0]
+    beta = np.where(active, np.sign(g0) * np.linalg.norm(u, axis=1), np.inf)
+    pf = ndtr(-beta)
+    pf_sorm = np.where(active, np.nan, 0.0)
+    i = np.flatnonzero(active)
+    if sorm and len(i):
+        pf_sorm[i] = _sorm_breitung(limit_state(i), u[i], beta[i], 100.0 * h, ndtr)
+    FS_mean = 1.0 + calc_liquefaction_limit_state(means, depth, fines, z_water, CN_max)
+    return FORMResult(beta, pf, pf_sorm, u, _to_physical(u, a, b, lognormal), FS_mean, count, converged)
+
+
+def _sorm_breitung(func, u, beta, h, ndtr):
+    """Calculates the SORM probability at the design points u (n × k)."""
+    n, k = u.shape
+    grad = _gradient(func, u, h)
+    norm = np.linalg.norm(grad, axis=1)
+    H = _hessian(func, u, h)
+
+    # main curvatures: eigenvalues of H / |∇g| in the plane tangent to the limit state
+    alpha = -grad / norm[:, None]
+    basis = np.linalg.qr(np.concatenate([alpha[:, :, None], np.broadcast_to(np.eye(k), (n, k, k))], axis=2))[0][:, :, 1:k]
+    kappa = np.linalg.eigvalsh(np.swapaxes(basis, 1, 2) @ H @ basis) / norm[:, None]
+    factor = 1.0 + beta[:, None] * kappa
+    with np.errstate(invalid="ignore"):
+        return np.where(np.all(factor > 0.0, axis=1), ndtr(-beta) / np.sqrt(np.prod(factor, axis=1)), np.nan)
+
+
+def monte_carlo_pf(depth, fines, z_water, variables, n=10 ** 5, seed=0, chunk_size=2 ** 16, CN_max=1.7):
+    """Estimates the probability of liquefaction at each depth by Monte Carlo sampling.
+
+    Returns the estimates and their standard errors."""
+    depth, fines, z_water = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float)) for v in (depth, fines, z_water)))
+    a, b, lognormal, _ = _distribution_params(variables, len(depth))
+    rng = np.random.default_rng(seed)
+    failures = np.zeros(len(depth))
+    m = max(1, chunk_size // len(depth))
+    for start in range(0, n, m):
+        size = min(m, n - start)
+        u = rng.standard_normal((len(depth), size, 6))
+        x = _to_physical(u, a[:, None], b[:, None], lognormal)
+        failures += np.count_nonzero(calc_liquefaction_limit_state(x, depth[:, None], fines[:, None], z_water[:, None], CN_max) < 0.0, axis=1)
+    pf = np.where(depth > z_water, failures / n, 0.0)
+    return pf, np.sqrt(pf * (1.0 - pf) / n)
@@ -0,0 +1,119 @@
+"""Staged construction of embankments over soft soil with PVDs.
+
+Generalises steps 8 to 16 of tutw10/tutw10_e1.py to any number of stages.
+Each stage is built at a constant rate and its load is assumed to be
+applied instantaneously at the middle of the construction period; the
+responses of all stages are superposed over a time grid in one pass
+(stages × times).
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .pvd import calc_tau_given_Uvr, calc_Ur, calc_Uv, calc_Uvr
+
+SECS_PER_DAY = 24 * 60 * 60.0
+
+# A loading stage: fill height [m], construction rate [m/day] and the
+# waiting criterion after construction (at most one of):
+#   wait_Uvr  -- wait until the degree of consolidation of this stage reaches wait_Uvr
+#   wait_days -- wait for a number of days
+#   until_day -- wait until an absolute time [day]
+Stage = namedtuple("Stage", "height rate wait_Uvr wait_days until_day", defaults=(None, None, None))
+
+# Times [day] of each stage: start and end of construction, end of waiting
+Schedule = namedtuple("Schedule", "t_ini t_fin t_wait")
+
+# Results of simulate_staged_construction; arrays with one entry per time
+# (u and Uvr_stage have shape (nstages, ntimes))
+StagedResult = namedtuple("StagedResult", "schedule t height u Uvr_stage Uvr settlement dcu")
+
+
+def calc_S_total(H_fill, gamma_fill, H_soil, Cc, e0, esigz_ini):
+    """Calculates the total primary settlement due to a fill of height H_fill."""
+    esigz_fin = esigz_ini + gamma_fill * np.asarray(H_fill, dtype=float)
+    return H_soil * Cc * np.log10(esigz_fin / esigz_ini) / (1.0 + e0)
+
+
+def calc_schedule(stages, bv, br, Fm):
+    """Calculates the construction and waiting times of each stage.
+
+    As in tutw10_e1.py, the construction periods and waiting times are
+    rounded up to whole days and each stage starts when the waiting period
+    of the previous one ends."""
+    n = len(stages)
+    t_ini, t_fin, t_wait = np.zeros(n), np.zeros(n), np.zeros(n)
+    t = 0.0
+    for k, stage in enumerate(stages):
+        criteria = [c for c in (stage.wait_Uvr, stage.wait_days, stage.until_day) if c is not None]
+        if len(criteria) > 1:
+            raise ValueError(f"stage {k} has more than one waiting criterion")
+        t_ini[k] = t
+        t_fin[k] = t + np.ceil(stage.height / stage.rate)
+        if stage.wait_Uvr is not None:
+            shift = (t_ini[k] + t_fin[k]) / 2.0 * SECS_PER_DAY
+            tau = calc_tau_given_Uvr(stage.wait_Uvr, bv, br, Fm)
+            t_wait[k] = max(t_fin[k], np.ceil((tau + shift) / SECS_PER_DAY))
+        elif stage.wait_days is not None:
+            t_wait[k] = t_fin[k] + stage.wait_days
+        elif stage.until_day is not None:
+            t_wait[k] = max(t_fin[k], stage.until_day)
+        else:
+            t_wait[k] = t_fin[k]
+        t = t_wait[k]
+    return Schedule(t_ini, t_fin, t_wait)
+
+
+def calc_fill_height(schedule, heights, t_days):
+    """Calculates the height of fill at times t_days (linear during construction)."""
+    t = np.asarray(t_days, dtype=float)[None, :]
+    t_ini, t_fin = schedule.t_ini[:, None], schedule.t_fin[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fraction = np.clip((t - t_ini) / (t_fin - t_ini), 0.0, 1.0)
+    fraction[np.isnan(fraction)] = 1.0
+    return np.asarray(heights, dtype=float) @ fraction
+
+
+def simulate_staged_construction(stages, bv, br, Fm, gamma_fill, H_soil, Cc, e0, esigz_ini, t_days=None, nt=1000):
+    """Simulates the staged construction of an embankment.
+
+    The soil and drain data are the same as in tutw10_e1.py: bv = cv/hdr²
+    and br = cr/de² [1/s], Fm, unit weight of the fill, thickness of clay,
+    compression index, initial void ratio and initial effective stress at
+    the middle of the clay layer. If t_days is None, nt times from zero to
+    the end of the last stage are used.
+
+    The excess pore-water pressure due to stage k is zero before it starts
+    and u_k = H_k gamma_fill (1 - Uvr_k(t - dt_k)) afterwards, where dt_k is
+    the middle of the construction period. The overall degree of
+    consolidation and the settlement consider the loads already applied
+    (t ≥ dt_k):
+        Uvr = 1 - sum(u_k) / sum(u_k_ini),  S = Uvr S_total(sum(H_k))
+    and the strength gain is dcu = 0.25 sum(u_k_ini - u_k)."""
+    schedule = calc_schedule(stages, bv, br, Fm)
+    heights = np.array([stage.height for stage in stages], dtype=float)
+    t = np.linspace(0.0, schedule.t_wait[-1], nt) if t_days is None else np.asarray(t_days, dtype=float)
+
+    # degree of consolidation of each stage (stages × times)
+    dt = (schedule.t_ini + schedule.t_fin) / 2.0 * SECS_PER_DAY
+    tau = np.maximum(t[None, :] * SECS_PER_DAY - dt[:, None], 0.0)
+    Uvr_stage = calc_Uvr(calc_Uv(tau, bv), calc_Ur(tau, br, Fm))
+
+    # excess pore-water pressures
+    started = t[None, :] >= schedule.t_ini[:, None]
+    u = (heights * gamma_fill)[:, None] * started * (1.0 - Uvr_stage)
+
+    # superposition of the loads already applied (t ≥ dt_k)
+    applied = t[None, :] * SECS_PER_DAY >= dt[:, None]
+    u_ini = (heights * gamma_fill)[:, None] * applied
+    sum_u_ini = u_ini.sum(axis=0)
+    sum_u = (u * applied).sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Uvr = np.where(sum_u_ini > 0.0, 1.0 - sum_u / sum_u_ini, 0.0)
+    S_total = calc_S_total(heights @ applied, gamma_fill, H_soil, Cc, e0, esigz_ini)
+    settlement = Uvr * S_total
+    dcu = 0.25 * (sum_u_ini - sum_u)
+
+    height = calc_fill_height(schedule, heights, t)
+    return StagedResult(schedule, t, height, u, Uvr_stage, Uvr, settlement, dcu)
@@ -0,0 +1,170 @@
+"""Search for the fastest feasible staged construction of an embankment.
+
+Automates the design decisions of tutw10/tutw10_e1.py (height of each
+stage and waiting periods). Candidate schedules are built from all
+compositions of the final height in steps of dh and all combinations of
+the given waiting periods, and are evaluated in vectorized batches:
+
+* bearing capacity: before placing stage k, the total height of fill must
+  satisfy gamma_fill H ≤ 5.14 (cu + dcu) / FS, where dcu is the strength
+  gain due to the previous stages (as in steps 6, 11 and 12 of tutw10);
+* settlement: after the last stage is built, the embankment is opened on
+  the first day at which the remaining primary settlement
+  S_total (1 - Uvr) is not greater than S_allowed;
+* deadline: the opening day must not exceed the deadline.
+
+The loads are applied at the middle of each construction period, as in
+geotech.staged.
+"""
+
+import itertools
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .pvd import calc_Ur, calc_Uv, calc_Uvr
+from .staged import SECS_PER_DAY, Stage
+
+# Best schedule found: list of stages (the last one waits until opening),
+# opening day, number of screened and of feasible schedules
+StagedDesign = namedtuple("StagedDesign", "stages t_open nscreened nfeasible")
+
+
+def calc_max_fill_height(cu, dcu, gamma_fill, FS):
+    """Calculates the maximum height of fill allowed by the bearing capacity."""
+    return 5.14 * (cu + dcu) / FS / gamma_fill
+
+
+def _calc_Uvr(tau_days, bv, br, Fm):
+    """Degree of consolidation of a stage loaded tau_days ago (zero if tau_days ≤ 0)."""
+    tau = np.maximum(tau_days, 0.0) * SECS_PER_DAY
+    return calc_Uvr(calc_Uv(tau, bv), calc_Ur(tau, br, Fm))
+
+
+def evaluate_schedules(heights, waits, rate, bv, br, Fm, gamma_fill, cu, FS, Uvr_required, deadline):
+    """Calculates the opening day of a batch of candidate schedules.
+
+    heights has shape (ncandidates, nstages) and waits (ncandidates,
+    nstages - 1) holds the waiting periods [day] after each stage but the
+    last. Uvr_required = 1 - S_allowed / S_total. Returns the opening day
+    of each candidate, or inf if it is not feasible."""
+    heights = np.asarray(heights, dtype=float)
+    waits = np.asarray(waits, dtype=float).reshape(heights.shape[0], -1)
+    nc, n = heights.shape
+
+    # schedule: start, end and middle of the construction of each stage
+    periods = np.ceil(heights / rate)
+    steps = np.concatenate([np.zeros((nc, 1)), periods[:, :-1] + waits], axis=1)
+    t_ini = np.cumsum(steps, axis=1)
+    t_fin = t_ini + periods
+    t_mid = (t_ini + t_fin) / 2.0
+
+    # bearing capacity at the beginning of each stage (candidates × stage k × stage j < k)
+    Uvr_prev = _calc_Uvr(t_ini[:, :, None] - t_mid[:, None, :], bv, br, Fm)
+    Uvr_prev *= np.tri(n, n, -1, dtype=bool)
+    dcu = 0.25 * gamma_fill * np.einsum("ckj,cj->ck", Uvr_prev, heights)
+    H_max = calc_max_fill_height(cu, dcu, gamma_fill, FS)
+    ok = np.all(np.cumsum(heights, axis=1) <= H_max + 1e-12, axis=1)
+
+    # opening day: Uvr increases after the end of construction, thus the first
+    # day with Uvr ≥ Uvr_required is found by bisection (lo fails, hi passes)
+    def reached(t):
+        Uvr_stage = _calc_Uvr(t[:, None] - t_mid, bv, br, Fm)
+        return np.einsum("cj,cj->c", Uvr_stage, heights) / heights.sum(axis=1) >= Uvr_required
+
+    t_end = t_fin[:, -1]
+    done = reached(t_end)
+    ok &= done | reached(np.full(nc, float(deadline)))
+    lo, hi = t_end.copy(), np.maximum(t_end, float(deadline))
+    while np.any(hi - lo > 1.0):
+        mid = np.floor((lo + hi) / 2.0)
+        passed = reached(mid)
+        hi = np.where(passed, mid, hi)
+        lo = np.where(passed, lo, mid)
+    t_open = np.where(done, t_end, hi)
+    return np.where(ok & (t_open <= deadline), t_open, np.inf)
+
+
+def generate_candidates(H_final, nstages, dh, wait_options, batch_size):
+    """Yields batches (heights, waits) of candidate schedules with nstages stages."""
+    units = int(round(H_final / dh))
+    cuts = list(itertools.combinations(range(1, units), nstages - 1))
+    cuts = np.array(cuts, dtype=float).reshape(len(cuts), nstages - 1)
+    waits = list(itertools.product(wait_options, repeat=nstages - 1))
+    waits = np.array(waits, dtype=float).reshape(len(waits), nstages - 1)
+    total = len(cuts) * len(waits)
+    for start in range(0, total, batch_size):
+        i = np.arange(start, min(start + batch_size, total))
+        edges = np.concatenate([np.zeros((len(i), 1)), cuts[i // len(waits)], np.full((len(i), 1), units)], axis=1)
+        yield np.diff(edges, axis=1) * dh, waits[i % len(waits)]
+
+
+def _evaluate_batch(args):
+    """Evaluates one batch and returns (t_open, heights, waits, nscreened, nfeasible) of its best schedule."""
+    heights, waits, params = args
+    t_open = evaluate_schedules(heights, waits, **params)
+    best = np.argmin(t_open)
+    return t_open[best], heights[best], waits[best], len(t_open), int(np.isfinite(t_open).sum())
+
+
+def optimize_staged_construction(
+    H_final,
+    rate,
+    bv,
+    br,
+    Fm,
+    gamma_fill,
+    cu,
+    FS,
+    S_total,
+    S_allowed,
+    deadline,
+    max_stages=4,
+    dh=0.5,
+    wait_options=tuple(range(0, 366, 30)),
+    batch_size=4096,
+    processes=None,
+):
+    """Finds the schedule that opens the embankment earliest.
+
+    H_final is the final height of fill [m], rate the construction rate
+    [m/day], S_total the total primary settlement due to H_final, S_allowed
+    the allowed remaining primary settlement at opening and deadline the
+    latest opening day. Stage heights are multiples of dh and the waiting
+    periods after each stage but the last are taken from wait_options [day].
+    With processes > 1, the batches are evaluated by a process pool.
+
+    Returns a StagedDesign; its stages is None if no schedule is feasible."""
+    params = dict(
+        rate=rate,
+        bv=bv,
+        br=br,
+        Fm=Fm,
+        gamma_fill=gamma_fill,
+        cu=cu,
+        FS=FS,
+        Uvr_required=1.0 - S_allowed / S_total,
+        deadline=deadline,
+    )
+    batches = (
+        (heights, waits, params)
+        for n in range(1, max_stages + 1)
+        for heights, waits in generate_candidates(H_final, n, dh, wait_options, batch_size)
+    )
+    if processes is not None and processes > 1:
+        with ProcessPoolExecutor(processes) as pool:
+            results = list(pool.map(_evaluate_batch, batches))
+    else:
+        results = [_evaluate_batch(batch) for batch in batches]
+
+    # earliest opening; ties are resolved in favour of fewer stages (generated first)
+    t_open, heights, waits, _, _ = min(results, key=lambda r: r[0])
+    nscreened = sum(r[3] for r in results)
+    nfeasible = sum(r[4] for r in results)
+    if not np.isfinite(t_open):
+        return StagedDesign(None, np.inf, nscreened, nfeasible)
+    last = len(heights) - 1
+    stages = [Stage(float(h), rate, wait_days=float(w)) for h, w in zip(heights[:last], waits)]
+    stages.append(Stage(float(heights[last]), rate, until_day=float(t_open)))
+    return StagedDesign(stages, float(t_open), nscreened, nfeasible)
@@ -0,0 +1,55 @@
+"""Writing of result tables (structured arrays) to CSV or Parquet files.
+
+The tables may be given as a sequence (or generator) of chunks, e.g. the
+results of iter_pvd_sweep, which are written as they are produced, thus
+the whole table is never held in memory.
+"""
+
+import os
+
+import numpy as np
+
+
+def _csv_format(dtype):
+    return ",".join("%d" if dtype[name].kind in "iub" else "%s" if dtype[name].kind in "SU" else "%.6g" for name in dtype.names)
+
+
+def write_table(path, chunks, chunk_size=65536):
+    """Writes a structured array, or an iterable of structured arrays with the same dtype, to a file.
+
+    The format follows the extension of path (.csv or .parquet); Parquet
+    files need pyarrow. Returns the number of rows written."""
+    if isinstance(chunks, np.ndarray):
+        chunks = [chunks]
+    ext = os.path.splitext(path)[1].lower()
+    nrows = 0
+    if ext == ".csv":
+        with open(path, "w") as f:
+            fmt = None
+            for chunk in chunks:
+                if fmt is None:
+                    fmt = _csv_format(chunk.dtype)
+                    f.write(",".join(chunk.dtype.names) + "\n")
+                # formatting the rows converted by tolist is faster than np.savetxt
+                for start in range(0, len(chunk), chunk_size):
+                    rows = chunk[start : start + chunk_size].tolist()
+                    f.write("".join(fmt % row + "\n" for row in rows))
+                nrows += len(chunk)
+    elif ext == ".parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        try:
+            for chunk in chunks:
+                table = pa.table({name: chunk[name] for name in chunk.dtype.names})
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+                nrows += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+    else:
+        raise ValueError(f"unknown table format {ext!r} (use .csv or .parquet)")
+    return nrows
@@ -0,0 +1,195 @@
+"""Vibro-compaction: spacing of the columns over layered sand profiles.
+
+Generalises steps 6 and 7 of tutw05/tutw05_e2.py. For each sublayer, the
+relative density needed after the improvement follows from the target
+factor of safety FS_new against liquefaction (CRR_M75 from Figure 2.83,
+read with the NCEER expression) or from a required Dr, whichever is
+larger. With the void ratios e0 (before) and e1 (after), the spacing of
+columns of diameter dc is
+
+    s = Cg dc √((1 + e0) h / ((e0 - e1) h - (1 + e0) S))
+
+with Cg = 0.89 for square and 0.95 for triangular patterns, h the
+improvement depth and S the ground subsidence. In a layered profile the
+subsidence is assumed to be spread uniformly over the improvement depth,
+thus each sublayer needs s_i = Cg dc / √((e0 - e1)/(1 + e0) - S/h) and the
+governing spacing is the minimum over the depth profile. Sublayers that
+reach the target with the subsidence alone do not constrain the spacing
+(s_i = inf); sublayers that cannot reach it (Dr > 100 %) give nan.
+"""
+
+import numpy as np
+
+from .liquefaction import (
+    Dr_from_SPT,
+    calc_CRR_M75,
+    calc_CSR,
+    calc_MSF,
+    calc_N1_60,
+    calc_N1_60_given_N1_60cs,
+    calc_N1_60cs,
+    calc_N1_60cs_given_CRR_M75,
+    calc_overburden,
+    calc_rd,
+)
+
+# fields of the results of evaluate_vibro_layers (depths in m, stresses in
+# kPa, Dr in %; strain is the volumetric strain (e0 - e1)/(1 + e0))
+VIBRO_LAYER_DTYPE = np.dtype(
+    [
+        ("top", float),
+        ("bottom", float),
+        ("sigma_z0", float),
+        ("sigma_z0_eff", float),
+        ("Dr", float),
+        ("FS", float),
+        ("N60_new", float),
+        ("Dr_new", float),
+        ("e0", float),
+        ("e1", float),
+        ("strain", float),
+    ]
+)
+
+# fields of the results of design_vibro_spacing (dc and s in m, volume of
+# the columns in m³; governing is the index of the sublayer that sets s)
+VIBRO_DESIGN_DTYPE = np.dtype(
+    [
+        ("dc", float),
+        ("s", float),
+        ("governing", int),
+        ("n_columns", int),
+        ("volume", float),
+    ]
+)
+
+
+def calc_Cg(triangular_pattern=False):
+    """Returns the pattern coefficient Cg (0.95 triangular, 0.89 square)."""
+    return np.where(triangular_pattern, 0.95, 0.89)[()]
+
+
+def calc_void_ratio_given_Dr(Dr, e_min, e_max):
+    """Calculates the void ratio e = e_max - Dr (e_max - e_min) (Dr in %)."""
+    return e_max - (np.asarray(Dr, dtype=float) / 100.0) * (e_max - e_min)
+
+
+def calc_vibro_spacing(dc, e0, e1, h, S, triangular_pattern=False):
+    """Calculates the spacing of vibro-compaction columns (step 7 of tutw05_e2.py).
+
+    nan if the void ratio change is smaller than the one produced by the
+    subsidence S alone."""
+    aux = (1.0 + e0) * h / ((e0 - e1) * h - (1.0 + e0) * S)
+    with np.errstate(invalid="ignore"):
+        return calc_Cg(triangular_pattern) * dc * np.sqrt(np.where(aux > 0.0, aux, np.nan))
+
+
+def evaluate_vibro_layers(profile, Mw, amax_g, FS_new=1.2, d50=None, CN_max=1.7):
+    """Evaluates the state of each sublayer before and after the improvement.
+
+    profile maps the column names to arrays (as in screen_spt_table), one
+    row per sublayer of a single profile, sorted by depth: depth (bottom of
+    the sublayer [m]), N60, fines [%], gamma_dry and gamma_sat [kN/m³],
+    z_water [m], e_min and e_max, and optionally d50 [mm] (or the argument
+    d50) and Dr_required [%]. The stresses are evaluated at the middle of
+    each sublayer. FS_new may vary with depth (one value per row).
+
+    Returns a structured array (VIBRO_LAYER_DTYPE). Sublayers above the
+    water table only need Dr_required."""
+    bottom = np.asarray(profile["depth"], dtype=float)
+    n = len(bottom)
+    top = np.concatenate([[0.0], bottom[:-1]])
+    if np.any(bottom <= top):
+        raise ValueError("the sublayers must be sorted by depth")
+
+    def column(name, default=None):
+        try:
+            values = profile[name]
+        except (KeyError, ValueError):
+            if default is None:
+                raise
+            values = default
+        return np.broadcast_to(np.asarray(values, dtype=float), (n,))
+
+    N60, fines, z_water = column("N60"), column("fines"), column("z_water")
+    d50 = column("d50") if d50 is None else np.broadcast_to(np.asarray(d50, dtype=float), (n,))
+    Dr_required = column("Dr_required", 0.0)
+
+    # stresses at the middle and at the bottom of each sublayer (interleaved,
+    # so that calc_overburden splits each half at the water table)
+    middle = 0.5 * (top + bottom)
+    depths = np.stack([middle, bottom], axis=1).ravel()
+    sigma_z0, sigma_z0_eff = calc_overburden(
+        np.zeros(2 * n, dtype=int),
+        depths,
+        np.repeat(column("gamma_dry"), 2),
+        np.repeat(column("gamma_sat"), 2),
+        np.repeat(z_water, 2),
+    )
+    sigma_z0, sigma_z0_eff = sigma_z0[::2], sigma_z0_eff[::2]
+
+    # current state
+    N1_60 = calc_N1_60(N60, sigma_z0_eff, CN_max)
+    MSF = calc_MSF(Mw)
+    CSR = calc_CSR(sigma_z0, sigma_z0_eff, amax_g, calc_rd(middle))
+    saturated = middle > z_water
+    with np.errstate(divide="ignore", invalid="ignore"):
+        FS = np.where(saturated, MSF * calc_CRR_M75(calc_N1_60cs(N1_60, fines)) / CSR, np.inf)
+
+    # N60 after the improvement: CRR_M75 = FS_new CSR / MSF (Figure 2.83)
+    N1_60cs_new = calc_N1_60cs_given_CRR_M75(FS_new * CSR / MSF)
+    N1_60_new = calc_N1_60_given_N1_60cs(N1_60cs_new, fines)
+    N60_new = np.where(saturated, N1_60_new / np.minimum(np.sqrt(100.0 / sigma_z0_eff), CN_max), 0.0)
+
+    res = np.empty(n, dtype=VIBRO_LAYER_DTYPE)
+    res["top"], res["bottom"] = top, bottom
+    res["sigma_z0"], res["sigma_z0_eff"] = sigma_z0, sigma_z0_eff
+    res["Dr"] = Dr_from_SPT(d50, N60, sigma_z0_eff)
+    res["FS"] = FS
+    res["N60_new"] = np.maximum(N60_new, N60)
+    res["Dr_new"] = np.maximum(Dr_from_SPT(d50, res["N60_new"], sigma_z0_eff), Dr_required)
+    res["Dr_new"] = np.maximum(res["Dr_new"], res["Dr"])
+    e_min, e_max = column("e_min"), column("e_max")
+    res["e0"] = calc_void_ratio_given_Dr(res["Dr"], e_min, e_max)
+    res["e1"] = calc_void_ratio_given_Dr(np.where(res["Dr_new"] > 100.0, np.nan, res["Dr_new"]), e_min, e_max)
+    res["strain"] = (res["e0"] - res["e1"]) / (1.0 + res["e0"])
+    return res
+
+
+def design_vibro_spacing(layers, dc, area, S, triangular_pattern=False, ds=0.1):
+    """Calculates the governing spacing for many column diameters at once.
+
+    layers is the result of evaluate_vibro_layers, dc a sequence of column
+    diameters [m], area the treated area [m²] and S the ground subsidence
+    [m]. The spacing is rounded down to a multiple of ds (None: no
+    rounding). The columns reach the bottom of the last sublayer.
+
+    Returns a structured array (VIBRO_DESIGN_DTYPE), one row per diameter,
+    sorted by the number of columns (then by diameter). Since s is
+    proportional to dc, the number of columns falls as 1/dc² while the
+    volume of columns is nearly the same for all diameters; the choice
+    among them is left to the cost per column. s = inf means that no
+    columns are needed (first rows); designs with nan spacing (a sublayer
+    cannot reach the target) come last."""
+    dc = np.asarray(dc, dtype=float).ravel()
+    h = layers["bottom"][-1]
+    Cg = calc_Cg(triangular_pattern)
+
+    # spacing of each diameter (rows) and sublayer (columns)
+    need = layers["strain"] - S / h
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s_layer = Cg * dc[:, None] / np.sqrt(np.where(need > 0.0, need, 0.0))
+    s_layer = np.where(np.isnan(need), np.nan, s_layer)
+    governing = np.argmin(np.where(np.isnan(s_layer), -np.inf, s_layer), axis=1)
+    s = s_layer[np.arange(len(dc)), governing]
+    if ds is not None:
+        s = np.where(np.isfinite(s), np.floor(s / ds + 1e-9) * ds, s)
+
+    res = np.empty(len(dc), dtype=VIBRO_DESIGN_DTYPE)
+    res["dc"], res["s"], res["governing"] = dc, s, governing
+    # s = inf: no columns needed; s = nan (or 0 after rounding): not feasible
+    feasible = s > 0.0
+    cell = np.where(triangular_pattern, np.sqrt(3.0) / 2.0, 1.0) * np.where(feasible, s, 1.0) ** 2
+    res["n_columns"] = np.where(feasible, np.ceil(area / cell), 0)
+    res["volume"] = np.where(feasible, res["n_columns"] * np.pi * dc ** 2 / 4.0 * h, np.nan)
+    return res[np.lexsort((dc, np.where(feasible, res["n_columns"], np.inf)))]
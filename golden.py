@@ -0,0 +1,190 @@
+"""Checks the outputs of the tutorial scripts against the reference files.
+
+Each reference file tutwXX/output_*.txt is matched to its script, which is
+run in this process (with stdout captured, the matplotlib backend Agg and
+a temporary working directory for the plots). Both outputs are parsed into
+fields: the lines "name = value unit" are keyed by their section (e.g.
+"7. Total primary settlement | S_total") and the other lines are compared
+as text. The numbers of each field are compared with the relative
+tolerance rtol (per field, see TOLERANCES) plus one unit in the last
+printed digit of the reference, so that a value rounded to the other side
+is not reported; the text around the numbers (units) must be equal.
+
+The wall time of each script is compared with a stored baseline, saved with
+--save-baseline (a JSON file with the time of each script).
+
+Usage: python3 golden.py [--repeat N] [--baseline FILE] [--save-baseline] [outputs ...]
+"""
+
+import argparse
+import contextlib
+import fnmatch
+import glob
+import io
+import json
+import os
+import re
+import runpy
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# default relative tolerance
+RTOL = 1e-9
+
+# relative tolerances per field: "output file::section | name" (fnmatch patterns)
+TOLERANCES = {
+    # times rounded up to whole days may move by one day
+    "tutw10/output_tutw10.txt::* | t?wait": 0.01,
+    "tutw10/output_tutw10.txt::* | time for 99% consolidation": 0.01,
+}
+
+NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+SECTION = re.compile(r"^\d+\.?\s+\S")
+
+
+def find_outputs():
+    """Returns the reference files (tutw*/output_*.txt), sorted."""
+    return sorted(glob.glob(os.path.join(ROOT, "tutw*", "output_*.txt")))
+
+
+def find_script(output):
+    """Returns the script of a reference file: output_X.txt -> X.py, or the only script in its directory."""
+    folder = os.path.dirname(output)
+    name = os.path.basename(output)[len("output_") : -len(".txt")]
+    script = os.path.join(folder, name + ".py")
+    if os.path.exists(script):
+        return script
+    scripts = glob.glob(os.path.join(folder, "*.py"))
+    if len(scripts) != 1:
+        raise FileNotFoundError(f"cannot find the script of {output}")
+    return scripts[0]
+
+
+def parse_fields(text):
+    """Returns {key: (numbers, template)}, with the numbers of each line replaced by {} in the template."""
+    fields = {}
+    section = ""
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if "=" in line:
+            name, value = (s.strip() for s in line.split("=", 1))
+            key = f"{section} | {name}"
+        elif SECTION.match(line):
+            section, key, value = line, None, None
+        else:
+            key, value = f"{section} | text", line
+        if key is None:
+            continue
+        # repeated keys are numbered
+        base, i = key, 1
+        while key in fields:
+            i += 1
+            key = f"{base} [{i}]"
+        numbers = NUMBER.findall(value)
+        fields[key] = (numbers, NUMBER.sub("{}", value))
+    return fields
+
+
+def last_digit(number):
+    """Returns one unit in the last printed digit of a number, e.g. 0.01 for "1.27"."""
+    mantissa, _, exponent = number.lower().partition("e")
+    decimals = len(mantissa.split(".")[1]) if "." in mantissa else 0
+    return 10.0 ** (int(exponent or 0) - decimals)
+
+
+def compare(name, expected, actual):
+    """Compares the fields of two outputs; returns a list of messages (empty if they match)."""
+    messages = []
+    ref, new = parse_fields(expected), parse_fields(actual)
+    for key in ref.keys() - new.keys():
+        messages.append(f"missing: {key}")
+    for key in new.keys() - ref.keys():
+        messages.append(f"extra: {key}")
+    for key in ref.keys() & new.keys():
+        (a, ta), (b, tb) = ref[key], new[key]
+        if ta != tb or len(a) != len(b):
+            messages.append(f"{key}: expected {ta.format(*a)!r}, got {tb.format(*b)!r}")
+            continue
+        rtol = next((tol for pattern, tol in TOLERANCES.items() if fnmatch.fnmatchcase(f"{name}::{key}", pattern)), RTOL)
+        for x, y in zip(a, b):
+            fx, fy = float(x), float(y)
+            if abs(fy - fx) > rtol * abs(fx) + last_digit(x) * (1.0 + 1e-9):
+                messages.append(f"{key}: expected {x}, got {y} (rtol = {rtol:g})")
+    return sorted(messages)
+
+
+def run_in_process(script):
+    """Runs a script in this process; returns its output and wall time [s]."""
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    buffer = io.StringIO()
+    cwd = os.getcwd()
+    argv = sys.argv
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        sys.argv = [script]
+        try:
+            with contextlib.redirect_stdout(buffer):
+                t0 = time.perf_counter()
+                runpy.run_path(script, run_name="__main__")
+                elapsed = time.perf_counter() - t0
+        finally:
+            os.chdir(cwd)
+            sys.argv = argv
+            if "matplotlib.pyplot" in sys.modules:
+                sys.modules["matplotlib.pyplot"].close("all")
+    return buffer.getvalue(), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Checks the outputs of the tutorial scripts.")
+    parser.add_argument("outputs", nargs="*", help="reference files (default: tutw*/output_*.txt)")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per script (the best time is reported)")
+    parser.add_argument("--baseline", default=os.path.join(ROOT, "golden_baseline.json"), help="file with the baseline times")
+    parser.add_argument("--save-baseline", action="store_true", help="save the times as the new baseline")
+    args = parser.parse_args()
+
+    outputs = [os.path.abspath(s) for s in args.outputs] or find_outputs()
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    times, nfailed = {}, 0
+    for output in outputs:
+        name = os.path.relpath(output, ROOT)
+        script = find_script(output)
+        key = os.path.relpath(script, ROOT)
+        try:
+            runs = [run_in_process(script) for _ in range(max(1, args.repeat))]
+            with open(output, encoding="utf-8") as f:
+                messages = compare(name, f.read(), runs[-1][0])
+            times[key] = min(t for _, t in runs)
+        except Exception as e:
+            messages = [f"error: {type(e).__name__}: {e}"]
+        nfailed += bool(messages)
+
+        timing = ""
+        if key in times:
+            timing = f"{times[key]:8.3f} s"
+            if key in baseline:
+                timing += f" (baseline {baseline[key]:.3f} s, {100.0 * (times[key] / baseline[key] - 1.0):+.0f} %)"
+        print(f"{'ok' if not messages else 'FAIL':<4} {name:<30} {timing}")
+        for message in messages:
+            print(f"     {message}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(dict(sorted({**baseline, **times}.items())), f, indent=2)
+            f.write("\n")
+        print(f"baseline saved to {os.path.relpath(args.baseline, ROOT)}")
+    print(f"\n{len(outputs)} outputs, {nfailed} failed")
+    return 1 if nfailed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,4 @@
 #!/bin/bash
 
-set -e
-
-files=`find . -iname "*.py"`
-
-for file in $files; do
-    echo
-    echo
-    echo "=== $file ================================="
-    python3 $file
-done
+# runs all tutorial scripts in parallel; see runall.py for the options
+exec python3 "$(dirname "$0")/runall.py" "$@"
@@ -0,0 +1,99 @@
+"""Runs the tutorial scripts in parallel and prints a timing report.
+
+Each script runs in its own interpreter (from the root of the repository)
+with the non-interactive matplotlib backend Agg, thus plt.show() does not
+block. The output of each script is printed after all of them finish,
+followed by a table with the exit status, wall time and peak memory (RSS)
+of each script. A failing script does not stop the others; the exit code
+is 1 if any script fails.
+
+Usage: python3 runall.py [-j JOBS] [-q] [--timeout SECONDS] [scripts ...]
+"""
+
+import argparse
+import glob
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def find_scripts():
+    """Returns the tutorial scripts (tutw*/*.py), sorted."""
+    return sorted(glob.glob(os.path.join(ROOT, "tutw*", "*.py")))
+
+
+def run_script(path, timeout=None):
+    """Runs one script; returns (exit code, output, wall time [s], peak RSS [MB])."""
+    env = dict(os.environ, MPLBACKEND="Agg")
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, os.path.relpath(path, ROOT)],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    # the output is read directly (stderr goes to the same pipe) and the child
+    # is reaped with wait4, which also returns its resource usage
+    expired = threading.Event()
+
+    def kill():
+        expired.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, kill) if timeout else None
+    if timer:
+        timer.start()
+    output = proc.stdout.read()
+    proc.stdout.close()
+    _, status, usage = os.wait4(proc.pid, 0)
+    if timer:
+        timer.cancel()
+    code = os.waitstatus_to_exitcode(status)
+    if expired.is_set():
+        output += f"\ntimeout after {timeout} s\n".encode()
+    rss = usage.ru_maxrss / (1024.0 * 1024.0 if sys.platform == "darwin" else 1024.0)
+    proc.returncode = code
+    return code, output.decode(errors="replace"), time.perf_counter() - t0, rss
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Runs the tutorial scripts in parallel.")
+    parser.add_argument("scripts", nargs="*", help="scripts to run (default: tutw*/*.py)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="number of parallel scripts")
+    parser.add_argument("-q", "--quiet", action="store_true", help="only print the output of failing scripts")
+    parser.add_argument("--timeout", type=float, default=None, help="time limit per script [s]")
+    args = parser.parse_args()
+
+    scripts = [os.path.abspath(s) for s in args.scripts] or find_scripts()
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max(1, args.jobs)) as pool:
+        results = list(pool.map(lambda path: run_script(path, args.timeout), scripts))
+    elapsed = time.perf_counter() - t0
+
+    # output of each script
+    for path, (code, output, _, _) in zip(scripts, results):
+        if args.quiet and code == 0:
+            continue
+        print(f"\n\n=== {os.path.relpath(path, ROOT)} =================================")
+        print(output, end="")
+
+    # summary
+    width = max(len(os.path.relpath(path, ROOT)) for path in scripts)
+    print(f"\n\n{'script':<{width}}  {'status':>8}  {'time [s]':>8}  {'RSS [MB]':>8}")
+    for path, (code, _, wall, rss) in zip(scripts, results):
+        status = "ok" if code == 0 else f"FAIL {code}"
+        print(f"{os.path.relpath(path, ROOT):<{width}}  {status:>8}  {wall:8.2f}  {rss:8.1f}")
+    nfailed = sum(code != 0 for code, _, _, _ in results)
+    total = sum(wall for _, _, wall, _ in results)
+    print(f"\n{len(scripts)} scripts, {nfailed} failed; wall time {elapsed:.2f} s (sum of scripts {total:.2f} s)")
+    return 1 if nfailed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
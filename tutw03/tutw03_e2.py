@@ -1,36 +1,14 @@
+import os
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 
-# 1
-def consolid_calc_Tv_given_Uv(Uv):
-    """Calculates Tv, given Uv, using the approximation formula."""
-    if Uv <= 0.526:
-        return (np.pi / 4.0) * Uv ** 2
-    else:
-        return -0.085 - 0.933 * np.log10(1.0 - Uv)
-
-
-# 2
-def consolid_calc_Uv_given_Tv(Tv):
-    """Calculate Uv, given Tv, using the approximation formula."""
-    if Tv <= 0.217:
-        return 2.0 * np.sqrt(Tv / np.pi)
-    else:
-        a = (1.781 - Tv) / 0.933
-        return 1.0 - (10.0 ** a) / 100.0
-
-
-# 3
-def consolid_calc_Uv_given_Tv_series(Tv, nseries=100):
-    """Calculate Uv @ time Tv, using the (truncated) Fourier series.
-    nseries is the number of terms in the series [optional]"""
-    sumx = 0.0
-    for m in range(nseries):
-        M = (2.0 * m + 1.0) * np.pi / 2.0
-        MM = M ** 2.0
-        sumx += 2.0 * np.exp(-MM * Tv) / MM
-    return 1.0 - sumx
-
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from geotech.consolidation import (
+    consolid_calc_Tv_given_Uv,
+    consolid_calc_Uv_given_Tv,
+    consolid_calc_Uv_given_Tv_series,
+)
 
 # generate 100 Tv-values from 0 to 1.1 as in Figure 7.8, page 216
 Tv_sequence = np.linspace(0, 1.1, 100)
@@ -38,13 +16,11 @@ Tv_sequence = np.linspace(0, 1.1, 100)
 # generate 100 Uv-values from 0 to 0.95 as in Figure 7.8, page 216
 Uv_sequence = np.linspace(0, 0.95, 100)
 
-# because Tv_sequence and Uv_sequence are arrays and the functions
-# above contain if-else conditional statements,
-# we have to vectorize these functions when passing arrays
-# as arguments to them.
-calc_Tv_given_Uv = np.vectorize(consolid_calc_Tv_given_Uv)
-calc_Uv_given_Tv = np.vectorize(consolid_calc_Uv_given_Tv)
-calc_Uv_given_Tv_series = np.vectorize(consolid_calc_Uv_given_Tv_series)
+# the functions in geotech.consolidation accept arrays directly,
+# thus there is no need to wrap them with np.vectorize
+calc_Tv_given_Uv = consolid_calc_Tv_given_Uv
+calc_Uv_given_Tv = consolid_calc_Uv_given_Tv
+calc_Uv_given_Tv_series = consolid_calc_Uv_given_Tv_series
 
 # digitized data from Figure 7.8, page 216
 digitized_data = np.array(
@@ -1,12 +1,8 @@
-import numpy as np
+import os
+import sys
 
-
-def consolid_calc_Tv_given_Uv(Uv):
-    """Calculates Tv, given Uv, using the approximation formula."""
-    if Uv <= 0.526:
-        return (np.pi / 4.0) * Uv ** 2
-    else:
-        return -0.085 - 0.933 * np.log10(1.0 - Uv)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from geotech.consolidation import consolid_calc_Tv_given_Uv
 
 
 # input data
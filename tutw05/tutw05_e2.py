@@ -1,5 +1,10 @@
+import os
+import sys
 import numpy as np
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from geotech.liquefaction import Dr_from_SPT  # Equation 2.33
+
 '''
 KNOWN
   * Uniform medium sand with 5% fine content
@@ -18,14 +23,6 @@ REQUIRED
   * Eliminate liquefaction potential
 '''
 
-# 0 Define Equation 2.33 #################################################
-
-def Dr_from_SPT(d50, n60, s0eff):
-    aux1 = (0.23 + 0.06 / d50) ** 1.7
-    aux2 = (100.0 / s0eff) ** 0.5
-    dr = ( (n60 * aux1 / 9.0) * aux2 ) ** 0.5
-    return dr * 100.0 # %
-
 # 1 Estimate soil data ###################################################
 
 # assume unit weights of sand (below and above water table)
@@ -1,5 +1,10 @@
+import os
+import sys
 import numpy as np
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from geotech.columns import calc_area_repl_ratio
+
 '''
 * 20 m thick soft clay
 * undrained strength of 20 kPa
@@ -18,11 +23,6 @@ pi = np.pi # 3.14159...
 sr2 = np.sqrt(2.0)
 sr3 = np.sqrt(3.0)
 
-# function to compute the area replacement ratio
-def calc_area_repl_ratio(dc, s, triangular_pattern = False):
-    C = pi / (2.0 * sr3) if triangular_pattern else pi / 4.0
-    return C * (dc / s) ** 2.0
-
 # 1. Collect soft clay data ##############################################
 
 # undrained strength and unit weights
@@ -1,5 +1,12 @@
+import os
+import sys
 import numpy as np
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from geotech.columns import calc_area_repl_ratio
+from geotech.consolidation import consolid_calc_Uv_given_Tv
+from geotech.radial import calc_Ur_given_Tr
+
 '''
 INPUT
   40 m wideand 1.8 m high embankment (fill)
@@ -33,25 +40,6 @@ sr2 = np.sqrt(2.0)
 sr3 = np.sqrt(3.0)
 seconds_per_day = 24.0 * 60.0 * 60.0
 
-# function to compute the area replacement ratio
-def calc_area_repl_ratio(dc, s, triangular_pattern = False):
-    C = pi / (2.0 * sr3) if triangular_pattern else pi / 4.0
-    return C * (dc / s) ** 2.0
-
-# function to approximate the average degree of vertical consolidation (Terzaghi)
-def consolid_calc_Uv_given_Tv(Tv):
-    if Tv <= 0.217:
-        return 2.0 * np.sqrt(Tv / np.pi)
-    else:
-        a = (1.781 - Tv) / 0.933
-        return 1.0 - (10.0 ** a) / 100.0
-
-# function to approximate the degree of consolidation due to radial flow (Barron)
-def consolid_calc_Ur_given_Tr(Tr, Nd):
-    aux = Nd ** 2.0
-    Fnd = np.log(Nd) * aux / (aux - 1.0) - (3.0*aux - 1.0) / (4.0*aux)
-    return 1.0 - np.exp(-8.0 * Tr / Fnd)
-
 # 1. Collect fill data #########################################################
 
 # height of embankment and unit weight of embankment
@@ -218,7 +206,7 @@ print(f'Trm = {Trm:.3f}')
 Uvm = consolid_calc_Uv_given_Tv(Tvm)
 
 # degree of consolidation due to the radial flow according to Barron's solution (Urm)
-Urm = consolid_calc_Ur_given_Tr(Trm, Nd)
+Urm = calc_Ur_given_Tr(Trm, Nd)
 
 # degree of consolidation due to combined vertical and radial flow (Uvr)
 Uvr = 1.0 - (1.0 - Uvm) * (1.0 - Urm)
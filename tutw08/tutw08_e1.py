@@ -1,46 +1,13 @@
+import os
+import sys
 import numpy as np
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from geotech.anchors import anchor_unbonded_length, print_unbonded_length
+
 # some constants
 pi = np.pi # 3.14159...
 
-# function to calculate the unbonded length
-def anchor_unbonded_length(d, H, chi, theta, psi, strand = False):
-
-    # minimum overburden depth
-    z_min = 4.5 # m
-
-    # minimum unbonded length
-    Lub_min = 4.5 if strand else 3.0 # m
-
-    # trial horizontal distance of bonded-length-tip
-    x_trial = (H - d + chi / np.cos(psi)) / (np.tan(theta) + np.tan(psi))
-
-    # minimum horizontal distance of bonded-length-tip
-    if d < z_min:
-        x_min = (z_min - d) / np.tan(theta)
-    else:
-        x_min = x_trial
-
-    # final horizontal distance of bonded-length-tip
-    x = np.max([x_trial, x_min])
-
-    # trial unbonded length
-    Lub_trial = x / np.cos(theta)
-
-    # final unbonded length
-    Lub = np.max([Lub_trial, Lub_min])
-
-    # message
-    print(f'x (trial)   = {x_trial:.1f} m')
-    print(f'x (min)     = {x_min:.1f} m')
-    print(f'x (final)   = {x:.1f} m')
-    print(f'Lub (trial) = {Lub_trial:.1f} m')
-    print(f'Lub (min)   = {Lub_min:.1f} m')
-    print(f'Lub (final) = {Lub:.1f} m')
-
-    # results
-    return Lub
-
 # 1. Collect input data #######################################################
 
 # gather input data
@@ -79,7 +46,9 @@ d1 = 3.0
 
 # unbonded length of anchor # 1
 print(f'\n2. Calculate unbonded length of anchor # 1')
-Lub1 = anchor_unbonded_length(d1, H, chi, theta, psi)
+res1 = anchor_unbonded_length(d1, H, chi, theta, psi)
+print_unbonded_length(res1)
+Lub1 = res1['Lub']
 
 # 3. Calculate unbonded length of anchor # 2 ###################################
 
@@ -89,7 +58,9 @@ d2 = d1 + H2
 
 # unbonded length of anchor # 2
 print(f'\n3. Calculate unbonded length of anchor # 2')
-Lub2 = anchor_unbonded_length(d2, H, chi, theta, psi)
+res2 = anchor_unbonded_length(d2, H, chi, theta, psi)
+print_unbonded_length(res2)
+Lub2 = res2['Lub']
 
 # 4. Calculate the maximum lateral earth pressure ##############################
 
@@ -1,6 +1,10 @@
+import os
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
-import scipy.optimize as opt
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from geotech.pvd import calc_tau_given_Uvr
 
 # 0. Set up some constants #########################################################################
 
@@ -148,13 +152,9 @@ def calc_Ur(tau):
 def calc_Uvr(Uv, Ur):
     return 1.0 - (1.0 - Uv) * (1.0 - Ur)
 
-# Define a function to calculate the residual from Uvr and the fixed 80% value
-def calc_resid_one(tau):
-    Uvr_fixed = 0.8
-    Uv = calc_Uv(tau)
-    Ur = calc_Ur(tau)
-    return Uvr_fixed - 1.0 + (1.0-Uv) * (1.0-Ur)
-calc_resid_vector = np.vectorize(calc_resid_one)
+# Define a function to calculate tau such that the degree of consolidation reaches Uvr
+def calc_tau(Uvr):
+    return calc_tau_given_Uvr(Uvr, bv, br, Fm)
 
 # message
 print(f'\n5. Functions')
@@ -250,8 +250,7 @@ print(f'S  due to load 1 @ t1fin = {S_t1fin:.2f} m')
 # 10. Consolidation settlement at the end of the waiting period (Stage 1) ##########################
 
 # Find tau such that 80% consolidation (Uvr = 0.8) has occurred
-tau1_tlong = tau1_t1fin + 365 * secs_per_day
-tau1_t1wait = opt.brentq(calc_resid_vector, tau1_t1fin, tau1_tlong)
+tau1_t1wait = calc_tau(0.8)
 
 # Compute time t from the the time-shift tau
 t1wait_calc = tau1_t1wait + dt1 # secs
@@ -445,13 +444,7 @@ print(f'S   of stage 1 and 2 @ t2wait = {S_t2wait:.2f} m')
 S_rem = S_total - S_t2wait
 
 # Find t corresponding to 99% consolidation (Uvr = 0.99)
-def res99(t):
-    Uvr_fixed = 0.99
-    Uv = calc_Uv(t)
-    Ur = calc_Ur(t)
-    return Uvr_fixed - 1.0 + (1.0-Uv) * (1.0-Ur)
-tverylong = 10000 * secs_per_day
-t99 = opt.brentq(res99, 0, tverylong)
+t99 = calc_tau(0.99)
 t99_days = np.ceil(t99 / secs_per_day)
 
 # Compute the settlement due to traffic loading